@@ -130,6 +130,8 @@ cdef class SymBufReader:
 #                  >95% of files.  lxml is used only for CDATA / namespaces.
 #   SI cache     — SI blocks are cached by file offset in _si_cache so that
 #                  shared sources (e.g., CAN bus) are read only once.
+#   TX/MD cache  — unit and description texts are cached by file offset in
+#                  _tx_cache; channels sharing a block share the str object.
 #
 # Design constraints:
 #   • CC val/ref for cc_type 3/7-11 (formula, text-table, tab conversions)
@@ -277,7 +279,25 @@ cdef str _fast_read_tx(int fd, uint64_t pointer):
     return result
 
 
-cdef str _fast_read_tx_or_md(int fd, uint64_t pointer):
+cdef str _fast_read_tx_or_md(int fd, uint64_t pointer, dict tx_cache):
+    """Read a TX or MD block through *tx_cache* and return its text content.
+
+    *tx_cache* maps the block file offset to the text already extracted, so
+    blocks shared by many channels (units, descriptions) are read and parsed
+    once.  Pass ``None`` to disable caching.
+    """
+    cdef str result
+    if tx_cache is not None:
+        result = tx_cache.get(pointer)
+        if result is not None:
+            return result
+    result = _read_tx_or_md(fd, pointer)
+    if tx_cache is not None:
+        tx_cache[pointer] = result
+    return result
+
+
+cdef str _read_tx_or_md(int fd, uint64_t pointer):
     """Read a TX or MD block and return its text content.
 
     TX blocks
@@ -396,7 +416,8 @@ cdef dict _fast_read_si(int fd, uint64_t pointer):
 
 
 def read_cn_chain_fast(object fid, uint64_t first_pointer,
-                       dict si_cache, int minimal, bint channel_name_list):
+                       dict si_cache, int minimal, bint channel_name_list,
+                       dict tx_cache=None):
     """Read the CN linked list starting at first_pointer using pread().
 
     Parameters
@@ -410,6 +431,9 @@ def read_cn_chain_fast(object fid, uint64_t first_pointer,
         0 = load all metadata; non-zero = skip SI and XML comment
     channel_name_list : bool
         True = read only channel names (skip CC/SI/unit/comment)
+    tx_cache : dict, optional
+        Shared unit/description text cache keyed by TX/MD block file offset;
+        updated in-place
 
     Returns
     -------
@@ -513,7 +537,7 @@ def read_cn_chain_fast(object fid, uint64_t first_pointer,
         # ── Read unit (TX or MD block) ─────────────────────────────────────────
         if not channel_name_list:
             if cn_hdr.cn_md_unit:
-                unit_str = _fast_read_tx_or_md(fd, cn_hdr.cn_md_unit)
+                unit_str = _fast_read_tx_or_md(fd, cn_hdr.cn_md_unit, tx_cache)
                 if unit_str:
                     cn_dict['unit'] = unit_str
                 elif cn_dat.cn_sync_type == 1:
@@ -531,7 +555,7 @@ def read_cn_chain_fast(object fid, uint64_t first_pointer,
 
             # ── Read description (MD/TX block) ─────────────────────────────────
             if cn_hdr.cn_md_comment:
-                desc_str = _fast_read_tx_or_md(fd, cn_hdr.cn_md_comment)
+                desc_str = _fast_read_tx_or_md(fd, cn_hdr.cn_md_comment, tx_cache)
                 if desc_str:
                     cn_dict['Comment'] = {'description': desc_str}
 
@@ -16,9 +16,11 @@ Installation instructions :
 from veusz.plugins import *
 from veusz.plugins.datasetplugin import Dataset1D as ImportDataset1D
 from veusz.plugins.field import FieldFloat as ImportFieldFloat
+from veusz.plugins.field import FieldInt as ImportFieldInt
 try:
     from mdfreader import Mdf
     from mdfreader import MdfInfo
+    from mdfreader.mdfreader import decimate
 except ImportError:
     try:
         from veusz.plugins.mdfreader import mdf
@@ -31,6 +33,7 @@ except ImportError:
         print(os.path.join(os.getcwdu(), 'plugins'))
         from mdfreader import Mdf
         from mdfreader import MdfInfo
+        from mdfreader.mdfreader import decimate
 
 
 class ImportPlugin(MdfInfo):
@@ -107,7 +110,8 @@ class MdfImportPlugin(ImportPlugin, Mdf):
 
     def __init__(self):
         ImportPlugin.__init__(self)
-        self.fields = [ImportFieldFloat("mult", descr="Sampling", default=0.1)]
+        self.fields = [ImportFieldFloat("mult", descr="Sampling", default=0.1),
+                       ImportFieldInt("points", descr="Points per channel (0 for all samples)", default=0)]
 
     def doImport(self, params):
         """Actually import data
@@ -121,7 +125,15 @@ class MdfImportPlugin(ImportPlugin, Mdf):
         for channelName in list(data.keys()):
             if len(data[channelName]['data']) > 0 and not data[channelName]['data'].dtype.kind in ['S', 'U']:
                 # print( data[channelName]['data'].dtype )
-                List.append(ImportDataset1D(channelName, data[channelName]['data']))
+                if params.field_results['points'] > 0:
+                    # min/max decimation, each channel gets its own master dataset
+                    master_data, channel_data = decimate(data.get_channel_data(data.get_channel_master(channelName)),
+                                                         data[channelName]['data'],
+                                                         params.field_results['points'] // 2)
+                    List.append(ImportDataset1D(channelName, channel_data))
+                    List.append(ImportDataset1D(channelName + '_master', master_data))
+                else:
+                    List.append(ImportDataset1D(channelName, data[channelName]['data']))
         return List
 
 importpluginregistry.append(MdfImportPlugin())
@@ -18,9 +18,16 @@ __copyright__ = 'Copyright (c) 2017 Aymeric Rateau'
 __license__ = 'GPLV3'
 __version__ = "4.3"
 
-from .mdfreader import Mdf, MdfInfo
+from .mdfreader import Mdf, MdfInfo, concat_files
+from .mdfdataset import MdfDataset
+from .mdfcatalog import MdfCatalog
+from .mdf4reader import Mdf4Writer
 
 __all__ = [
     'Mdf',
-    'MdfInfo'
+    'MdfInfo',
+    'concat_files',
+    'MdfDataset',
+    'MdfCatalog',
+    'Mdf4Writer'
             ]
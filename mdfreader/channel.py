@@ -25,7 +25,10 @@ CAN_open_offset = {'ms': 0, 'days': 4, 'minute': 2, 'hour': 3, 'day': 4, 'month'
 
 class Channel4(object):
     __slots__ = ['channelNumber', 'channelGroup', 'dataGroup',
-                 'type', 'name', 'VLSD_CG_Flag', 'nBytes_aligned', 'byteOffset', 'pos_bit_beg']
+                 'type', 'name', 'VLSD_CG_Flag', 'nBytes_aligned', 'byteOffset', 'pos_bit_beg',
+                 'signalDataType', 'bitCount', 'bitOffset', 'channelType', 'syncType',
+                 'posByteBeg', 'nBytes_not_aligned', 'dataFormat', 'nativeDataFormat',
+                 'arrayNDim', 'invalidBitPos']
     """ channel class gathers all about channel structure in a record
 
     Attributes
@@ -48,6 +51,16 @@ class Channel4(object):
     byteOffset : int
         byte offset in record
     bit_masking_needed : boolean
+    signalDataType, bitCount, bitOffset, channelType, syncType : int
+        compiled values of corresponding methods, see compile_descriptor()
+    posByteBeg, nBytes_not_aligned : int
+        compiled channel position in record and number of not aligned bytes
+    dataFormat, nativeDataFormat : str
+        compiled numpy data format with and without endian
+    arrayNDim : int
+        number of dimensions of channel array, 0 if not an array
+    invalidBitPos : int or None
+        invalid bit position, None if channel has no invalid bit
 
 
     Methods
@@ -65,6 +78,8 @@ class Channel4(object):
         CANOpen channel initialisation
     set_invalid_bytes(info, data_group, channel_group, record_id_size, byte_aligned)
         Invalid Bytes channel initialisation
+    compile_descriptor(info)
+        stores in slots channel values derived from info used by readers
     rec_attribute_name : str
         Name of channel compatible with python attribute name conventions
     unit : str, default empty string
@@ -170,6 +185,17 @@ class Channel4(object):
         self.nBytes_aligned = 0
         self.byteOffset = 0
         self.pos_bit_beg = 0
+        self.signalDataType = None
+        self.bitCount = None
+        self.bitOffset = None
+        self.channelType = None
+        self.syncType = None
+        self.posByteBeg = None
+        self.nBytes_not_aligned = None
+        self.dataFormat = None
+        self.nativeDataFormat = None
+        self.arrayNDim = 0
+        self.invalidBitPos = None
 
     def __str__(self):
         """ channel object attributes print
@@ -865,6 +891,36 @@ class Channel4(object):
         self.byteOffset = self.calc_byte_offset(info)
         self.pos_bit_beg = self.pos_bit_begin(info)
 
+    def compile_descriptor(self, info):
+        """ computes once values derived from info and stores them in slots
+
+        Readers and conversion use these attributes instead of walking info dicts
+        for each call. Should be called after set(), set_CANOpen() or set_invalid_bytes()
+
+        Parameters
+        ------------
+        info : mdfinfo4.info4 class
+            info4 class containing all MDF Blocks
+        """
+        self.signalDataType = self.signal_data_type(info)
+        self.bitCount = self.bit_count(info)
+        self.bitOffset = self.bit_offset(info)
+        self.channelType = self.channel_type(info)
+        self.syncType = self.channel_sync_type(info)
+        self.posByteBeg = self.pos_byte_beg(info)
+        self.nBytes_not_aligned = self.calc_bytes(info, aligned=False)
+        if self.type in (1, 2):  # channel array
+            self.arrayNDim = self.ca_block(info)['ca_ndim']
+        if self.type == 4:  # invalid bytes channel
+            self.invalidBitPos = None
+        elif self.has_invalid_bit(info):
+            self.invalidBitPos = self.invalid_bit(info)
+        if self.type == 4 or not self.cn_block(info).get('cn_flags', 0) & 0x20000:
+            # data stream channels are not part of fixed record, no record format
+            endian, native_data_format = self.numpy_format(info)
+            self.dataFormat = ''.join([endian, native_data_format])
+            self.nativeDataFormat = native_data_format
+
     def invalid_bit(self, info):
         """ extracts from info4 the channels valid bits positions
 
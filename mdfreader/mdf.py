@@ -25,6 +25,7 @@ from itertools import chain
 from random import choice
 from string import ascii_letters
 from collections import OrderedDict, defaultdict
+from collections.abc import MutableMapping
 from time import time
 from warnings import warn
 from numpy import array_repr, set_printoptions, recarray, frombuffer
@@ -57,7 +58,7 @@ class MdfSkeleton(dict):
     __slots__ = ['masterChannelList', 'fileName', 'MDFVersionNumber', 'multiProc',
                  'convertAfterRead', 'filterChannelNames', 'fileMetadata', 'convertTables',
                  '_pandasframe', 'info', '_compression_level', '_noDataLoading',
-                 'fid', 'zipfile']
+                 'fid', 'zipfile', '_string_pool']
     """ MdfSkeleton class
 
     Attributes
@@ -78,6 +79,8 @@ class MdfSkeleton(dict):
         flag to filter long channel names from its module names separated by '.'
     fileMetadata : dict
         file metadata with minimum keys : author, organisation, project, subject, comment, time, date
+    _string_pool : _StringPool or None
+        strings shared by channels when compact metadata is activated
 
     Methods
     ------------
@@ -89,6 +92,8 @@ class MdfSkeleton(dict):
          renames a channel and returns its content
     copy()
         copy a mdf class
+    compact_metadata()
+        converts channel dicts into slot based records sharing interned strings
     add_metadata(author, organisation, project, subject, comment, date, time)
         adds basic metadata from file
     """
@@ -96,7 +101,8 @@ class MdfSkeleton(dict):
     def __init__(self, file_name=None, channel_list=None, convert_after_read=True,
                  filter_channel_names=False, no_data_loading=False,
                  compression=False, convert_tables=True, metadata=2,
-                 finalization_writing_to_file=False, force_file_integrity_check=False):
+                 finalization_writing_to_file=False, force_file_integrity_check=False,
+                 compact_metadata=False, cut=None):
         """ mdf_skeleton class constructor.
 
         Parameters
@@ -140,6 +146,14 @@ class MdfSkeleton(dict):
             Perform block sizes check for potentially corrupted file without finalization
             flags (id_unfin_flags==0). Combined with finalization_writing_to_file is
             very experimental and risky, correction should be tried in memory first.
+
+        compact_metadata : bool, optional, False by default
+            Stores channels as slot based records with interned unit, description
+            and master strings instead of dicts. Recommended for files with
+            tens of thousands of channels, reduces memory and iteration time.
+
+        cut : tuple (master_channel, begin, end), optional
+            reads only data between begin and end values of master_channel.
         """
         self.masterChannelList = OrderedDict()
         # flag to control multiprocessing, default deactivate,
@@ -161,6 +175,7 @@ class MdfSkeleton(dict):
         self.info = None
         self._compression_level = 9  # default compression level
         self._noDataLoading = False  # in case reading with this argument activated
+        self._string_pool = _StringPool() if compact_metadata else None
         # clears class from previous reading and avoid to mess up
         self.clear()
         self.fileName = file_name
@@ -172,7 +187,10 @@ class MdfSkeleton(dict):
                       compression=compression,
                       metadata=metadata,
                       finalization_writing_to_file=finalization_writing_to_file,
-                      force_file_integrity_check=force_file_integrity_check)
+                      force_file_integrity_check=force_file_integrity_check,
+                      cut=cut)
+            if compact_metadata:  # channels not created by add_channel (no_data_loading)
+                self.compact_metadata()
 
     def add_channel(self, channel_name, data, master_channel, master_type=1, unit='', description='', conversion=None,
                     info=None, compression=False, identifier=None):
@@ -205,7 +223,10 @@ class MdfSkeleton(dict):
             (group name, group source, group path)
         """
         if not self._noDataLoading:
-            self[channel_name] = {}
+            if self._string_pool is not None:
+                self[channel_name] = CompactChannel(self._string_pool)
+            else:
+                self[channel_name] = {}
             if master_channel not in self.masterChannelList:
                 self.masterChannelList[master_channel] = []
             self.masterChannelList[master_channel].append(channel_name)
@@ -686,10 +707,26 @@ class MdfSkeleton(dict):
         yop.MDFVersionNumber = self.MDFVersionNumber
         yop.filterChannelNames = self.filterChannelNames
         yop.convertTables = self.convertTables
+        yop._string_pool = self._string_pool
         for channel in self:
             yop[channel] = self[channel]
         return yop
 
+    def compact_metadata(self):
+        """converts channel dicts into compact channel records
+
+        Units, descriptions and master names are interned in a string pool
+        shared by all channels, other fields are kept in slots.
+        Dict-like access to channels is unchanged.
+        """
+        if self._string_pool is None:
+            self._string_pool = _StringPool()
+        for channel_name in self:
+            channel = dict.__getitem__(self, channel_name)
+            if not isinstance(channel, CompactChannel):
+                dict.__setitem__(self, channel_name,
+                                 CompactChannel(self._string_pool, channel))
+
 
 def _open_mdf(file_name):
     """ Opens mdf, make a few checks and returns fid
@@ -824,7 +861,7 @@ def _sanitize_identifier(name):
 
 
 class CompressedData:
-    __slots__ = ['data', 'dtype']
+    __slots__ = ['data', 'dtype', 'start', 'stop']
     """ class to represent compressed data by blosc
     """
 
@@ -837,9 +874,15 @@ class CompressedData:
             compressed data
         dtype : numpy dtype object
             numpy array dtype
+        start : int or None
+            index of first sample kept from compressed data
+        stop : int or None
+            index after last sample kept from compressed data
         """
         self.data = None
         self.dtype = None
+        self.start = None
+        self.stop = None
 
     def compression(self, a):
         """ data compression method
@@ -859,9 +902,169 @@ class CompressedData:
         -------------
         uncompressed numpy array
         """
-        return frombuffer(decompress(self.data), dtype=self.dtype)
+        data = frombuffer(decompress(self.data), dtype=self.dtype)
+        if self.start is not None:
+            data = data[self.start:self.stop]
+        return data
+
+    def cut(self, start, stop):
+        """ cuts data without decompressing it
+
+        Parameters
+        -------------
+        start : int
+            index of first sample to keep
+        stop : int
+            index after last sample to keep
+
+        Returns
+        -------------
+        CompressedData sharing the same compressed data, the cut being
+        applied at decompression
+        """
+        temp = CompressedData()
+        temp.data = self.data
+        temp.dtype = self.dtype
+        offset = self.start or 0
+        temp.start = offset + start
+        temp.stop = offset + stop
+        if self.stop is not None:
+            temp.stop = min(temp.stop, self.stop)
+        return temp
 
     def __str__(self):
         """ prints compressed_data object content
         """
         return self.decompression()
+
+
+class _StringPool(object):
+    __slots__ = ['_codes', 'strings']
+    """ interning table shared by compact channel records
+
+    Units, descriptions and master names are heavily repeated in measurement
+    files (a few dozens of distinct units for tens of thousands of channels),
+    each distinct string is stored once and records only keep its integer code.
+    """
+
+    def __init__(self):
+        self._codes = dict()
+        self.strings = list()
+
+    def intern(self, string):
+        """ returns integer code of string, adding it to pool if needed
+
+        Parameters
+        -------------
+        string : str
+            string to be interned
+
+        Returns
+        -------------
+        int code of string in pool
+        """
+        try:
+            return self._codes[string]
+        except KeyError:
+            code = len(self.strings)
+            self._codes[string] = code
+            self.strings.append(string)
+            return code
+
+    def __len__(self):
+        return len(self.strings)
+
+
+class CompactChannel(MutableMapping):
+    __slots__ = ['_pool', 'data', '_unit', '_description', '_master',
+                 'masterType', 'conversion', 'id', 'axis', '_extra']
+    """ slot based channel record behaving like the usual channel dict
+
+    Units, descriptions and master names are stored as integer codes of a
+    string pool shared by all channels of a Mdf instance. Other uncommon keys
+    (attachment, invalid bit, etc.) are kept in a small dict created on demand.
+    """
+
+    _slot_fields = {dataField: 'data', masterTypeField: 'masterType',
+                    conversionField: 'conversion', idField: 'id', 'axis': 'axis'}
+    _pooled_fields = {unitField: '_unit', descriptionField: '_description',
+                      masterField: '_master'}
+
+    def __init__(self, pool, channel=None):
+        """ compact channel constructor
+
+        Parameters
+        -------------
+        pool : _StringPool
+            string pool shared between channels
+        channel : dict, optional
+            channel dict to be converted
+        """
+        self._pool = pool
+        self._extra = None
+        if channel is not None:
+            for field in channel:
+                self[field] = channel[field]
+
+    def __getitem__(self, field):
+        try:
+            if field in self._pooled_fields:
+                return self._pool.strings[getattr(self, self._pooled_fields[field])]
+            elif field in self._slot_fields:
+                return getattr(self, self._slot_fields[field])
+        except AttributeError:
+            pass
+        if self._extra is not None and field in self._extra:
+            return self._extra[field]
+        raise KeyError(field)
+
+    def __setitem__(self, field, value):
+        if field in self._pooled_fields:
+            if isinstance(value, dict):  # mdf4 unit from comment block
+                value = value.get('Comment', '')
+            if isinstance(value, str):
+                setattr(self, self._pooled_fields[field], self._pool.intern(value))
+                if self._extra is not None:
+                    self._extra.pop(field, None)
+                return
+            # not interned, removes previous code
+            try:
+                delattr(self, self._pooled_fields[field])
+            except AttributeError:
+                pass
+        elif field in self._slot_fields:
+            setattr(self, self._slot_fields[field], value)
+            return
+        if self._extra is None:
+            self._extra = dict()
+        self._extra[field] = value
+
+    def __delitem__(self, field):
+        try:
+            if field in self._pooled_fields:
+                delattr(self, self._pooled_fields[field])
+                return
+            elif field in self._slot_fields:
+                delattr(self, self._slot_fields[field])
+                return
+        except AttributeError:
+            pass
+        if self._extra is not None and field in self._extra:
+            del self._extra[field]
+        else:
+            raise KeyError(field)
+
+    def __iter__(self):
+        for fields in (self._pooled_fields, self._slot_fields):
+            for field, slot in fields.items():
+                if hasattr(self, slot):
+                    yield field
+        if self._extra is not None:
+            for field in self._extra:
+                yield field
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(dict(self))
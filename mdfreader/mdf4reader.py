@@ -25,6 +25,8 @@ from io import open
 from os.path import splitext
 from multiprocessing import Queue, Process
 from sys import byteorder
+from time import time
+from bisect import bisect_right
 import re
 from collections import defaultdict, OrderedDict
 import numpy as np
@@ -34,7 +36,7 @@ else:
     from numpy.core.records import fromstring, fromarrays
 from numpy import array, recarray, asarray, empty, where, frombuffer, reshape
 from numpy import arange, right_shift, bitwise_and, bitwise_or, all, diff, interp, zeros, concatenate, maximum
-from numpy import issubdtype, number as numpy_number
+from numpy import issubdtype, number as numpy_number, add, fmin, fmax, rint, float64
 from numpy import max as npmax, min as npmin
 from numpy.lib.recfunctions import rename_fields
 from numpy.ma import MaskedArray
@@ -42,7 +44,8 @@ from zlib import decompress
 from warnings import simplefilter, warn
 from .mdfinfo4 import Info4, IDBlock, HDBlock, DGBlock, \
     CGBlock, CNBlock, FHBlock, CommentBlock, _load_header, DLBlock, \
-    DZBlock, HLBlock, CCBlock, DTBlock, CABlock, DVBlock, LDBlock
+    DZBlock, HLBlock, CCBlock, DTBlock, CABlock, DVBlock, LDBlock, SRBlock, RDBlock, \
+    _calculate_block_start, _HeaderStruct, _HLStruct
 from .mdf import MdfSkeleton, _open_mdf, invalidChannel, dataField, \
     conversionField, idField, invalidPosField, CompressedData
 from .channel import Channel4
@@ -65,6 +68,13 @@ _SD_BLOCK_IDS = frozenset((b'##SD', '##SD'))
 _DZ_BLOCK_IDS = frozenset((b'##DZ', '##DZ'))
 _DI_BLOCK_IDS = frozenset((b'##DI', '##DI'))
 _DT_RD_DV_BLOCK_IDS = frozenset((b'##DT', b'##DV', b'##RD', '##DT', '##RD', '##DV'))
+# cn_data_type of little endian numeric numpy kinds
+_MDF4_NUMERIC_DATA_TYPES = {'u': 0, 'b': 0, 'i': 2, 'f': 4, 'c': 15}
+# number of records reduced in first sample reduction level, doubled for each next level
+_SR_FIRST_INTERVAL = 64
+# id_unfi_flags of file being written by Mdf4Writer: cycle counters (bit 0),
+# length of last DT block (bit 2) and last DL block (bit 4) to be checked
+_WRITER_UNFINALIZED_FLAGS = 1 | 1 << 2 | 1 << 4
 
 
 def _data_block(record, info, parent_block, channel_set=None, n_records=None, sorted_flag=True, vlsd=None):
@@ -163,11 +173,11 @@ def _apply_unsorted_bit_masking(buf, record, info):
             name = Channel.name
             if name not in buf:
                 continue
-            sig_dt = Channel.signal_data_type(info)
+            sig_dt = Channel.signalDataType
             if sig_dt not in (0, 1, 2, 3):  # only integer types need masking
                 continue
-            bit_count = Channel.bit_count(info)
-            bit_offset = Channel.bit_offset(info)
+            bit_count = Channel.bitCount
+            bit_offset = Channel.bitOffset
             n_bytes_aligned = Channel.nBytes_aligned
             if bit_offset == 0 and bit_count == n_bytes_aligned * 8:
                 continue  # already byte-aligned and fills all bytes — no masking needed
@@ -542,6 +552,322 @@ def _decode_datastream(data_bytes, ds_info, cn_info_map, cn_name_map, n_records)
     return result
 
 
+def _channel_conversion4(conversion):
+    """ conversion dict as kept by add_channel from channel CC block information
+
+    Parameters
+    ----------------
+    conversion : dict
+        CC block information, from Channel4.conversion()
+
+    Returns
+    -----------
+    dict with keys 'type' and 'parameters', or empty conversion
+    """
+    if conversion:
+        return {'type': conversion['cc_type'],
+                'parameters': {key: conversion[key] for key in ('cc_val', 'cc_ref')
+                               if key in conversion}}
+    return conversion
+
+
+def _sample_reduction_levels(records, first_interval=_SR_FIRST_INTERVAL):
+    """ computes mean, minimum and maximum of records over power of two intervals
+
+    Parameters
+    ----------------
+    records : numpy recarray
+        records of a channel group, numeric fields only
+    first_interval : int
+        number of records reduced in first level
+
+    Returns
+    -----------
+    list of (interval, reduced) tuples, interval being a number of records and
+    reduced a (n_intervals, 3) array of records of mean, minimum and maximum values
+
+    Notes
+    --------
+    Only first level reads records, next levels are reduced from previous one
+    """
+    n_records = len(records)
+    starts = arange(0, n_records, first_interval)
+    counts = diff(concatenate((starts, [n_records])))
+    names = records.dtype.names
+    sums = [add.reduceat(records[name], starts, dtype=float64) for name in names]
+    minima = [fmin.reduceat(records[name], starts) for name in names]  # ignores nan
+    maxima = [fmax.reduceat(records[name], starts) for name in names]
+    interval = first_interval
+    levels = []
+    while True:
+        reduced = empty((len(counts), 3), dtype=records.dtype)
+        for index, name in enumerate(names):
+            mean = sums[index] / counts
+            if records.dtype[name].kind in 'biu':
+                mean = rint(mean)
+            reduced[name][:, 0] = mean
+            reduced[name][:, 1] = minima[index]
+            reduced[name][:, 2] = maxima[index]
+        levels.append((interval, reduced))
+        if len(counts) == 1:
+            return levels
+        starts = arange(0, len(counts), 2)
+        counts = add.reduceat(counts, starts)
+        sums = [add.reduceat(values, starts) for values in sums]
+        minima = [fmin.reduceat(values, starts) for values in minima]
+        maxima = [fmax.reduceat(values, starts) for values in maxima]
+        interval *= 2
+
+
+def _write4_sample_reduction(fid, pointer, records):
+    """ writes chain of SR blocks, each followed by its RD block
+
+    Parameters
+    ----------------
+    fid
+        file identifier
+    pointer : int
+        position of first SR block
+    records : numpy recarray
+        records of channel group
+
+    Returns
+    -----------
+    pointer : int
+        position after last RD block
+    """
+    levels = _sample_reduction_levels(records)
+    for level, (interval, reduced) in enumerate(levels):
+        rd = RDBlock()
+        rd.load(3 * records.dtype.itemsize, len(reduced), pointer + 64)
+        sr = SRBlock(None, None)
+        sr['block_start'] = pointer
+        sr['sr_data'] = rd['pointer']
+        sr['sr_sr_next'] = rd['end_position'] if level < len(levels) - 1 else 0
+        sr['sr_cycle_count'] = len(reduced)
+        sr['sr_interval'] = float(interval)
+        sr['sr_sync_type'] = 4  # index, interval is a number of records
+        sr.write(fid)
+        pointer = rd.write(fid, reduced.tobytes())
+    return pointer
+
+
+def _write4_header(fid, file_metadata, column_oriented=False, unfinalized_flags=0):
+    """Writes ID, HD and FH blocks with their comments
+
+    Parameters
+    ----------------
+    fid
+        file identifier
+    file_metadata : dict
+        file metadata with keys author, organisation, project, subject, comment and time
+    column_oriented : bool
+        flag to write version 4.20 for column oriented storage, 4.11 otherwise
+    unfinalized_flags : int
+        id_unfi_flags of ID block, file being written
+
+    Returns
+    -----------
+    pointer : int
+        position of first DG block
+    """
+    # IDBLock writing
+    temp = IDBlock()
+    temp['id_unfi_flags'] = unfinalized_flags
+    if column_oriented:
+        temp['id_vers'] = b'4.20    '
+        temp['id_ver'] = 420
+    else:
+        temp['id_vers'] = b'4.11    '
+        temp['id_ver'] = 411
+    temp.write(fid)
+
+    blocks = OrderedDict()
+    pointer = 64
+    # Header Block
+    blocks['HD'] = HDBlock()
+    blocks['HD']['time'] = file_metadata['time']
+    blocks['HD']['block_start'] = pointer
+    pointer += 104
+
+    # Header Block comments
+    blocks['HD']['MD'] = pointer
+    blocks['HD_comment'] = CommentBlock()
+    blocks['HD_comment']['block_start'] = pointer
+    blocks['HD_comment'].load(file_metadata, 'HD')
+    pointer = blocks['HD_comment']['block_start'] + \
+        blocks['HD_comment']['block_length']
+
+    # file history block
+    blocks['FH'] = FHBlock()
+    blocks['HD']['FH'] = pointer
+    blocks['FH']['block_start'] = pointer
+    pointer = blocks['FH']['block_start'] + 56
+
+    # File History comment
+    blocks['FH']['MD'] = pointer
+    blocks['FH_comment'] = CommentBlock()
+    blocks['FH_comment']['block_start'] = pointer
+    blocks['FH_comment'].load(file_metadata, 'FH')
+    pointer = blocks['FH_comment']['block_start'] + \
+        blocks['FH_comment']['block_length']
+
+    # write DG block
+    blocks['HD']['DG'] = pointer  # first DG
+
+    # write all files header blocks
+    for block in blocks.values():
+        block.write(fid)
+    return pointer
+
+
+def _cut_master_type4(info, channel_name):
+    """ master synchronisation type of data group containing channel
+
+    Parameters
+    ----------------
+    info : class
+        contains blocks, at least CN blocks read (minimal <= 1)
+    channel_name : str
+        channel name used to cut data
+
+    Returns
+    -----------
+    int cn_sync_type of master channel, None if channel or master not found
+    or if channel groups are sharing masters (column oriented)
+    """
+    for dg in info['CG']:
+        for cg in info['CG'][dg]:
+            if info['CG'][dg][cg].get('cg_cg_master'):
+                return None  # master not in same data group, whole data has to be read
+    for dg in info['DG']:
+        if channel_name in info['ChannelNamesByDG'][dg]:
+            for cg in info['CN'][dg]:
+                channels = info['CN'][dg][cg]
+                if any(channels[cn]['name'] == channel_name for cn in channels):
+                    for cn in channels:
+                        if channels[cn]['cn_type'] in (2, 3):  # master channel
+                            return channels[cn]['cn_sync_type']
+            return None
+    return None
+
+
+def _cut_record_range4(buf, info, cut, master_type):
+    """ range of records to be read for data group within cut
+
+    Parameters
+    ----------------
+    buf : Data class
+        data group with only one channel group
+    info : class
+        contains blocks
+    cut : tuple
+        (master_channel, begin, end) as given to read4()
+    master_type : int
+        master synchronisation type of cut channel
+
+    Returns
+    -----------
+    (start, stop) indexes of records, None if data group has to be fully read
+    """
+    record = buf[next(iter(buf))]['record']
+    if record.VLSD or record.VLSC or record.DS or record.CANOpen or \
+            info['DG'][record.dataGroup]['data_block_header']['id'] in (b'##LD', '##LD'):
+        return None  # variable length or separated invalid data
+    master = None
+    for channel in record.values():
+        if channel.channelType in (3, 6):
+            return None  # virtual channel data depend on record index
+        if channel.name == record.master:
+            master = channel
+    if master is None or master.syncType != master_type:
+        return None
+    return buf.find_record_range(record, info, master.name,
+                                 _channel_conversion4(master.conversion(info)), cut[1], cut[2])
+
+
+def _read_reduced4(fid, info, data_group, channel_group, channel_numbers, max_points):
+    """ reads mean, minimum and maximum of channels from a sample reduction level
+
+    Parameters
+    ----------------
+    fid : file identifier
+        opened mdf file
+    info : class
+        contains blocks
+    data_group : int
+        data group pointer
+    channel_group : int
+        channel group pointer
+    channel_numbers : list of int
+        numbers of channels in channel group
+    max_points : int
+        maximum number of reduced samples, the finest level not exceeding it is
+        chosen, or the coarsest level if all have more samples
+
+    Returns
+    -----------
+    dict channel name: (master_data, mean, minimum, maximum) tuple of physical values.
+    None if channel group has no usable sample reduction.
+    """
+    sr_blocks = Info4.read_sr_block(fid, info['CG'][data_group][channel_group]['cg_sr_first'])
+    if not sr_blocks or len(info['CG'][data_group]) > 1:
+        return None  # no sample reduction or unsorted data group
+    levels = sorted(sr_blocks.values(), key=lambda sr_block: sr_block['sr_cycle_count'])
+    sr = levels[0]
+    for level in levels:
+        if level['sr_cycle_count'] <= max_points:
+            sr = level
+    record = Record(data_group, channel_group)
+    record.load_info(info)
+    if record.VLSD or record.VLSC or record.DS or record.CANOpen or record.recordIDsize:
+        return None
+    master_number = None
+    for number, channel in record.items():
+        if channel.channelType == 2:  # master channel with data
+            master_number = number
+    numbers = [number for number in channel_numbers if number in record and
+               record[number].channelType not in (3, 6)]
+    if master_number is not None and master_number not in numbers:
+        numbers.append(master_number)
+    # each reduced sample is made of mean, minimum and maximum records then invalid bytes
+    data_bytes = info['CG'][data_group][channel_group]['cg_data_bytes']
+    invalid_bytes = info['CG'][data_group][channel_group]['cg_invalid_bytes']
+    sample_bytes = 3 * data_bytes + (invalid_bytes if sr['sr_flags'] & 1 else 0)
+    buf = Data(fid, sr['sr_data'])
+    length, read_bytes = buf._stream_reader()
+    n_samples = min(sr['sr_cycle_count'], length // sample_bytes)
+    raw = frombuffer(read_bytes(0, n_samples * sample_bytes), dtype='u1')
+    raw = raw.reshape(n_samples, sample_bytes)[:, :3 * data_bytes].reshape(3 * n_samples, data_bytes)
+    if invalid_bytes:  # records with all channels valid
+        raw = concatenate((raw, zeros((3 * n_samples, invalid_bytes), dtype='u1')), axis=1)
+    data = _data_block(record, info, parent_block={'id': b'##DT', 'data': raw.tobytes()},
+                       channel_set={record[number].name for number in numbers},
+                       n_records=3 * n_samples)
+    reduced = {}
+    for number in numbers:
+        name = record[number].name
+        values = data[name].reshape((n_samples, 3) + data[name].shape[1:])  # array channels keep their shape
+        conversion = _channel_conversion4(record[number].conversion(info))
+        statistics = []
+        for column in range(3):
+            if conversion:
+                statistics.append(Mdf4._convert_channel_data4(
+                    {dataField: values[:, column, ...], conversionField: conversion}, name, False)[name])
+            else:
+                statistics.append(values[:, column, ...])
+        mean, minimum, maximum = statistics
+        if minimum.dtype.kind in 'biuf':  # conversion with negative gain swaps extrema
+            minimum, maximum = fmin(minimum, maximum), fmax(minimum, maximum)
+        reduced[name] = [mean, minimum, maximum]
+    if master_number is not None:
+        master_data = reduced[record[master_number].name][0]
+    else:  # first record index of each interval
+        master_data = arange(n_samples) * sr['sr_interval']
+    return {record[number].name: tuple([master_data] + reduced[record[number].name])
+            for number in numbers if number in channel_numbers}
+
+
 class Data(dict):
     __slots__ = ['fid', 'pointer_to_data', 'type']
     """ Data class is organizing record classes itself made of channel class.
@@ -961,6 +1287,242 @@ class Data(dict):
                     data_block['data'] = bytearray()  # flush
         return data
 
+    def iter_chunks(self, record, info, channel_set, chunk_size=chunk_size_reading):
+        """ reads sorted data block chunk by chunk
+
+        Parameters
+        ----------------
+        record : class
+            channel group definition listing record channel classes
+        info : class
+            contains blocks
+        channel_set : set of str
+            set of channel names to read
+        chunk_size : int, optional
+            maximum number of record bytes decoded at once
+
+        Yields
+        --------
+        numpy recarray of raw data, at most chunk_size bytes of records
+
+        Notes
+        --------
+        Only for sorted data groups without VLSD, VLSC or data stream channels,
+        invalid bytes are not read. Besides the chunk, only one decompressed
+        DZ block is kept in memory.
+        """
+        n_bytes = record.CGrecordLength
+        n_chunk = max(1, chunk_size // n_bytes)  # number of records per chunk
+        chunk_bytes = n_chunk * n_bytes
+        remaining = record.numberOfRecords
+        buf = bytearray()
+        for length, read, compressed in self._iter_data_blocks(self.pointer_to_data):
+            if compressed:  # decompressed once
+                pieces = [(0, length)]
+            else:
+                pieces = [(offset, min(chunk_bytes, length - offset))
+                          for offset in range(0, length, chunk_bytes)]
+            for offset, size in pieces:
+                buf.extend(read(offset, size))
+                while len(buf) >= chunk_bytes and remaining > 0:
+                    n_records = min(n_chunk, remaining)
+                    yield record.read_channels_from_bytes(bytes(buf[:n_records * n_bytes]), info,
+                                                          channel_set, n_records)
+                    del buf[:chunk_bytes]
+                    remaining -= n_records
+        n_records = min(len(buf) // n_bytes, remaining)
+        if n_records > 0:
+            yield record.read_channels_from_bytes(bytes(buf[:n_records * n_bytes]), info,
+                                                  channel_set, n_records)
+
+    def find_record_range(self, record, info, master, conversion=None, begin=None, end=None):
+        """ finds records of sorted data group with master channel between begin and end
+
+        Parameters
+        ----------------
+        record : class
+            channel group definition listing record channel classes
+        info : class
+            contains blocks
+        master : str
+            master channel name
+        conversion : dict, optional
+            master channel conversion as kept by add_channel, with keys 'type' and 'parameters'
+        begin : float, optional
+            beginning value of master channel
+        end : float, optional
+            ending value of master channel
+
+        Returns
+        --------
+        (start, stop) : tuple of int
+            indexes of first and after last records, same as searchsorted of
+            master channel data (left side for begin, right side for end)
+
+        Notes
+        --------
+        Master channel is supposed monotonic, records are found by dichotomy
+        reading and converting only one record at a time.
+        """
+        n_bytes = record.CGrecordLength
+        length, read_bytes = self._stream_reader()
+        n_records = min(record.numberOfRecords, length // n_bytes)
+        channel_set = {master}
+
+        def master_value(index):
+            data = record.read_channels_from_bytes(read_bytes(index * n_bytes, n_bytes),
+                                                   info, channel_set, 1)[master]
+            if conversion:
+                data = Mdf4._convert_channel_data4({dataField: data, conversionField: conversion},
+                                                   master, False)[master]
+            return data[0]
+
+        def search(value, side):
+            low, high = 0, n_records
+            while low < high:
+                middle = (low + high) // 2
+                master_middle = master_value(middle)
+                if master_middle < value or (side == 'right' and master_middle == value):
+                    low = middle + 1
+                else:
+                    high = middle
+            return low
+
+        start = 0 if begin is None else search(begin, 'left')
+        stop = n_records if end is None else search(end, 'right')
+        return start, max(start, stop)
+
+    def read_record_range(self, record, info, channel_set, start, stop):
+        """ reads records from start to stop of sorted data group
+
+        Parameters
+        ----------------
+        record : class
+            channel group definition listing record channel classes
+        info : class
+            contains blocks
+        channel_set : set of str
+            set of channel names to read
+        start : int
+            index of first record to read
+        stop : int
+            index after last record to read
+
+        Returns
+        --------
+        numpy recarray of raw data, same as load() for this range only
+
+        Notes
+        --------
+        Only data blocks overlapping the range are read and decompressed.
+        """
+        n_bytes = record.CGrecordLength
+        length, read_bytes = self._stream_reader()
+        stop = max(start, min(stop, length // n_bytes))
+        return _data_block(record, info,
+                           parent_block={'id': b'##DT',
+                                         'data': read_bytes(start * n_bytes, (stop - start) * n_bytes)},
+                           channel_set=channel_set, n_records=stop - start)
+
+    def _stream_reader(self):
+        """ random access to record bytes of data blocks, as if concatenated
+
+        Returns
+        --------
+        (length, read_bytes) : tuple
+            total number of record bytes and function read_bytes(offset, size).
+            Only the last decompressed DZ block is kept in memory.
+        """
+        blocks = []  # (position in stream, length, read, compressed)
+        position = 0
+        for length, read, compressed in self._iter_data_blocks(self.pointer_to_data):
+            blocks.append((position, length, read, compressed))
+            position += length
+        positions = [block[0] for block in blocks]
+        cache = {}
+
+        def read_bytes(offset, size):
+            data = bytearray()
+            index = bisect_right(positions, offset) - 1
+            while size > 0 and 0 <= index < len(blocks):
+                block_position, length, read, compressed = blocks[index]
+                local = offset - block_position
+                piece = min(size, length - local)
+                if compressed:
+                    if cache.get('index') != index:
+                        cache.clear()
+                        cache['index'] = index
+                        cache['data'] = read(0, length)
+                    data.extend(cache['data'][local:local + piece])
+                else:
+                    data.extend(read(local, piece))
+                offset += piece
+                size -= piece
+                index += 1
+            return bytes(data)
+        return position, read_bytes
+
+    def _iter_data_blocks(self, pointer):
+        """ lists data blocks linked from pointer, in file order
+
+        Parameters
+        ----------------
+        pointer : int
+            position of DT, RD, DV, DZ, DL, LD, HL or GD block
+
+        Yields
+        --------
+        (length, read, compressed) : tuple
+            number of record bytes in block, function read(offset, size) returning
+            these bytes and flag set when read decompresses the whole block at each call
+        """
+        header = _load_header(self.fid, pointer)
+        if header is None:
+            return
+        if header['id'] in _DATA_BLOCK_IDS:
+            def read(offset, size, position=pointer + 24):
+                # file position can be moved between two calls
+                self.fid.seek(position + offset)
+                return self.fid.read(size)
+            yield header['length'] - 24, read, False
+        elif header['id'] in _DZ_BLOCK_IDS:
+            temp = DZBlock()
+            temp.read_dz(self.fid)
+
+            def read(offset, size, temp=temp, position=self.fid.tell()):
+                self.fid.seek(position)
+                data = DZBlock.decompress_data_block(self.fid.read(temp['dz_data_length']),
+                                                     temp['dz_zip_type'],
+                                                     temp['dz_zip_parameter'],
+                                                     temp['dz_org_data_length'])
+                return data[offset:offset + size]
+            yield temp['dz_org_data_length'], read, True
+        elif header['id'] in frozenset((b'##DL', b'##LD', '##DL', '##LD')):  # data list block
+            while header is not None:
+                if header['id'] in frozenset((b'##DL', '##DL')):
+                    temp = DLBlock()
+                    temp.read_dl(self.fid, header['link_count'])
+                else:
+                    temp = LDBlock()
+                    temp.read_ld(self.fid, header['link_count'])
+                for data_pointer in temp['list_data'][0]:
+                    for block in self._iter_data_blocks(data_pointer):
+                        yield block
+                header = _load_header(self.fid, temp['next'])
+        elif header['id'] in (b'##HL', '##HL'):  # header list block for DZBlock
+            temp = HLBlock()
+            temp.read_hl(self.fid)
+            for block in self._iter_data_blocks(temp['hl_dl_first']):
+                yield block
+        elif header['id'] in (b'##GD', '##GD'):  # guard block (MDF 4.3)
+            (gd_link,) = structunpack('<q', self.fid.read(8))  # pointer to guarded block
+            (gd_version,) = structunpack('<H', self.fid.read(2))  # minimum MDF version
+            if gd_version <= 430 and gd_link:
+                for block in self._iter_data_blocks(gd_link):
+                    yield block
+        else:
+            raise Exception('unknown data block')
+
 
 class Record(dict):
     __slots__ = ['CGrecordLength', 'recordLength', 'numberOfRecords', 'recordID',
@@ -1138,30 +1700,32 @@ class Record(dict):
                 self.DS.append(channelNumber)
                 channel = Channel4(self.dataGroup, self.channelGroup, channelNumber)
                 channel.set(info)
+                channel.compile_descriptor(info)
                 self[channelNumber] = channel
                 self.channelNames.add(channel.name)
                 continue
             channel = Channel4(
                 self.dataGroup, self.channelGroup, channelNumber)
             channel.set(info)
-            channel_type = channel.channel_type(info)
-            data_format = channel.data_format(info)
+            channel.compile_descriptor(info)
+            channel_type = channel.channelType
+            data_format = channel.dataFormat
             self.master = info['masters'][info['CN'][self.dataGroup]
                                           [self.channelGroup][channelNumber]['masterCG']]['name']
             if channel_type in (0, 2, 4, 5):  # not virtual channel
-                signal_data_type = channel.signal_data_type(info)
+                signal_data_type = channel.signalDataType
                 if signal_data_type == 13:
                     for name in ('ms', 'minute', 'hour', 'day', 'month', 'year'):
                         # new object otherwise only modified
                         channel = Channel4(
                             self.dataGroup, self.channelGroup, channelNumber)
                         channel.set_CANOpen(info, name)
+                        channel.compile_descriptor(info)
                         self[channelNumber] = channel
                         self.channelNames.add(name)
                         self.dataRecordName.append(name)
                         self.recordToChannelMatching[name] = name
-                        self.numpyDataRecordFormat.append(
-                            channel.data_format(info))
+                        self.numpyDataRecordFormat.append(channel.dataFormat)
                     self.recordLength += 7
                     self.CANOpen = 'date'
                     embedding_channel = None
@@ -1170,12 +1734,12 @@ class Record(dict):
                         channel = Channel4(
                             self.dataGroup, self.channelGroup, channelNumber)
                         channel.set_CANOpen(info, name)
+                        channel.compile_descriptor(info)
                         self[channelNumber] = channel
                         self.channelNames.add(name)
                         self.dataRecordName.append(name)
                         self.recordToChannelMatching[name] = name
-                        self.numpyDataRecordFormat.append(
-                            channel.data_format(info))
+                        self.numpyDataRecordFormat.append(channel.dataFormat)
                     self.recordLength += 6
                     self.CANOpen = 'time'
                     embedding_channel = None
@@ -1186,15 +1750,15 @@ class Record(dict):
                     if len(self) > 1:
                         # all channels are already ordered in record based on byte_offset
                         # and bit_offset so just comparing with previous channel
-                        channel_pos_bit_end = channel.pos_bit_end(info)
+                        channel_pos_bit_end = channel.pos_bit_beg + channel.bitCount
                         prev_chan_byte_offset = prev_chan.byteOffset
                         prev_chan_n_bytes = prev_chan.nBytes_aligned
                         prev_chan_includes_curr_chan = channel.pos_bit_beg >= 8 * prev_chan_byte_offset \
                             and channel_pos_bit_end <= 8 * (prev_chan_byte_offset + prev_chan_n_bytes)
                         if embedding_channel is not None:
                             embedding_channel_includes_curr_chan = \
-                                channel_pos_bit_end <= embedding_channel.pos_byte_end(
-                                    info) * 8
+                                channel_pos_bit_end <= \
+                                (embedding_channel.posByteBeg + embedding_channel.nBytes_aligned) * 8
                         else:
                             embedding_channel_includes_curr_chan = False
                         if channel.byteOffset >= prev_chan_byte_offset and \
@@ -1203,7 +1767,8 @@ class Record(dict):
                             # not byte aligned
                             self.byte_aligned = False
                         if embedding_channel is not None and \
-                                channel_pos_bit_end > embedding_channel.pos_byte_end(info) * 8:
+                                channel_pos_bit_end > \
+                                (embedding_channel.posByteBeg + embedding_channel.nBytes_aligned) * 8:
                             embedding_channel = None
                         if prev_chan_includes_curr_chan or \
                                 embedding_channel_includes_curr_chan:  # bit(s) in byte(s)
@@ -1261,6 +1826,7 @@ class Record(dict):
             invalid_bytes = Channel4(
                 self.dataGroup, self.channelGroup, cg_data_bytes)
             invalid_bytes.set_invalid_bytes(info)
+            invalid_bytes.compile_descriptor(info)
             self.invalid_channel = invalid_bytes
             self[cg_data_bytes] = self.invalid_channel
             self.channelNames.add(self.invalid_channel.name)
@@ -1270,8 +1836,7 @@ class Record(dict):
                 # with LDBlock, invalid bytes not in record but in DIBlock
                 self.CGrecordLength += info['CG'][self.dataGroup][self.channelGroup]['cg_invalid_bytes']
                 self.recordLength += info['CG'][self.dataGroup][self.channelGroup]['cg_invalid_bytes']
-                self.numpyDataRecordFormat.append(
-                    self.invalid_channel.data_format(info))
+                self.numpyDataRecordFormat.append(self.invalid_channel.dataFormat)
                 self.dataRecordName.append(self.invalid_channel.name)
 
         # check for hidden bytes or VLSD within at least one channel
@@ -1448,7 +2013,7 @@ class Record(dict):
             if Channel.name in channel_set and not Channel.VLSD_CG_Flag:
                 temp[Channel.name] = \
                     Channel.c_format_structure(info).unpack(
-                        buf[Channel.pos_byte_beg(info):Channel.pos_byte_end(info)])[0]
+                        buf[Channel.posByteBeg:Channel.posByteBeg + Channel.nBytes_aligned])[0]
         return temp  # returns dictionary of channel with its corresponding values
 
     def initialise_recarray(self, info, channel_set, n_records, dtype=None, channels_indexes=None):
@@ -1478,11 +2043,11 @@ class Record(dict):
             names = []
             channels_indexes = []
             for chan in self:
-                if self[chan].name in channel_set and self[chan].channel_type(info) not in (3, 6) \
+                if self[chan].name in channel_set and self[chan].channelType not in (3, 6) \
                         and chan not in self.DS:
                     # not virtual channel, not data stream channel, and part of channelSet
                     channels_indexes.append(chan)
-                    formats.append(self[chan].native_data_format(info))
+                    formats.append(self[chan].nativeDataFormat)
                     names.append(self[chan].name)
             if formats:
                 rec = recarray(n_records, dtype={
@@ -1524,19 +2089,14 @@ class Record(dict):
             if dataRead_available:  # use rather cython compiled code for performance
                 bytes_data = bytes(bit_stream)
                 for chan in channels_indexes:
-                    if self[chan].is_ca_block(info):
-                        ca = self[chan].ca_block(info)
-                        array_flag = ca['ca_ndim']
-                    else:
-                        array_flag = 0
-                    buf[self[chan].name] = \
-                        sorted_data_read(bytes_data, self[chan].bit_count(info),
-                                         self[chan].signal_data_type(info),
-                                         self[chan].native_data_format(info),
+                    channel = self[chan]
+                    buf[channel.name] = \
+                        sorted_data_read(bytes_data, channel.bitCount,
+                                         channel.signalDataType,
+                                         channel.nativeDataFormat,
                                          n_records, self.CGrecordLength,
-                                         self[chan].bit_offset(
-                                             info), self[chan].pos_byte_beg(info),
-                                         self[chan].calc_bytes(info, aligned=False), array_flag)
+                                         channel.bitOffset, channel.posByteBeg,
+                                         channel.nBytes_not_aligned, channel.arrayNDim)
                 return buf
             else:
                 return self.read_channels_from_bytes_fallback(bit_stream, info, channel_set, n_records, dtype)
@@ -1722,7 +2282,7 @@ class Mdf4(MdfSkeleton):
 
     def read4(self, file_name=None, info=None, multi_processed=False, channel_list=None, convert_after_read=True,
               filter_channel_names=False, compression=False, metadata=2, finalization_writing_to_file=False,
-              force_file_integrity_check=False):
+              force_file_integrity_check=False, cut=None):
         """ Reads mdf 4.x file data and stores it in dict
 
         Parameters
@@ -1770,6 +2330,11 @@ class Mdf4(MdfSkeleton):
             flags (id_unfin_flags==0). Combined with finalization_writing_to_file is
             very experimental and risky, correction should be tried in memory first.
 
+        cut : tuple (master_channel, begin, end), optional
+            reads only records of data groups with master channel values between
+            begin and end, see cut(). Only for sorted data groups without VLSD,
+            VLSC, data stream or virtual channels, other data groups are fully read.
+
         """
 
         self.multiProc = multi_processed
@@ -1787,6 +2352,8 @@ class Mdf4(MdfSkeleton):
             minimal = 1  # reads at least CN to populate ChannelNamesByDG
         else:
             channel_set_file = None
+        if cut is not None:
+            minimal = min(minimal, 1)  # cut channel has to be found before reading groups
 
         # Read information block from file
         if info is None:
@@ -1841,6 +2408,10 @@ class Mdf4(MdfSkeleton):
             else:
                 self.add_metadata(time=ttime)
 
+        cut_master_type = None
+        if cut is not None and not self._noDataLoading:
+            cut_master_type = _cut_master_type4(info, cut[0])
+
         data_groups = info['DG']  # parse all data groups
         if self._noDataLoading and channel_list is not None:
             data_groups = [self[channel][idField][0][0]
@@ -1851,7 +2422,8 @@ class Mdf4(MdfSkeleton):
             if not info['DG'][dataGroup]['dg_data'] == 0 and \
                     (channel_set is None or
                      len(channel_set & info['ChannelNamesByDG'][dataGroup]) > 0):  # there is data block and channel in
-                if minimal > 1 and not self._noDataLoading:  # load CG, CN and CC block info
+                if minimal > 1 and not self._noDataLoading and dataGroup not in info['CG']:
+                    # load CG, CN and CC block info, unless already read by file_finalization
                     info.read_cg_blocks(info.fid, dataGroup,
                                         channel_set, minimal=minimal)
                 data_existing_in_data_group = False
@@ -1891,7 +2463,16 @@ class Mdf4(MdfSkeleton):
                         buf = self.info['DG'][dataGroup]['dataClass']
 
                     # reads raw data from data block with DATA and _data_block classes
-                    buf.read(channel_set, info, self.fileName)
+                    record_range = None
+                    if cut_master_type is not None and len(buf) == 1:
+                        record_range = _cut_record_range4(buf, info, cut, cut_master_type)
+                    if record_range is None:
+                        buf.read(channel_set, info, self.fileName)
+                    else:  # reads only records within cut
+                        record_id = next(iter(buf))
+                        buf[record_id]['data'] = buf.read_record_range(buf[record_id]['record'], info,
+                                                                       channel_set, *record_range)
+                        buf[record_id]['invalid_data'] = None
 
                     channel_groups = buf
                     if self._noDataLoading and channel_list is not None:
@@ -1913,7 +2494,7 @@ class Mdf4(MdfSkeleton):
                                 if channel_set is None or chan.name in channel_set:
                                     if not chan.type == 4:  # normal channel
                                         # not virtual channel
-                                        if chan.channel_type(info) not in (3, 6):
+                                        if chan.channelType not in (3, 6):
                                             # in case record is used for several channels
                                             if channel_set is None and not buf[record_id]['record'].hiddenBytes \
                                                     and buf[record_id]['record'].byte_aligned:
@@ -1936,7 +2517,7 @@ class Mdf4(MdfSkeleton):
                                                 buf[record_id]['record'].numberOfRecords)
 
                                         # Process concatenated bits inside uint8
-                                        bit_count = chan.bit_count(info)
+                                        bit_count = chan.bitCount
                                         if buf[record_id]['record'].byte_aligned \
                                                 and not buf[record_id]['record'].hiddenBytes and \
                                                 channel_set is None and\
@@ -1944,12 +2525,10 @@ class Mdf4(MdfSkeleton):
                                                 and temp is not None\
                                                 and temp.dtype.kind not in ('S', 'U'):
                                             # if channel data do not use complete bytes and Ctypes
-                                            signal_data_type = chan.signal_data_type(
-                                                info)
+                                            signal_data_type = chan.signalDataType
                                             # integers
                                             if signal_data_type in (0, 1, 2, 3):
-                                                bit_offset = chan.bit_offset(
-                                                    info)
+                                                bit_offset = chan.bitOffset
                                                 if bit_offset > 0:
                                                     temp = right_shift(
                                                         temp, bit_offset)
@@ -1980,7 +2559,7 @@ class Mdf4(MdfSkeleton):
                                             if temp.ndim > 1 and temp.shape[-1] == 2 \
                                                     and temp.dtype.kind == 'f' \
                                                     and temp.dtype.itemsize == 2:
-                                                signal_data_type = chan.signal_data_type(info)
+                                                signal_data_type = chan.signalDataType
                                                 if signal_data_type == 16:  # BE: byteswap each f2
                                                     temp = temp.byteswap().view(
                                                         temp.dtype.newbyteorder())
@@ -1988,8 +2567,7 @@ class Mdf4(MdfSkeleton):
                                                         + 1j * temp[..., 1].astype('f4'))
                                             # string data decoding
                                             if temp.dtype.kind == 'S':
-                                                signal_data_type = chan.signal_data_type(
-                                                    info)
+                                                signal_data_type = chan.signalDataType
                                                 if signal_data_type == 6:  # string ISO-8859-1 Latin
                                                     encoding = 'latin-1'
                                                 elif signal_data_type == 7:  # UTF-8
@@ -2015,8 +2593,7 @@ class Mdf4(MdfSkeleton):
 
                                             # channel creation
                                             self.add_channel(chan.name, temp, master_channel,
-                                                             master_type=chan.channel_sync_type(
-                                                                 info),
+                                                             master_type=chan.syncType,
                                                              unit=chan.unit(info), description=chan.desc(info),
                                                              conversion=chan.conversion(info), info=chan.cn_block(info),
                                                              compression=compression,
@@ -2024,15 +2601,15 @@ class Mdf4(MdfSkeleton):
                                                                                        chan.channelGroup,
                                                                                        chan.channelNumber))
                                             # sync channel
-                                            if chan.channel_type(info) == 4:
+                                            if chan.channelType == 4:
                                                 # attach stream to be synchronised
                                                 self.set_channel_attachment(
                                                     chan.name, chan.attachment(info.fid, info))
-                                            if chan.has_invalid_bit(info) and \
+                                            if chan.invalidBitPos is not None and \
                                                     not info['DG'][dataGroup]['unique_channel_in_DG']:
                                                 # has invalid bit
                                                 self.set_invalid_bit(
-                                                    chan.name, chan.invalid_bit(info))
+                                                    chan.name, chan.invalidBitPos)
                                                 self.set_invalid_channel(
                                                     chan.name, 'invalid_bytes{}'.format(dataGroup))
                                     else:  # invalid bytes channel
@@ -2229,7 +2806,7 @@ class Mdf4(MdfSkeleton):
                         self.set_channel_data(channelName, L[channelName])
                         self.remove_channel_conversion(channelName)
 
-    def write4(self, file_name=None, compression=False, column_oriented=False):
+    def write4(self, file_name=None, compression=False, column_oriented=False, sample_reduction=False):
         """Writes simple mdf file
 
         Parameters
@@ -2241,10 +2818,15 @@ class Mdf4(MdfSkeleton):
             flag to store data compressed
         column_oriented : bool
             flag to store data in columns, faster reading channel by channel and not jumping in records
+        sample_reduction : bool
+            flag to write a pyramid of sample reduction blocks (mean, minimum and maximum
+            of 64, 128, 256... records) after data of each channel group
 
         Notes
         --------
         All channels will be converted to physical data, so size might be bigger than original file
+        Sample reduction is written for channel groups with only numeric scalar or array channels,
+        not for column oriented files
         """
 
         # Starts first to write ID and header
@@ -2254,52 +2836,7 @@ class Mdf4(MdfSkeleton):
                 split_name[-1] = '.mfx'  # do not resave in compressed file
             file_name = ''.join([split_name[-2], '_New', split_name[-1]])
         fid = open(file_name, 'wb')  # buffering should automatically be set
-        # IDBLock writing
-        temp = IDBlock()
-        if column_oriented:
-            temp['id_vers'] = b'4.20    '
-            temp['id_ver'] = 420
-        else:
-            temp['id_vers'] = b'4.11    '
-            temp['id_ver'] = 411
-        temp.write(fid)
-
-        blocks = OrderedDict()
-        pointer = 64
-        # Header Block
-        blocks['HD'] = HDBlock()
-        blocks['HD']['time'] = self.fileMetadata['time']
-        blocks['HD']['block_start'] = pointer
-        pointer += 104
-
-        # Header Block comments
-        blocks['HD']['MD'] = pointer
-        blocks['HD_comment'] = CommentBlock()
-        blocks['HD_comment']['block_start'] = pointer
-        blocks['HD_comment'].load(self.fileMetadata, 'HD')
-        pointer = blocks['HD_comment']['block_start'] + \
-            blocks['HD_comment']['block_length']
-
-        # file history block
-        blocks['FH'] = FHBlock()
-        blocks['HD']['FH'] = pointer
-        blocks['FH']['block_start'] = pointer
-        pointer = blocks['FH']['block_start'] + 56
-
-        # File History comment
-        blocks['FH']['MD'] = pointer
-        blocks['FH_comment'] = CommentBlock()
-        blocks['FH_comment']['block_start'] = pointer
-        blocks['FH_comment'].load(self.fileMetadata, 'FH')
-        pointer = blocks['FH_comment']['block_start'] + \
-            blocks['FH_comment']['block_length']
-
-        # write DG block
-        blocks['HD']['DG'] = pointer  # first DG
-
-        # write all files header blocks
-        for block in blocks.values():
-            block.write(fid)
+        pointer = self._write4_header(fid, column_oriented)
         if self.masterChannelList:  # some channels exist
             if column_oriented:
                 for dataGroup, masterChannel in enumerate(self.masterChannelList):
@@ -2346,10 +2883,27 @@ class Mdf4(MdfSkeleton):
                 fid.seek(dg['block_start'] + 24)
                 fid.write(pack('Q', 0))  # last DG pointer is null
             else:
-                self._write4_non_column(fid, pointer, compression)
+                self._write4_non_column(fid, pointer, compression, sample_reduction)
         fid.close()
 
-    def _write4_non_column(self, fid, pointer, compression=False):
+    def _write4_header(self, fid, column_oriented=False):
+        """Writes ID, HD and FH blocks with their comments
+
+        Parameters
+        ----------------
+        fid
+            file identifier
+        column_oriented : bool
+            flag to write version 4.20 for column oriented storage, 4.11 otherwise
+
+        Returns
+        -----------
+        pointer : int
+            position of first DG block
+        """
+        return _write4_header(fid, self.fileMetadata, column_oriented)
+
+    def _write4_non_column(self, fid, pointer, compression=False, sample_reduction=False):
         """Writes simple mdf 4.1 file with sorted data
 
         Parameters
@@ -2358,6 +2912,8 @@ class Mdf4(MdfSkeleton):
             file identifier
         compression : bool
             flag to store data compressed
+        sample_reduction : bool
+            flag to write sample reduction blocks
 
         Notes
         --------
@@ -2571,7 +3127,15 @@ class Mdf4(MdfSkeleton):
             if not data_list:
                 pointer = data.write(fid, b'')
             else:
-                pointer = data.write(fid, fromarrays(data_list).tobytes(order='F'))
+                records = fromarrays(data_list)
+                pointer = data.write(fid, records.tobytes(order='F'))
+                if sample_reduction and n_records > _SR_FIRST_INTERVAL and \
+                        all([records.dtype[name].kind in 'biuf' for name in records.dtype.names]):
+                    fid.seek(blocks['CG']['block_start'] + 56)  # cg_sr_first link
+                    fid.write(pack('<Q', pointer))
+                    pointer = _write4_sample_reduction(fid, pointer, records)
+                    fid.seek(dg['block_start'] + 24)  # next DG after sample reduction blocks
+                    fid.write(pack('<Q', pointer))
             if compression:
                 # next DG position is not predictable due to DZ Blocks unknown length
                 fid.seek(dg_start_position + 24)
@@ -2795,6 +3359,162 @@ class Mdf4(MdfSkeleton):
 
         return dg, pointer
 
+    def _write4_stream_group(self, fid, pointer, master_channel, channels, chunks):
+        """Writes a sorted data group which numeric data is given chunk by chunk
+
+        Parameters
+        ----------------
+        fid
+            file identifier
+        pointer : int
+            position of DG block
+        master_channel : str
+            master channel name, one of channels
+        channels : list of str
+            channel names
+        chunks : iterable
+            lists of 1D numeric arrays, one per channel in channels order
+
+        Returns
+        -----------
+        dg : DGBlock or None
+            written DG block, None if chunks is empty
+        pointer : int
+            position after data block
+
+        Notes
+        --------
+        Number of records and channels value range are only known after the
+        last chunk, DT, CG and CN blocks are then written again.
+        """
+        chunks = iter(chunks)
+        chunk = next(chunks, None)
+        if chunk is None:
+            return None, pointer
+        # writes dataGroup Block
+        dg = DGBlock()
+        dg['block_start'] = pointer
+        pointer = dg['block_start'] + 64
+        dg['CG'] = pointer  # First CG link
+        dg['DG'] = 0
+
+        blocks = OrderedDict()  # initialise blocks for this datagroup
+        # write CGBlock
+        blocks['CG'] = CGBlock()
+        blocks['CG']['length'] = 104
+        blocks['CG']['block_start'] = pointer
+        pointer = blocks['CG']['block_start'] + blocks['CG']['length']
+        blocks['CG']['CN'] = pointer  # First CN link
+        blocks['CG']['cg_inval_bytes'] = 0  # no invalidation bytes
+        blocks['CG']['cg_cycle_count'] = 0
+
+        record_byte_offset = 0
+        previous_n_channel = None
+        for n_channel, (channel, data) in enumerate(zip(channels, chunk)):
+            blocks[n_channel] = CNBlock()
+            blocks[n_channel]['cn_byte_offset'] = record_byte_offset
+            record_byte_offset += data.dtype.itemsize
+            blocks[n_channel]['cn_val_range_min'] = 0
+            blocks[n_channel]['cn_val_range_max'] = 0
+            blocks[n_channel]['cn_flags'] = 0
+            if channel != master_channel:
+                blocks[n_channel]['cn_type'] = 0
+                blocks[n_channel]['cn_sync_type'] = 0
+            else:
+                blocks[n_channel]['cn_type'] = 2  # master channel
+                blocks[n_channel]['cn_sync_type'] = self.get_channel_master_type(channel)
+            blocks[n_channel]['cn_data_type'] = _MDF4_NUMERIC_DATA_TYPES[data.dtype.kind]
+            if data.dtype.byteorder == '>' or (data.dtype.byteorder == '=' and byteorder == 'big'):
+                blocks[n_channel]['cn_data_type'] += 1  # big endian, written as is
+            # always byte aligned
+            blocks[n_channel]['cn_bit_offset'] = 0
+            blocks[n_channel]['cn_bit_count'] = data.dtype.itemsize * 8
+            blocks[n_channel]['block_start'] = pointer
+            pointer = blocks[n_channel]['block_start'] + 160
+            blocks[n_channel]['Composition'] = 0
+            blocks[n_channel]['CN'] = 0  # last CN link is null
+            if previous_n_channel is not None:
+                blocks[previous_n_channel]['CN'] = blocks[n_channel]['block_start']
+            previous_n_channel = n_channel
+
+            # write channel name
+            blocks[n_channel]['TX'] = pointer
+            blocks[channel] = CommentBlock()
+            blocks[channel]['block_start'] = pointer
+            blocks[channel].load(channel, 'TX')
+            pointer = blocks[channel]['block_start'] + \
+                blocks[channel]['block_length']
+
+            # write channel unit
+            unit = self.get_channel_unit(channel)
+            if unit is not None and len(unit) > 0:
+                blocks[n_channel]['Unit'] = pointer
+                unit_name = u'{}{}{}'.format(channel, '_U_', n_channel)
+                blocks[unit_name] = CommentBlock()
+                blocks[unit_name]['block_start'] = pointer
+                blocks[unit_name].load(unit, 'TX')
+                pointer = blocks[unit_name]['block_start'] + \
+                    blocks[unit_name]['block_length']
+            else:
+                blocks[n_channel]['Unit'] = 0
+
+            # write channel description
+            desc = self.get_channel_desc(channel)
+            if desc is not None and len(desc) > 0:
+                blocks[n_channel]['Comment'] = pointer
+                desc_name = '{}{}{}'.format(channel, '_C_', n_channel)
+                blocks[desc_name] = CommentBlock()
+                blocks[desc_name]['block_start'] = pointer
+                blocks[desc_name].load(desc, 'TX')
+                pointer = blocks[desc_name]['block_start'] + \
+                    blocks[desc_name]['block_length']
+            else:
+                blocks[n_channel]['Comment'] = 0
+        # writes size of record in CG
+        blocks['CG']['cg_data_bytes'] = record_byte_offset
+
+        # data pointer in data group
+        dg['data'] = pointer
+        data = DTBlock()
+        data.load(record_byte_offset, 0, pointer)
+        dg.write(fid)  # write DG block
+        # writes all blocks (CG, CN, TX for unit and description) before writing data block
+        for block in blocks.values():
+            block.write(fid)
+        data.write(fid, b'')
+
+        n_records = 0
+        while chunk is not None:
+            if len(chunk[0]):
+                fid.write(fromarrays(chunk).tobytes())
+                for n_channel, channel_data in enumerate(chunk):
+                    if n_records:
+                        blocks[n_channel]['cn_val_range_min'] = min(blocks[n_channel]['cn_val_range_min'],
+                                                                    npmin(channel_data))
+                        blocks[n_channel]['cn_val_range_max'] = max(blocks[n_channel]['cn_val_range_max'],
+                                                                    npmax(channel_data))
+                    else:
+                        blocks[n_channel]['cn_val_range_min'] = npmin(channel_data)
+                        blocks[n_channel]['cn_val_range_max'] = npmax(channel_data)
+                n_records += len(chunk[0])
+            chunk = next(chunks, None)
+
+        # rewrites blocks depending of number of records
+        data.load(record_byte_offset, n_records, data['pointer'])
+        data.write(fid, b'')
+        blocks['CG']['cg_cycle_count'] = n_records
+        fid.seek(blocks['CG']['block_start'])
+        blocks['CG'].write(fid)
+        for n_channel in range(len(channels)):
+            if n_records:
+                # only Bit 3: Limit range valid flag
+                blocks[n_channel]['cn_flags'] = 8
+            fid.seek(blocks[n_channel]['block_start'])
+            blocks[n_channel].write(fid)
+        dg['DG'] = data['end_position']
+        dg.write(fid)
+        return dg, data['end_position']
+
     def apply_invalid_bit(self, channel_name):
         """Mask data of channel based on its invalid bit definition if there is
 
@@ -2867,6 +3587,306 @@ class Mdf4(MdfSkeleton):
         return output
 
 
+class Mdf4Writer(object):
+    __slots__ = ['fileName', 'fid', 'compression', 'fileMetadata', 'listLength', '_groups',
+                 '_pointer', '_last_dg']
+    """ writes mdf 4.11 file incrementally, records being appended as they arrive
+
+    Attributes
+    --------------
+    fileName : str
+        file name
+    fid
+        file identifier
+    compression : bool
+        data blocks are compressed (DZ blocks referenced by HL block)
+    fileMetadata : dict
+        file metadata with keys author, organisation, project, subject, comment and time
+    listLength : int
+        number of data blocks referenced by each DL block
+
+    Methods
+    ------------
+    add_group(dtype, master=None, master_type=1, units=None, descriptions=None)
+        declares a channel group, returns its index
+    append(group, arrays)
+        writes records in a new data block of channel group
+    close()
+        finalises file
+
+    Notes
+    --------
+    Each append() writes a DT or DZ block at end of file, adds it to DL blocks of
+    its data group and updates cycle count. File stays flagged unfinalised (id_unfi_flags)
+    until close(), so that an interrupted file can be read and repaired with
+    file_finalization when read.
+
+    Examples
+    --------------
+    >>> import numpy as np
+    >>> from mdfreader import Mdf4Writer
+    >>> with Mdf4Writer('log.mf4') as writer:
+    ...     group = writer.add_group(np.dtype([('t', '<f8'), ('speed', '<f4')]), master='t',
+    ...                              units={'t': 's', 'speed': 'km/h'})
+    ...     writer.append(group, {'t': t, 'speed': speed})
+    """
+
+    def __init__(self, file_name, compression=False, file_metadata=None, list_length=1024):
+        """ creates file and writes its header blocks
+
+        Parameters
+        ----------------
+        file_name : str
+            file name
+        compression : bool, optional
+            compresses data blocks
+        file_metadata : dict, optional
+            file metadata with keys author, organisation, project, subject, comment and time
+        list_length : int, optional
+            number of data blocks referenced by each DL block
+        """
+        self.fileName = file_name
+        self.compression = compression
+        self.listLength = list_length
+        self.fileMetadata = {'author': '', 'organisation': '', 'project': '', 'subject': '',
+                             'comment': '', 'time': time()}
+        if file_metadata is not None:
+            self.fileMetadata.update(file_metadata)
+        self._groups = []
+        self._last_dg = None
+        self.fid = open(file_name, 'w+b')
+        self._pointer = _write4_header(self.fid, self.fileMetadata, unfinalized_flags=_WRITER_UNFINALIZED_FLAGS)
+        self.fid.seek(64 + 24)  # HD first DG link, no data group yet
+        self.fid.write(pack('<Q', 0))
+        self.fid.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add_group(self, dtype, master=None, master_type=1, units=None, descriptions=None):
+        """ declares a channel group and writes its DG, CG and CN blocks
+
+        Parameters
+        ----------------
+        dtype : numpy dtype
+            structured dtype of records, one field per channel. Numeric, bytes
+            and fixed shape array fields are supported
+        master : str, optional
+            name of master channel field
+        master_type : int, optional
+            master channel type, 1 time (default), 2 angle, 3 distance, 4 index
+        units : dict, optional
+            channel name: unit
+        descriptions : dict, optional
+            channel name: description
+
+        Returns
+        -----------
+        int index of channel group, to be used with append()
+        """
+        dtype = np.dtype(dtype)
+        units = units or {}
+        descriptions = descriptions or {}
+        pointer = self._pointer
+        dg = DGBlock()
+        dg['block_start'] = pointer
+        dg['DG'] = 0
+        dg['data'] = 0  # no data block yet
+        pointer += 64
+        dg['CG'] = pointer
+        blocks = OrderedDict()
+        blocks['CG'] = CGBlock()
+        blocks['CG']['length'] = 104
+        blocks['CG']['block_start'] = pointer
+        blocks['CG']['cg_cycle_count'] = 0
+        blocks['CG']['cg_data_bytes'] = dtype.itemsize
+        blocks['CG']['cg_inval_bytes'] = 0
+        pointer += 104
+        blocks['CG']['CN'] = pointer
+        previous_channel = None
+        for channel in dtype.names:
+            field_dtype, byte_offset = dtype.fields[channel][:2]
+            base = field_dtype.base
+            if base.kind in _MDF4_NUMERIC_DATA_TYPES:
+                data_type = _MDF4_NUMERIC_DATA_TYPES[base.kind]
+                if base.byteorder == '>' or (base.byteorder == '=' and byteorder == 'big'):
+                    data_type += 1  # big endian
+            elif base.kind == 'S':
+                data_type = 6
+            elif base.kind == 'V':
+                data_type = 10  # bytes
+            else:
+                raise Exception('Not recognized dtype {} of channel {}'.format(base, channel))
+            cn = CNBlock()
+            cn['block_start'] = pointer
+            cn['CN'] = 0
+            cn['cn_byte_offset'] = byte_offset
+            cn['cn_bit_offset'] = 0
+            cn['cn_bit_count'] = base.itemsize * 8
+            cn['cn_data_type'] = data_type
+            cn['cn_flags'] = 0  # value range set at close
+            cn['cn_val_range_min'] = 0
+            cn['cn_val_range_max'] = 0
+            if channel == master:
+                cn['cn_type'] = 2  # master channel
+                cn['cn_sync_type'] = master_type
+            else:
+                cn['cn_type'] = 0
+                cn['cn_sync_type'] = 0
+            if previous_channel is not None:
+                previous_channel['CN'] = pointer
+            previous_channel = cn
+            blocks[channel] = cn
+            pointer += 160
+            if field_dtype.shape:  # arrays handling
+                cn['Composition'] = pointer
+                ca = CABlock()
+                ca['ndim'] = len(field_dtype.shape)
+                ca['ndim_size'] = field_dtype.shape
+                ca.load(base.itemsize)
+                blocks[channel + '_CA'] = ca
+                pointer += ca['block_length']
+            else:
+                cn['Composition'] = 0
+            for link, name, text in (('TX', channel + '_TX', channel),
+                                     ('Unit', channel + '_U', units.get(channel)),
+                                     ('Comment', channel + '_C', descriptions.get(channel))):
+                if text:
+                    cn[link] = pointer
+                    blocks[name] = CommentBlock()
+                    blocks[name].load(text, 'TX')
+                    pointer += blocks[name]['block_length']
+                else:
+                    cn[link] = 0
+        dg.write(self.fid)
+        for block in blocks.values():
+            block.write(self.fid)
+        self._pointer = _calculate_block_start(pointer)
+        # links data group into file
+        self.fid.seek(self._last_dg['block_start'] + 24 if self._last_dg is not None else 64 + 24)
+        self.fid.write(pack('<Q', dg['block_start']))
+        self._last_dg = dg
+        self._groups.append({'dg': dg['block_start'], 'cg': blocks['CG']['block_start'], 'dtype': dtype,
+                             'cn': [(channel, blocks[channel]['block_start']) for channel in dtype.names],
+                             'cycle_count': 0, 'data_bytes': 0, 'dl': None, 'ranges': {}})
+        self.fid.flush()
+        return len(self._groups) - 1
+
+    def append(self, group, arrays):
+        """ writes records in a new data block of channel group
+
+        Parameters
+        ----------------
+        group : int
+            channel group index returned by add_group()
+        arrays : numpy structured array, dict or sequence of numpy arrays
+            records with group channel names as fields in any order, or channel name: data,
+            or data in dtype fields order
+        """
+        state = self._groups[group]
+        dtype = state['dtype']
+        if isinstance(arrays, dict) or (isinstance(arrays, np.ndarray) and arrays.dtype.names is not None):
+            # fields mapped by name, not by position
+            records = fromarrays([arrays[channel] for channel in dtype.names], dtype=dtype)
+        else:
+            records = fromarrays(list(arrays), dtype=dtype)
+        if not len(records):
+            return
+        data = records.tobytes()
+        pointer = self._pointer
+        end = None
+        if self.compression:
+            block = DZBlock()
+            block['block_start'] = pointer
+            block['dz_org_block_type'] = b'DT'
+            block['dz_zip_type'] = 1  # transposed deflate
+            end = block.write(self.fid, data, dtype.itemsize)
+        if end is None:  # not compressed or not enough data to compress
+            block = DTBlock()
+            block.load(dtype.itemsize, len(records), pointer)
+            end = block.write(self.fid, data)
+        self._pointer = _calculate_block_start(end)
+        self._add_to_list(state, pointer, len(data))
+        # cycle count updated once data is referenced, file stays readable if interrupted
+        state['cycle_count'] += len(records)
+        self.fid.seek(state['cg'] + 80)
+        self.fid.write(pack('<Q', state['cycle_count']))
+        self.fid.flush()
+        for channel in dtype.names:
+            if dtype[channel].base.kind in 'biuf':
+                values = (npmin(records[channel]), npmax(records[channel]))
+                if channel in state['ranges']:
+                    values = (min(values[0], state['ranges'][channel][0]),
+                              max(values[1], state['ranges'][channel][1]))
+                state['ranges'][channel] = values
+
+    def _add_to_list(self, state, pointer, length):
+        """ references data block in last DL block of channel group, creating it if full
+
+        Parameters
+        ----------------
+        state : dict
+            channel group writing state
+        pointer : int
+            data block position
+        length : int
+            uncompressed data length
+        """
+        dl = state['dl']
+        if dl is None or dl['count'] == self.listLength:
+            position = self._pointer
+            if dl is None and self.compression:  # HL block referencing DL blocks of DZ blocks
+                self.fid.seek(position)
+                self.fid.write(_HeaderStruct.pack(b'##HL', 0, 40, 1))
+                self.fid.write(_HLStruct.pack(position + 40, 0, 1, b'\0' * 5))
+                data_link = position
+                position += 40
+            else:
+                data_link = position
+            # reserves space for a full DL block
+            self.fid.seek(position)
+            self.fid.write(bytes(24 + 16 * self.listLength + 16))
+            self._pointer = position + 24 + 16 * self.listLength + 16
+            if dl is None:
+                self.fid.seek(state['dg'] + 40)  # DG data link
+                self.fid.write(pack('<Q', data_link))
+            else:
+                dl['next'] = position
+                dl.write_dl(self.fid, dl['pointer'])
+            dl = DLBlock()
+            dl.update({'id': b'##DL', 'reserved': 0, 'next': 0, 'list_data': {0: []}, 'flags': 0,
+                       'dl_reserved': b'\0' * 3, 'count': 0, 'offset': [], 'pointer': position})
+            state['dl'] = dl
+        dl['list_data'][0].append(pointer)
+        dl['offset'].append(state['data_bytes'])
+        dl['count'] += 1
+        dl['link_count'] = dl['count'] + 1
+        dl['length'] = 24 + 8 * dl['link_count'] + 8 + 8 * dl['count']
+        dl.write_dl(self.fid, dl['pointer'])
+        state['data_bytes'] += length
+
+    def close(self):
+        """ writes channels value ranges, finalises ID block and closes file
+        """
+        if self.fid is None or self.fid.closed:
+            return
+        for state in self._groups:
+            self.fid.seek(state['cg'] + 80)
+            self.fid.write(pack('<Q', state['cycle_count']))
+            for channel, cn in state['cn']:
+                if channel in state['ranges']:
+                    self.fid.seek(cn + 100)  # cn_flags, bit 3 value range valid
+                    self.fid.write(pack('<I', 8))
+                    self.fid.seek(cn + 112)
+                    self.fid.write(pack('<2d', *state['ranges'][channel]))
+        self.fid.seek(60)  # id_unfi_flags
+        self.fid.write(pack('<H', 0))
+        self.fid.close()
+
+
 def _linear_conversion(vector, cc_val):
     """ apply linear conversion to data
 
@@ -3456,7 +4476,8 @@ def file_finalization(version, info, fid, finalization_writing_to_file,
                                 dl.update(_load_header(fid, dl_position))
                                 dl.read_dl(fid, dl['link_count'])
                                 dl['list_data'][0] = list(dl['list_data'][0])
-                                last_block_pointer = dl['list_data'][0].pop(-1)
+                                if not dl['next']:  # last block of last DL block checked apart
+                                    last_block_pointer = dl['list_data'][0].pop(-1)
                                 for pointer in dl['list_data'][0]:
                                     dz.update(_load_header(fid, pointer))
                                     if dz['id'] == b'##DZ':
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+""" Measured Data Format files catalog in SQLite database
+
+:Author: `Aymeric Rateau <https://github.com/ratal/mdfreader>`__
+
+Dependencies
+-------------------
+- Python >3.4 <http://www.python.org>
+- Numpy >1.14 <http://numpy.scipy.org>
+
+mdfcatalog
+--------------------------
+"""
+import sqlite3
+from os import walk, stat
+from os.path import isdir, join, splitext, abspath, exists
+from concurrent.futures import ProcessPoolExecutor
+from warnings import warn
+from .mdfreader import Mdf
+from .mdfdataset import _index_mdf, _MDF_EXTENSIONS
+from .mdf import _open_mdf, idField
+from .channel import Channel4
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER,
+    mtime REAL,
+    version INTEGER,
+    start_time REAL
+);
+CREATE TABLE IF NOT EXISTS groups (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    data_group INTEGER,
+    master TEXT,
+    master_type INTEGER,
+    begin REAL,
+    end REAL,
+    records INTEGER,
+    rate REAL
+);
+CREATE TABLE IF NOT EXISTS channels (
+    id INTEGER PRIMARY KEY,
+    group_id INTEGER NOT NULL REFERENCES groups(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    unit TEXT,
+    description TEXT,
+    source TEXT,
+    minimum REAL,
+    maximum REAL
+);
+CREATE INDEX IF NOT EXISTS channels_name ON channels(name);
+CREATE INDEX IF NOT EXISTS groups_file ON groups(file_id);
+'''
+
+
+class MdfCatalog:
+    __slots__ = ['fileName', 'connection']
+    """ catalog of channels of many mdf files stored in a SQLite database
+
+    Attributes
+    --------------
+    fileName : str
+        SQLite database file name
+    connection : sqlite3.Connection
+        connection to database
+
+    Methods
+    ------------
+    build(paths, max_workers=None)
+        catalogs new or modified mdf files found in paths
+    find(channel=None, min_rate=None, max_rate=None, unit=None, source=None)
+        searches channels in catalog, without opening mdf files
+    close()
+        closes database
+
+    Notes
+    --------
+    Tables are files (path, size, mtime, version, start_time), groups (one row
+    per master channel of each file: data_group, master, master_type, begin,
+    end, records, rate in Hz for time masters) and channels (name, unit,
+    description, source, minimum, maximum). Minimum and maximum are the value
+    ranges stored in channel blocks if known, NULL otherwise.
+
+    Examples
+    --------------
+    >>> import mdfreader
+    >>> catalog = mdfreader.MdfCatalog('archive.sqlite')
+    >>> catalog.build('/data/archive', max_workers=8)
+    >>> catalog.find('EngineSpeed', min_rate=100)
+    """
+
+    def __init__(self, file_name):
+        """ opens or creates catalog database
+
+        Parameters
+        ----------------
+        file_name : str
+            SQLite database file name, ':memory:' for a temporary catalog
+        """
+        self.fileName = file_name
+        self.connection = sqlite3.connect(file_name)
+        self.connection.execute('PRAGMA foreign_keys = ON')
+        self.connection.executescript(_SCHEMA)
+
+    def build(self, paths, max_workers=None):
+        """ catalogs new or modified mdf files and forgets removed ones
+
+        Parameters
+        ----------------
+        paths : str or list of str
+            directories, walked recursively, or mdf file names
+        max_workers : int, optional
+            number of processes reading files information blocks,
+            one per CPU by default, 1 reads files in current process
+
+        Returns
+        -----------
+        int number of catalogued files
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+        file_names = []
+        for path in paths:
+            if isdir(path):
+                for root, directories, names in walk(path):
+                    file_names.extend(join(root, name) for name in sorted(names)
+                                      if splitext(name)[1].lower() in _MDF_EXTENSIONS)
+            else:
+                file_names.append(path)
+        known = {path: (size, mtime) for path, size, mtime in
+                 self.connection.execute('SELECT path, size, mtime FROM files')}
+        for path in known:  # removed files
+            if not exists(path):
+                self.connection.execute('DELETE FROM files WHERE path = ?', (path,))
+        to_read = []
+        for file_name in file_names:
+            file_name = abspath(file_name)
+            status = stat(file_name)
+            if known.get(file_name) != (status.st_size, status.st_mtime):
+                to_read.append(file_name)
+        if max_workers == 1:
+            entries = map(_catalog_file, to_read)
+            self._insert(entries)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                self._insert(executor.map(_catalog_file, to_read, chunksize=8))
+        self.connection.commit()
+        return len(to_read)
+
+    def _insert(self, entries):
+        """ writes files entries in database
+
+        Parameters
+        ----------------
+        entries : iterable of dict or None
+            file entries from _catalog_file()
+        """
+        for entry in entries:
+            if entry is None:
+                continue
+            self.connection.execute('DELETE FROM files WHERE path = ?', (entry['path'],))
+            file_id = self.connection.execute(
+                'INSERT INTO files (path, size, mtime, version, start_time) VALUES (?, ?, ?, ?, ?)',
+                (entry['path'], entry['size'], entry['mtime'], entry['version'],
+                 entry['start_time'])).lastrowid
+            for master, group in entry['groups'].items():
+                group_id = self.connection.execute(
+                    'INSERT INTO groups (file_id, data_group, master, master_type, begin, end, records, rate) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (file_id, group['data_group'], master, group['type'], group['begin'],
+                     group['end'], group['records'], group['rate'])).lastrowid
+                self.connection.executemany(
+                    'INSERT INTO channels (group_id, name, unit, description, source, minimum, maximum) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [(group_id,) + channel for channel in group['channels']])
+
+    def find(self, channel=None, min_rate=None, max_rate=None, unit=None, source=None):
+        """ searches channels in catalog
+
+        Parameters
+        ----------------
+        channel : str, optional
+            channel name, can include glob wildcards * and ?
+        min_rate : float, optional
+            minimum sampling rate in Hz of time master
+        max_rate : float, optional
+            maximum sampling rate in Hz of time master
+        unit : str, optional
+            channel unit
+        source : str, optional
+            channel source name, can include glob wildcards
+
+        Returns
+        -----------
+        list of tuples (path, data_group, channel, unit, rate, records, minimum, maximum)
+        """
+        query = 'SELECT files.path, groups.data_group, channels.name, channels.unit, groups.rate, ' \
+                'groups.records, channels.minimum, channels.maximum ' \
+                'FROM channels JOIN groups ON channels.group_id = groups.id ' \
+                'JOIN files ON groups.file_id = files.id'
+        conditions = []
+        parameters = []
+        for condition, value in (('channels.name GLOB ?', channel),
+                                 ('groups.rate >= ?', min_rate),
+                                 ('groups.rate <= ?', max_rate),
+                                 ('channels.unit = ?', unit),
+                                 ('channels.source GLOB ?', source)):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY files.path, groups.data_group, channels.name'
+        return self.connection.execute(query, parameters).fetchall()
+
+    def close(self):
+        """ closes catalog database
+        """
+        self.connection.close()
+
+
+def _catalog_file(file_name):
+    """ reads catalog entry of a file from its information blocks
+
+    Parameters
+    ----------------
+    file_name : str
+        mdf file name
+
+    Returns
+    -----------
+    dict with keys 'path', 'size', 'mtime', 'version', 'start_time' and 'groups',
+    each group having 'channels' list of (name, unit, description, source, minimum,
+    maximum) tuples. None if file could not be read.
+    """
+    try:
+        yop = Mdf(file_name, no_data_loading=True)
+        entry = _index_mdf(yop)
+    except Exception as error:
+        warn('{} could not be catalogued: {}'.format(file_name, error))
+        return None
+    status = stat(file_name)
+    entry['path'] = file_name
+    entry['size'] = status.st_size
+    entry['mtime'] = status.st_mtime
+    for master, group in entry['groups'].items():
+        group['channels'] = []
+        group['rate'] = None
+        if group['type'] == 1 and group['records'] > 1 and group['end'] > group['begin']:
+            group['rate'] = (group['records'] - 1) / (group['end'] - group['begin'])
+    (fid, name, zipfile) = _open_mdf(yop.fileName)
+    try:
+        for channel, master in entry['channels'].items():
+            minimum, maximum, source = _channel_range_source(yop, channel, fid)
+            unit, description = _channel_unit_desc(yop, channel)
+            entry['groups'][master]['channels'].append(
+                (channel, unit, description, source, minimum, maximum))
+    finally:
+        fid.close()
+    return entry
+
+
+def _channel_unit_desc(yop, channel):
+    """ unit and description strings of channel
+
+    Parameters
+    ----------------
+    yop : Mdf
+        mdf class read with no_data_loading
+    channel : str
+        channel name
+
+    Returns
+    -----------
+    (unit, description) tuple of str
+
+    Notes
+    --------
+    With no_data_loading, mdf4 descriptions are not in channel dict and are read
+    from channel block comment.
+    """
+    unit = yop.get_channel_unit(channel)
+    description = yop.get_channel_desc(channel)
+    if yop.MDFVersionNumber >= 400 and not description:
+        description = Channel4(*yop[channel][idField][0]).desc(yop.info)
+    return _text(unit), _text(description)
+
+
+def _text(value):
+    """ text of unit or description, that can be a comment block dict
+
+    Parameters
+    ----------------
+    value : str, dict or None
+        unit or description
+
+    Returns
+    -----------
+    str
+    """
+    if isinstance(value, dict):
+        value = value.get('Comment', value.get('description', value.get('name', '')))
+    if value is None:
+        return ''
+    return str(value)
+
+
+def _channel_range_source(yop, channel, fid):
+    """ physical value range and source name of channel from its blocks
+
+    Parameters
+    ----------------
+    yop : Mdf
+        mdf class read with no_data_loading
+    channel : str
+        channel name
+    fid : file identifier
+        opened mdf file, to read mdf4 source information blocks
+
+    Returns
+    -----------
+    (minimum, maximum, source) tuple, minimum and maximum None if unknown
+    """
+    identifier = yop[channel][idField]
+    if yop.MDFVersionNumber >= 400:
+        data_group, channel_group, channel_number = identifier[0]
+        if channel_number not in yop.info['CN'][data_group][channel_group]:
+            return None, None, ''
+        block = yop.info['CN'][data_group][channel_group][channel_number]
+        source = yop.info._si_source_name(fid, block['cn_si_source'], '')
+        if not block['cn_flags'] & (1 << 3):  # value range not valid
+            return None, None, source
+        values = (block['cn_val_range_min'], block['cn_val_range_max'])
+        conversion = yop.info['CC'][data_group][channel_group].get(channel_number)
+        if conversion and conversion.get('cc_type', 0) == 1:  # linear
+            offset, gain = conversion['cc_val'][:2]
+            values = (offset + gain * values[0], offset + gain * values[1])
+        elif conversion and conversion.get('cc_type', 0) != 0:
+            return None, None, source  # raw range only
+        return float(min(values)), float(max(values)), source
+    data_group, channel_group, channel_number = identifier
+    conversion = yop.info['CCBlock'][data_group][channel_group].get(channel_number)
+    if conversion and conversion['valueRangeKnown']:  # physical range
+        return float(conversion['valueRangeMinimum']), float(conversion['valueRangeMaximum']), ''
+    return None, None, ''
@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+""" Measured Data Format multi file dataset
+
+:Author: `Aymeric Rateau <https://github.com/ratal/mdfreader>`__
+
+Dependencies
+-------------------
+- Python >3.4 <http://www.python.org>
+- Numpy >1.14 <http://numpy.scipy.org>
+
+mdfdataset
+--------------------------
+"""
+from json import dump, load
+from os import listdir, stat
+from os.path import isdir, join, splitext, abspath
+from datetime import datetime
+from warnings import warn
+from numpy import array, concatenate
+from numpy.ma import MaskedArray, concatenate as ma_concatenate
+from .mdfreader import Mdf, _channel_group_records
+from .mdf4reader import Mdf4, Data, Record, _channel_conversion4
+from .mdf import _open_mdf, dataField, conversionField, idField, masterTypeField
+
+_MDF_EXTENSIONS = frozenset(('.mf4', '.mdf', '.dat', '.mfx', '.mfxz'))
+_INDEX_FILE_NAME = '.mdfdataset.json'
+_INDEX_VERSION = 1
+
+
+class MdfDataset:
+    __slots__ = ['fileNames', 'indexFile', 'index']
+    """ Set of mdf files seen as a single measurement, typically a recording split
+    in many files
+
+    Attributes
+    --------------
+    fileNames : list of str
+        mdf file names of the dataset
+    indexFile : str or None
+        json file where index is persisted
+    index : dict
+        file name: file index, with keys 'size', 'mtime', 'version', 'start_time',
+        'groups' (master channel: dict with keys 'type', 'begin', 'end', 'records',
+        'data_group') and 'channels' (channel name: master channel)
+
+    Methods
+    ------------
+    update()
+        indexes new or modified files and saves index
+    get(channel, begin=None, end=None)
+        returns master and channel data of all files between begin and end
+    files(channel=None, begin=None, end=None)
+        returns files overlapping a query
+
+    Notes
+    --------
+    Time master channels are offset by file start time (seconds since epoch),
+    begin and end of queries are then absolute times. Other master types
+    (angle, distance, index) are kept as in files.
+
+    Examples
+    --------------
+    >>> import mdfreader
+    >>> dataset = mdfreader.MdfDataset('/data/vehicle1/2024-05-06')
+    >>> time, speed = dataset.get('speed', 1714982400, 1714986000)
+    """
+
+    def __init__(self, paths, index_file=None):
+        """ dataset constructor, index is read from index_file if existing and updated
+
+        Parameters
+        ----------------
+        paths : str or list of str
+            directory containing mdf files or list of mdf file names
+        index_file : str, optional
+            json file to persist index. By default, .mdfdataset.json in directory
+            if paths is a directory, no persistence otherwise
+        """
+        if isinstance(paths, str) and isdir(paths):
+            if index_file is None:
+                index_file = join(paths, _INDEX_FILE_NAME)
+            paths = [join(paths, name) for name in sorted(listdir(paths))
+                     if splitext(name)[1].lower() in _MDF_EXTENSIONS]
+        elif isinstance(paths, str):
+            paths = [paths]
+        self.fileNames = [abspath(file_name) for file_name in paths]
+        self.indexFile = index_file
+        self.index = {}
+        if index_file is not None:
+            try:
+                with open(index_file, 'r') as fid:
+                    index = load(fid)
+                if index.get('version') == _INDEX_VERSION:
+                    self.index = index['files']
+            except (IOError, ValueError):
+                pass  # no or corrupted index, rebuilt
+        self.update()
+
+    def update(self):
+        """ indexes new or modified files, forgets removed ones and saves index
+        """
+        modified = False
+        index = {}
+        for file_name in self.fileNames:
+            status = stat(file_name)
+            entry = self.index.get(file_name)
+            if entry is None or entry['size'] != status.st_size or entry['mtime'] != status.st_mtime:
+                try:
+                    entry = _index_file(file_name)
+                except Exception as error:
+                    warn('{} could not be indexed: {}'.format(file_name, error))
+                    continue
+                entry['size'] = status.st_size
+                entry['mtime'] = status.st_mtime
+                modified = True
+            index[file_name] = entry
+        modified = modified or len(index) != len(self.index)
+        self.index = index
+        if modified and self.indexFile is not None:
+            with open(self.indexFile, 'w') as fid:
+                dump({'version': _INDEX_VERSION, 'files': self.index}, fid)
+
+    def channels(self):
+        """ names of all channels in dataset
+
+        Returns
+        -----------
+        set of str
+        """
+        return set(channel for entry in self.index.values() for channel in entry['channels'])
+
+    def files(self, channel=None, begin=None, end=None):
+        """ files of dataset containing channel with master values overlapping begin and end
+
+        Parameters
+        ----------------
+        channel : str, optional
+            channel name, all files if None
+        begin : float, optional
+            beginning value of master channel
+        end : float, optional
+            ending value of master channel
+
+        Returns
+        -----------
+        list of (file name, master channel, offset) sorted by master beginning,
+        offset being file start time for time master channel, 0 otherwise
+        """
+        selection = []
+        for file_name in self.fileNames:
+            entry = self.index.get(file_name)
+            if entry is None:
+                continue
+            if channel is None:
+                selection.append((entry['start_time'], file_name, None, entry['start_time']))
+                continue
+            master = entry['channels'].get(channel)
+            if master is None:
+                continue
+            group = entry['groups'][master]
+            offset = entry['start_time'] if group['type'] == 1 else 0
+            if group['begin'] is None or \
+                    (end is not None and group['begin'] + offset > end) or \
+                    (begin is not None and group['end'] + offset < begin):
+                continue
+            selection.append((group['begin'] + offset, file_name, master, offset))
+        selection.sort(key=lambda item: item[0])
+        return [(file_name, master, offset) for start, file_name, master, offset in selection]
+
+    def get(self, channel, begin=None, end=None):
+        """ reads channel in all files overlapping begin and end and stitches them
+
+        Parameters
+        ----------------
+        channel : str
+            channel name
+        begin : float, optional
+            beginning value of master channel
+        end : float, optional
+            ending value of master channel
+
+        Returns
+        -----------
+        (master_data, channel_data) : tuple of numpy arrays
+
+        Notes
+        --------
+        Only the overlapping files are opened and, for sorted mdf4 data groups,
+        only the records between begin and end are read (see Mdf.read cut argument).
+        """
+        masters = []
+        channels = []
+        for file_name, master, offset in self.files(channel, begin, end):
+            cut = None
+            if begin is not None or end is not None:
+                cut = (channel,
+                       None if begin is None else begin - offset,
+                       None if end is None else end - offset)
+            yop = Mdf(file_name, channel_list=[channel], cut=cut)
+            data = yop.get_channel_data(channel)
+            master_data = yop.get_channel_data(yop.get_channel_master(channel))
+            if data is None or master_data is None or len(data) == 0:
+                continue
+            masters.append(master_data + offset if offset else master_data)
+            channels.append(data)
+        if not channels:
+            return array([]), array([])
+        if any(isinstance(data, MaskedArray) for data in channels):
+            return concatenate(masters), ma_concatenate(channels)
+        return concatenate(masters), concatenate(channels)
+
+
+def _index_file(file_name):
+    """ indexes master channels ranges and channels of a file
+
+    Parameters
+    ----------------
+    file_name : str
+        mdf file name
+
+    Returns
+    -----------
+    dict with keys 'version', 'start_time', 'groups' and 'channels'
+    """
+    return _index_mdf(Mdf(file_name, no_data_loading=True))  # only information blocks
+
+
+def _index_mdf(yop):
+    """ indexes master channels ranges and channels of a mdf class
+
+    Parameters
+    ----------------
+    yop : Mdf
+        mdf class read with no_data_loading
+
+    Returns
+    -----------
+    dict with keys 'version', 'start_time', 'groups' and 'channels'
+    """
+    entry = {'version': yop.MDFVersionNumber,
+             'start_time': _start_time(yop),
+             'groups': {},
+             'channels': {}}
+    for master, group in yop.masterChannelList.items():
+        if master not in yop or not group:
+            continue
+        data_group, channel_group, n_records = _channel_group_records(yop, group[0])
+        begin, end = _master_bounds(yop, master, n_records) if n_records else (None, None)
+        entry['groups'][master] = {'type': yop._get_channel_field(master, masterTypeField),
+                                   'begin': begin, 'end': end,
+                                   'records': n_records, 'data_group': data_group}
+        for channel in group:
+            entry['channels'][channel] = master
+    return entry
+
+
+def _start_time(yop):
+    """ file start time in seconds since epoch, from header block
+
+    Parameters
+    ----------------
+    yop : Mdf
+        mdf class read with no_data_loading
+
+    Returns
+    -----------
+    float
+    """
+    if yop.MDFVersionNumber >= 400:
+        return yop.info['HD']['hd_start_time_ns'] / 1E9
+    try:
+        return yop.info['HDBlock']['TimeStamp'] / 1E9
+    except KeyError:
+        day, month, year = yop.info['HDBlock']['Date'].split(':')
+        try:
+            return datetime.fromisoformat('-'.join([year, month, day]) + 'T' +
+                                          yop.info['HDBlock']['Time']).timestamp()
+        except (OSError, ValueError):
+            return 0.
+
+
+def _master_bounds(yop, master, n_records):
+    """ first and last values of master channel
+
+    Parameters
+    ----------------
+    yop : Mdf
+        mdf class read with no_data_loading
+    master : str
+        master channel name
+    n_records : int
+        number of records of channel group
+
+    Returns
+    -----------
+    (begin, end) tuple of float
+
+    Notes
+    --------
+    For sorted mdf4 data groups, only first and last records are read,
+    otherwise the master channel is fully read.
+    """
+    if yop.MDFVersionNumber >= 400:
+        data_group, channel_group = yop[master][idField][0][:2]
+        info = yop.info
+        if len(info['CG'][data_group]) == 1:
+            record = Record(data_group, channel_group)
+            record.load_info(info)
+            channel = [chan for chan in record.values() if chan.name == master]
+            if channel and channel[0].channelType not in (3, 6):
+                conversion = _channel_conversion4(channel[0].conversion(info))
+                (fid, file_name, zipfile) = _open_mdf(yop.fileName)
+                try:
+                    buf = Data(fid, info['DG'][data_group]['dg_data'])
+                    bounds = []
+                    for index in (0, n_records - 1):
+                        data = buf.read_record_range(record, info, {master}, index, index + 1)[master]
+                        if conversion:
+                            data = Mdf4._convert_channel_data4({dataField: data, conversionField: conversion},
+                                                               master, False)[master]
+                        bounds.append(float(data[0]))
+                    return tuple(bounds)
+                finally:
+                    fid.close()
+    data = yop.get_channel_data(master)
+    if data is None or len(data) == 0:
+        return None, None
+    return float(data[0]), float(data[-1])
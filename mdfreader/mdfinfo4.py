@@ -20,7 +20,8 @@ The module provides two reading paths for the CN/CC/SI/TX hot path:
     into typed C packed structs.  TX/MD block text is decoded with a
     fast ``<TX>…</TX>`` bytes scan before falling back to ``lxml``.
     The SI block cache (``_si_cache``) prevents redundant reads when
-    multiple channels share the same source.
+    multiple channels share the same source; the TX/MD block cache
+    (``_tx_cache``) does the same for shared units and descriptions.
 
 **Python fallback path**
     ``read_cn_block()`` / ``read_cn_blocks()`` use ``struct.unpack``
@@ -43,7 +44,7 @@ from struct import calcsize, unpack, pack, Struct
 from os import remove
 from warnings import warn
 from zlib import compress, decompress, decompressobj
-from numpy import zeros, array, append, frombuffer
+from numpy import zeros, array, append, frombuffer, integer, floating
 
 try:
     from pyzstd import decompress as zstd_decompress
@@ -58,11 +59,12 @@ except ImportError:
     _LZ4_AVAILABLE = False
 from time import time
 from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
 from xml.etree.ElementTree import Element, SubElement, \
     tostring, register_namespace
 from lxml import objectify
 from .mdf import _open_mdf, dataField, descriptionField, unitField, \
-    masterField, masterTypeField, idField, _convert_name
+    masterField, masterTypeField, idField, _convert_name, _StringPool
 
 try:
     from dataRead import SymBufReader as _SymBufReader
@@ -243,7 +245,7 @@ class IDBlock(dict):
         """
         # MDF versionTxt tool reserved version_int
         head = (b'MDF     ', self['id_vers'], b'MDFreadr', b'\0' * 4, self['id_ver'],
-                b'\0' * 30, 0, 0)
+                b'\0' * 30, self.get('id_unfi_flags', 0), self.get('id_custom_unfi_flags', 0))
         fid.write(pack('<8s8s8s4sH30s2H', *head))
 
 
@@ -409,6 +411,34 @@ class CommentBlock(dict):
             self['Comment'] = fid.read(
                 self['length'] - 24).rstrip(b'\x00').decode('UTF-8', 'ignore')
 
+    def read_cached(self, fid, pointer, method, tx_cache=None, **kwargs):
+        """ reads TX or MD block through a cache keyed by block position
+
+        Parameters
+        ----------
+        fid:
+            file identifier
+        pointer: int
+            position in file
+        method: str
+            name of the CommentBlock method parsing the block, 'read_tx',
+            'read_cm_cn', 'read_cm_cc', etc.
+        tx_cache: dict, optional
+            (pointer, method) -> parsed block content, shared by all blocks of
+            the file. Blocks referenced by many channels (units, descriptions,
+            conversion texts) are read and parsed only once, their strings are
+            shared.
+        """
+        if tx_cache is None:
+            getattr(self, method)(fid=fid, pointer=pointer, **kwargs)
+            return
+        key = (pointer, method)
+        try:
+            self.update(tx_cache[key])
+        except KeyError:
+            getattr(self, method)(fid=fid, pointer=pointer, **kwargs)
+            tx_cache[key] = dict(self)
+
     def read_cm_header(self, fid, pointer):
         """ reads Comment block header
 
@@ -982,14 +1012,14 @@ class CGBlock(dict):
         # no invalid bytes)
         if 'cg_cg_master' in self and self['cg_cg_master'] is not None:
             data_bytes = (b'##CG', 0, self['length'], 7,
-                          0, self['CN'], 0, 0, 0, 0, self['cg_cg_master'], 0,
+                          0, self['CN'], 0, 0, self.get('SR', 0), 0, self['cg_cg_master'], 0,
                           self['cg_cycle_count'], 8, 0,
                           b'\0' * 4,
                           self['cg_data_bytes'], self['cg_inval_bytes'])
             fid.write(pack('<4sI2Q9Q2H4s2I', *data_bytes))
         else:
             data_bytes = (b'##CG', 0, self['length'], 6,
-                          0, self['CN'], 0, 0, 0, 0, 0,
+                          0, self['CN'], 0, 0, self.get('SR', 0), 0, 0,
                           self['cg_cycle_count'], 0, 0,
                           b'\0' * 4,
                           self['cg_data_bytes'], self['cg_inval_bytes'])
@@ -1056,14 +1086,15 @@ class CNBlock(dict):
                 self['cn_default_x'] = links[self['cn_attachment_count']:]
             else:
                 self['cn_default_x'] = None
+            tx_cache = kargs.get('tx_cache')
             if self['cn_md_comment']:  # comments exist
                 self['Comment'] = CommentBlock()
-                self['Comment'].read_cm_cn(
-                    fid=kargs['fid'], pointer=self['cn_md_comment'], minimal=True)
+                self['Comment'].read_cached(
+                    kargs['fid'], self['cn_md_comment'], 'read_cm_cn', tx_cache, minimal=True)
             if self['cn_md_unit']:  # comments exist
                 self['unit'] = CommentBlock()
-                self['unit'].read_cm_cn_unit(
-                    fid=kargs['fid'], pointer=self['cn_md_unit'])
+                self['unit'].read_cached(
+                    kargs['fid'], self['cn_md_unit'], 'read_cm_cn_unit', tx_cache)
                 if self['cn_sync_type'] and not self['unit']:
                     # no units but already known by spec
                     if self['cn_sync_type'] == 1:
@@ -1109,7 +1140,18 @@ class CCBlock(dict):
     """ reads Channel Conversion block and saves in class dict
     """
 
-    def read_cc(self, fid, pointer):
+    def read_cc(self, fid, pointer, tx_cache=None):
+        """ reads Channel Conversion block
+
+        Parameters
+        ----------
+        fid:
+            file identifier
+        pointer: int
+            position in file
+        tx_cache: dict, optional
+            TX/MD block cache, see CommentBlock.read_cached()
+        """
         # block header
         if pointer != 0 and pointer is not None:
             fid.seek(pointer)
@@ -1140,7 +1182,7 @@ class CCBlock(dict):
                 pointer = self['cc_ref']
                 self['cc_ref'] = {}
                 cc = CommentBlock()
-                cc.read_tx(fid=fid, pointer=pointer)
+                cc.read_cached(fid, pointer, 'read_tx', tx_cache)
                 self['cc_ref'].update(cc)
             elif self['cc_type'] in (7, 8, 9, 10, 11):  # text list
                 self['cc_ref'] = list(self['cc_ref'])
@@ -1151,24 +1193,25 @@ class CCBlock(dict):
                     # for algebraic formulae
                     if identifier in ('##TX', '##MD', b'##TX', b'##MD'):
                         temp = CommentBlock()
-                        temp.read_tx(fid=fid, pointer=self['cc_ref'][i])
+                        temp.read_cached(fid, self['cc_ref'][i], 'read_tx', tx_cache)
                         self['cc_ref'][i] = temp['Comment']
                     elif identifier in ('##CC', b'##CC'):  # for table conversion
                         # much more complicated nesting conversions !!!
                         cc = CCBlock()
-                        cc.read_cc(fid, self['cc_ref'][i])
+                        cc.read_cc(fid, self['cc_ref'][i], tx_cache)
                         self['cc_ref'][i] = cc
             if self['cc_md_comment']:  # comments exist
                 self['Comment'] = CommentBlock()
-                self['Comment'].read_cm_cc(
-                    fid=fid, pointer=self['cc_md_comment'])
+                self['Comment'].read_cached(
+                    fid, self['cc_md_comment'], 'read_cm_cc', tx_cache)
             if self['cc_md_unit']:  # comments exist
                 self['unit'] = CommentBlock()
-                self['unit'].read_cm_cc_unit(
-                    fid=fid, pointer=self['cc_md_unit'])
+                self['unit'].read_cached(
+                    fid, self['cc_md_unit'], 'read_cm_cc_unit', tx_cache)
             if self['cc_tx_name']:  # comments exist
                 self['name'] = CommentBlock()
-                self['name'].read_tx(fid=fid, pointer=self['cc_tx_name'])
+                self['name'].read_cached(
+                    fid, self['cc_tx_name'], 'read_tx', tx_cache)
         else:  # no conversion
             self['cc_type'] = 0
 
@@ -1463,6 +1506,17 @@ class SRBlock(dict):
              self['sr_flags'],
              sr_reserved) = _SRStruct.unpack(fid.read(64))
 
+    def write(self, fid):
+        # link section
+        # (next sample reduction block pointer, reduced data block pointer,
+        # number of reduced samples, interval length, sync type, no flags)
+        fid.seek(self['block_start'])
+        fid.write(_SRStruct.pack(b'##SR', 0, 64, 2,
+                                 self['sr_sr_next'], self['sr_data'],
+                                 self['sr_cycle_count'], self['sr_interval'],
+                                 self['sr_sync_type'], 0, b'\0' * 6))
+        return self['block_start'] + 64
+
 
 class SIBlock(dict):
 
@@ -1534,6 +1588,21 @@ class DVBlock(dict):
         return self['end_position']
 
 
+class RDBlock(dict):
+    def load(self, record_byte_offset, nRecords, pointer):
+        self['datablocks_length'] = 24 + record_byte_offset * nRecords
+        self['pointer'] = pointer
+        self['end_position'] = _calculate_block_start(
+            self['pointer'] + self['datablocks_length'])
+
+    def write(self, fid, data):
+        fid.seek(self['pointer'])
+        fid.write(_HeaderStruct.pack(b'##RD', 0, self['datablocks_length'], 0))
+        # dumps data
+        fid.write(data)
+        return self['end_position']
+
+
 class DIBlock(dict):
     def load(self, invalid_bytes, nRecords, pointer):
         self['datablocks_length'] = 24 + invalid_bytes * nRecords
@@ -1944,6 +2013,196 @@ class HLBlock(dict):
         return _calculate_block_start(pointer)
 
 
+# fixed size fields of blocks stored in structured arrays by compact Info4
+_CN_COMPACT_FIELDS = [('pointer', '<u8'), ('length', '<u8'), ('link_count', '<u8'),
+                      ('cn_cn_next', '<u8'), ('cn_composition', '<u8'), ('cn_tx_name', '<u8'),
+                      ('cn_si_source', '<u8'), ('cn_cc_conversion', '<u8'), ('cn_data', '<u8'),
+                      ('cn_md_unit', '<u8'), ('cn_md_comment', '<u8'),
+                      ('cn_type', 'u1'), ('cn_sync_type', 'u1'), ('cn_data_type', 'u1'),
+                      ('cn_bit_offset', 'u1'), ('cn_byte_offset', '<u4'), ('cn_bit_count', '<u4'),
+                      ('cn_flags', '<u4'), ('cn_invalid_bit_pos', '<u4'), ('cn_precision', 'u1'),
+                      ('cn_attachment_count', '<u2'), ('cn_val_range_min', '<f8'),
+                      ('cn_val_range_max', '<f8'), ('masterCG', '<u8')]
+_CN_POOLED_FIELDS = ('id', 'name', 'orig_name', 'unit', 'Comment', 'cn_reserved', 'cn_default_x')
+_CC_COMPACT_FIELDS = [('pointer', '<u8'), ('length', '<u8'), ('link_count', '<u8'),
+                      ('cc_tx_name', '<u8'), ('cc_md_unit', '<u8'), ('cc_md_comment', '<u8'),
+                      ('cc_cc_inverse', '<u8'), ('cc_type', 'u1'), ('cc_precision', 'u1'),
+                      ('cc_flags', '<u2'), ('cc_ref_count', '<u2'), ('cc_val_count', '<u2'),
+                      ('cc_phy_range_min', '<f8'), ('cc_phy_range_max', '<f8')]
+_CC_POOLED_FIELDS = ('id',)
+_CG_COMPACT_FIELDS = [('pointer', '<u8'), ('length', '<u8'), ('link_count', '<u8'),
+                      ('cg_cg_next', '<u8'), ('cg_cn_first', '<u8'), ('cg_tx_acq_name', '<u8'),
+                      ('cg_si_acq_source', '<u8'), ('cg_sr_first', '<u8'), ('cg_md_comment', '<u8'),
+                      ('cg_cg_master', '<u8'), ('cg_record_id', '<u8'), ('cg_cycle_count', '<u8'),
+                      ('cg_flags', '<u2'), ('cg_path_separator', '<u2'), ('cg_data_bytes', '<u4'),
+                      ('cg_invalid_bytes', '<u4')]
+_CG_POOLED_FIELDS = ('id', 'reserved', 'cg_reserved')
+
+
+class CompactBlocks(Mapping):
+    __slots__ = ['_keys', '_index', '_columns', '_bits', '_pooled', '_pool', '_extra']
+    """ blocks of same type (CN, CC or CG) stored in a numpy structured array
+
+    Fixed size fields are stored in array columns, strings and other hashable
+    values of pooled fields are interned in a string pool shared by the whole
+    Info4 instance and only their integer code is stored. Any other value
+    (nested blocks, lists, comments dict, etc.) is kept in a per block dict
+    created only when needed.
+    Behaves as a read only dict of blocks, each block being a CompactBlock
+    dict-like accessor so info['CN'][dg][cg][cn]['cn_type'] is unchanged.
+    """
+
+    def __init__(self, blocks, fields, pooled_fields, pool):
+        """ compact blocks constructor
+
+        Parameters
+        ----------------
+        blocks : dict
+            dict of block dicts to be compacted, key being cn, cg, etc.
+        fields : list of tuple
+            (field name, numpy dtype) of fixed size fields
+        pooled_fields : tuple of str
+            fields stored in string pool
+        pool : _StringPool
+            pool shared by Info4 instance
+        """
+        self._keys = list(blocks)
+        self._index = {key: row for row, key in enumerate(self._keys)}
+        self._bits = {name: bit for bit, (name, _) in enumerate(fields)}
+        self._pooled = frozenset(pooled_fields)
+        self._pool = pool
+        dtype = [('_present', '<u8')] + fields + [(name, '<i4') for name in pooled_fields]
+        data = zeros(len(self._keys), dtype=dtype)
+        for name in pooled_fields:
+            data[name] = -1  # absent
+        self._columns = {name: data[name] for name in data.dtype.names}
+        self._extra = [None] * len(self._keys)
+        for row, key in enumerate(self._keys):
+            for field, value in blocks[key].items():
+                self._set(row, field, value)
+
+    def __getitem__(self, key):
+        return CompactBlock(self, self._index[key])
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _get(self, row, field):
+        extra = self._extra[row]
+        if extra is not None and field in extra:
+            return extra[field]
+        if field in self._bits:
+            if (int(self._columns['_present'][row]) >> self._bits[field]) & 1:
+                return self._columns[field][row].item()
+        elif field in self._pooled:
+            code = self._columns[field][row]
+            if code >= 0:
+                if field == 'Comment':  # only description was pooled
+                    return {'description': self._pool.strings[code]}
+                return self._pool.strings[code]
+        raise KeyError(field)
+
+    def _set(self, row, field, value):
+        if field in self._bits:
+            present = int(self._columns['_present'][row])
+            if isinstance(value, (int, float, integer, floating)) and not isinstance(value, bool):
+                column = self._columns[field]
+                try:
+                    column[row] = value
+                    stored = column[row] == value  # detects truncation
+                except (OverflowError, ValueError, TypeError):
+                    stored = False
+                if stored:
+                    self._columns['_present'][row] = present | (1 << self._bits[field])
+                    self._pop_extra(row, field)
+                    return
+            self._columns['_present'][row] = present & ~(1 << self._bits[field])
+        elif field in self._pooled:
+            if field == 'Comment':  # channel comment from fast reader
+                if isinstance(value, dict) and len(value) == 1 and \
+                        isinstance(value.get('description'), str):
+                    pooled = value['description']
+                else:
+                    pooled = None
+            else:
+                try:
+                    hash(value)
+                    pooled = value
+                except TypeError:
+                    pooled = None
+            if pooled is not None or (value is None and field != 'Comment'):
+                self._columns[field][row] = self._pool.intern(pooled)
+                self._pop_extra(row, field)
+                return
+            self._columns[field][row] = -1
+        if self._extra[row] is None:
+            self._extra[row] = dict()
+        self._extra[row][field] = value
+
+    def _pop_extra(self, row, field):
+        if self._extra[row] is not None:
+            self._extra[row].pop(field, None)
+            if not self._extra[row]:
+                self._extra[row] = None
+
+    def _delete(self, row, field):
+        extra = self._extra[row]
+        if extra is not None and field in extra:
+            self._pop_extra(row, field)
+        elif field in self._bits and (int(self._columns['_present'][row]) >> self._bits[field]) & 1:
+            self._columns['_present'][row] = int(self._columns['_present'][row]) & ~(1 << self._bits[field])
+        elif field in self._pooled and self._columns[field][row] >= 0:
+            self._columns[field][row] = -1
+        else:
+            raise KeyError(field)
+
+    def _fields(self, row):
+        present = int(self._columns['_present'][row])
+        for field, bit in self._bits.items():
+            if (present >> bit) & 1:
+                yield field
+        for field in self._pooled:
+            if self._columns[field][row] >= 0:
+                yield field
+        if self._extra[row] is not None:
+            for field in self._extra[row]:
+                yield field
+
+
+class CompactBlock(MutableMapping):
+    __slots__ = ['_blocks', '_row']
+    """ dict-like accessor to one block stored in CompactBlocks
+    """
+
+    def __init__(self, blocks, row):
+        self._blocks = blocks
+        self._row = row
+
+    def __getitem__(self, field):
+        return self._blocks._get(self._row, field)
+
+    def __setitem__(self, field, value):
+        self._blocks._set(self._row, field, value)
+
+    def __delitem__(self, field):
+        self._blocks._delete(self._row, field)
+
+    def __iter__(self):
+        return self._blocks._fields(self._row)
+
+    def __len__(self):
+        return sum(1 for _ in self._blocks._fields(self._row))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
 class Info4(dict):
     """MDF4 file structure parser — nested dict of all metadata blocks.
 
@@ -1968,6 +2227,17 @@ class Info4(dict):
         File-offset → SI block dict cache shared across all channel reads
         within one file.  Prevents redundant ``pread()`` calls for sources
         referenced by many channels.
+    _tx_cache : dict
+        TX/MD block cache shared across all channel and conversion reads
+        within one file, see ``CommentBlock.read_cached()``.  Units,
+        descriptions and conversion texts referenced by many channels are
+        parsed only once.
+    compact : bool
+        When ``True``, CN, CC and CG blocks of each data group are stored in
+        :class:`CompactBlocks` (numpy structured arrays plus a string pool)
+        once the data group is parsed, see ``compact_dg_info()``.
+    _string_pool : _StringPool or None
+        Strings shared by all compacted blocks.
 
     Dictionary layout
     -----------------
@@ -2000,9 +2270,10 @@ class Info4(dict):
     ``self['ChannelNamesByDG'][dg]``
         Set of channel names within data group *dg* (used for deduplication).
     """
-    __slots__ = ['fileName', 'fid', 'filterChannelNames', 'zipfile', '_si_cache']
+    __slots__ = ['fileName', 'fid', 'filterChannelNames', 'zipfile', '_si_cache',
+                 '_tx_cache', 'compact', '_string_pool']
 
-    def __init__(self, file_name=None, fid=None, filter_channel_names=False, minimal=0):
+    def __init__(self, file_name=None, fid=None, filter_channel_names=False, minimal=0, compact=False):
         """ info4 class constructor
 
         Parameters
@@ -2017,6 +2288,10 @@ class Info4(dict):
             0 will load every metadata
             1 will load DG, CG, CN and CC (for noDataLoading)
             2 will load only DG (for normal reading)
+        compact : bool, optional
+            stores CN, CC and CG blocks in numpy structured arrays and
+            deduplicated string pool to reduce memory for files with many channels.
+            Block fields are accessed the same way, info['CN'][dg][cg][cn]['cn_type']
 
         Notes
         ---------
@@ -2034,6 +2309,9 @@ class Info4(dict):
         self['allChannelList'] = set()  # all channels
         self['masters'] = dict()  # channels grouped by master
         self._si_cache = {}  # SI block cache: pointer → dict
+        self._tx_cache = {}  # TX/MD block cache: pointer → text or dict
+        self.compact = compact
+        self._string_pool = _StringPool() if compact else None
         self.filterChannelNames = filter_channel_names
         self.fileName = file_name
         self.fid = None
@@ -2184,6 +2462,9 @@ class Info4(dict):
                                                 ['cg_record_id']] = {'cg_cn': (cg, cn)}
                                 break
 
+            if self.compact:
+                self.compact_dg_info(dg)
+
     def read_cg_block(self, fid, dg, cg, pointer, vlsd_cg_block, channel_name_list=False, minimal=0):
         """reads one Channel Group block
 
@@ -2260,12 +2541,17 @@ class Info4(dict):
             return vlsd
 
         # ── Fast Cython path (pread + C structs) ─────────────────────────────
+        global _CN_CHAIN_FAST
         if _CN_CHAIN_FAST and hasattr(fid, 'fileno'):
             try:
                 results = _read_cn_chain_fast(
                     fid, self['CG'][dg][cg]['cg_cn_first'],
-                    self._si_cache, minimal, channel_name_list)
-            except Exception:
+                    self._si_cache, minimal, channel_name_list, self._tx_cache)
+            except TypeError as error:  # dataRead extension built from older sources
+                warn('dataRead extension does not match mdfreader version, rebuild it: {}'.format(error))
+                _CN_CHAIN_FAST = False
+                results = None
+            except (OSError, ValueError):  # unreadable or malformed blocks, python path
                 results = None
 
             if results is not None:
@@ -2285,7 +2571,7 @@ class Info4(dict):
                     # Complete CC blocks for complex conversion types
                     if cc_dict.get('_needs_completion'):
                         full_cc = CCBlock()
-                        full_cc.read_cc(fid, cn_dict['cn_cc_conversion'])
+                        full_cc.read_cc(fid, cn_dict['cn_cc_conversion'], self._tx_cache)
                         self['CC'][dg][cg][cn] = full_cc
 
                     if not channel_name_list:
@@ -2452,7 +2738,7 @@ class Info4(dict):
         vlsd : boolean
         """
         temp = CNBlock()
-        temp.read_cn(fid=fid, pointer=pointer)
+        temp.read_cn(fid=fid, pointer=pointer, tx_cache=self._tx_cache)
         if use_negative_key or temp.get('cn_flags', 0) & 0x20000:
             # CN_F_DATA_STREAM_MODE (0x20000) or forced: use negative file position as key
             cn = -pointer
@@ -2466,7 +2752,7 @@ class Info4(dict):
         # reads Channel Conversion Block
         self['CC'][dg][cg][cn] = CCBlock()
         self['CC'][dg][cg][cn].read_cc(
-            fid, self['CN'][dg][cg][cn]['cn_cc_conversion'])
+            fid, self['CN'][dg][cg][cn]['cn_cc_conversion'], self._tx_cache)
         if not channel_name_list:
             if not minimal:
                 # reads Channel Source Information (cached by pointer to avoid duplicate file reads)
@@ -2620,6 +2906,28 @@ class Info4(dict):
         except KeyError:
             pass
 
+    def compact_dg_info(self, dg):
+        """ stores CN, CC and CG blocks related to data group in CompactBlocks
+
+        Parameters
+        ----------------
+        dg : int
+            data group number
+        """
+        if self._string_pool is None:
+            self._string_pool = _StringPool()
+        for cg in self['CN'].get(dg, {}):
+            if not isinstance(self['CN'][dg][cg], CompactBlocks):
+                self['CN'][dg][cg] = CompactBlocks(self['CN'][dg][cg], _CN_COMPACT_FIELDS,
+                                                   _CN_POOLED_FIELDS, self._string_pool)
+        for cg in self['CC'].get(dg, {}):
+            if not isinstance(self['CC'][dg][cg], CompactBlocks):
+                self['CC'][dg][cg] = CompactBlocks(self['CC'][dg][cg], _CC_COMPACT_FIELDS,
+                                                   _CC_POOLED_FIELDS, self._string_pool)
+        if dg in self['CG'] and not isinstance(self['CG'][dg], CompactBlocks):
+            self['CG'][dg] = CompactBlocks(self['CG'][dg], _CG_COMPACT_FIELDS,
+                                           _CG_POOLED_FIELDS, self._string_pool)
+
     @staticmethod
     def read_sr_block(fid, pointer):
         """reads Sample Reduction Blocks
@@ -2725,6 +3033,35 @@ class Info4(dict):
         fid.close()
         return channel_name_list
 
+    def _si_source_name(self, fid, si_pointer, default):
+        """ returns source name of SI block, read through SI block cache
+
+            Parameters
+            ----------------
+            fid
+                file identifier
+
+            si_pointer: int
+                position of SI block in file, 0 if no source
+
+            default
+                value returned when there is no source or source name
+
+            Returns
+            -----------
+            source name
+        """
+        if not si_pointer:
+            return default
+        if si_pointer not in self._si_cache:
+            temp = SIBlock()
+            temp.read_si(fid, si_pointer)
+            self._si_cache[si_pointer] = dict(temp) if temp else None
+        si = self._si_cache[si_pointer]
+        if si is not None and si['si_tx_name'] > 0:
+            return si['source_name']['Comment']
+        return default
+
     def _unique_channel_name(self, fid, name, dg, cg, cn):
         """ generate unique channel name
 
@@ -2751,26 +3088,12 @@ class Info4(dict):
         """
         # check if already existing channel name
         if name in self['ChannelNamesByDG'][dg]:  # for unsorted data
-            if self['CN'][dg][cg][cn]['cn_si_source']:
-                temp = SIBlock()
-                temp.read_si(fid, self['CN'][dg][cg][cn]['cn_si_source'])
-                if temp['si_tx_name'] > 0:
-                    source_name = temp['source_name']['Comment']
-                else:
-                    source_name = cn
-            else:
-                source_name = cn
+            source_name = self._si_source_name(
+                fid, self['CN'][dg][cg][cn]['cn_si_source'], cn)
             name = u'{0}_{1}_{2}_{3}'.format(name, dg, cg, source_name)
         elif name in self['allChannelList']:  # for sorted data
-            if self['CN'][dg][cg][cn]['cn_si_source']:
-                temp = SIBlock()
-                temp.read_si(fid, self['CN'][dg][cg][cn]['cn_si_source'])
-                if temp['si_tx_name'] > 0:
-                    source_name = temp['source_name']['Comment']
-                else:
-                    source_name = dg
-            else:
-                source_name = dg
+            source_name = self._si_source_name(
+                fid, self['CN'][dg][cg][cn]['cn_si_source'], dg)
             name = u'{0}_{1}_{2}'.format(name, dg, source_name)
         self['ChannelNamesByDG'][dg].add(name)
         self['allChannelList'].add(name)
@@ -20,7 +20,7 @@ Dependencies
 - h5py for the HDF5 export
 - xlwt for the excel export (not existing for python3)
 - openpyxl >2.0 for the excel 2007 export
-- hdf5storage for the Matlab file conversion
+- h5py or hdf5storage for the Matlab file conversion
 - zlib to uncompress data block if needed
 
 mdfreader
@@ -28,23 +28,34 @@ mdfreader
 """
 
 from io import open
-from struct import unpack
+from struct import pack, unpack
 from math import ceil
-from os.path import splitext
+from os.path import splitext, basename
 from os import remove
 from os import name as osname
+from os import cpu_count
 from warnings import warn
 from argparse import ArgumentParser
-from numpy import arange, linspace, interp, all, diff, mean, vstack, float64, float32
-from numpy import nan, datetime64, array, searchsorted, clip, empty
-from numpy.ma import MaskedArray, masked, empty as ma_empty
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from itertools import chain
+from collections import OrderedDict, deque
+from functools import lru_cache
+from time import strftime
+from sys import platform
+from numpy import arange, linspace, all, diff, mean, vstack, float64, float32
+from numpy import nan, datetime64, array, searchsorted, clip, empty, asarray, isnan, zeros, errstate, ndarray
+from numpy import concatenate, result_type, unique, append, repeat, flatnonzero, fmin, fmax, absolute, nanargmax
+from numpy import char, bytes_, int32, uint8, frombuffer, iinfo, dtype as numpy_dtype
+from numpy.ma import MaskedArray, masked, empty as ma_empty, getdata, getmaskarray, nomask
 from .mdf3reader import Mdf3
-from .mdf4reader import Mdf4
-from .mdf import _open_mdf, dataField, descriptionField, unitField, masterField, masterTypeField, idField
+from .mdf4reader import Mdf4, Data, Record, chunk_size_reading, _channel_conversion4, _read_reduced4
+from .mdf import _open_mdf, CompressedData, dataField, descriptionField, unitField, masterField, masterTypeField, idField, \
+    conversionField
 from .mdfinfo3 import Info3, _generate_dummy_mdf3
 from .mdfinfo4 import Info4, _generate_dummy_mdf4
 
 
+@lru_cache(maxsize=None)
 def _convert_to_matlab_name(channel):
     """Removes non allowed characters for a Matlab variable name
 
@@ -88,6 +99,29 @@ def _convert_to_matlab_name(channel):
     return channel_name
 
 
+def _matlab_filled(data):
+    """Fills masked samples for Matlab, having no missing value for integers
+
+    Parameters
+    -----------------
+    data : numpy masked array
+        channel data
+
+    Returns
+    -----------
+    numpy array
+        float channels filled with NaN, integer channels with their type maximum,
+        boolean channels as uint8 with 255
+    """
+    if data.dtype.kind == 'b':
+        data = data.view('u1')
+    if data.dtype.kind in ('i', 'u'):
+        return data.filled(iinfo(data.dtype).max)
+    if data.dtype.kind in ('f', 'c'):
+        return data.filled(nan)
+    return data.filled()
+
+
 def _convert_to_hdf5_name(channel):
     """Removes non allowed characters for a hdf5 variable name
 
@@ -106,6 +140,146 @@ def _convert_to_hdf5_name(channel):
     return channel_name
 
 
+# number of same dtype channels stacked in one 2D array when resampling a data group
+_RESAMPLE_BLOCK_SIZE = 256
+# number of last samples of a chunk prepended to the next one when resampling chunk by chunk
+_RESAMPLE_OVERLAP = 2
+# conversion types giving numbers as physical values, mdf4 and mdf3
+_NUMERIC_CONVERSIONS4 = (1, 2, 3, 4, 5, 6)
+_NUMERIC_CONVERSIONS3 = (0, 1, 2, 6, 7, 8, 9, 10)
+# maximum number of rows of an excel 2007 sheet
+_XLSX_MAX_ROWS = 1048576
+# Matlab classes of numpy types
+_MATLAB_CLASSES = {'f8': 'double', 'f4': 'single', 'i1': 'int8', 'u1': 'uint8', 'i2': 'int16',
+                   'u2': 'uint16', 'i4': 'int32', 'u4': 'uint32', 'i8': 'int64', 'u8': 'uint64',
+                   'b1': 'logical'}
+
+
+class _MasterInterpolator(object):
+    __slots__ = ['x', 'new_x', '_close_point', '_linear']
+    """ interpolation indexes and weights shared by all channels of a data group
+
+    Positions of the new master samples within the old master channel are
+    computed once and applied to blocks of channels with gathers and a
+    vectorized linear interpolation over the 2D stack of gathered samples,
+    instead of calling interp or searchsorted for each channel.
+
+    Parameters
+    ----------------
+    x : array
+        old master channel data
+    new_x : array
+        new master channel data
+    """
+
+    def __init__(self, x, new_x):
+        self.x = x
+        self.new_x = new_x
+        self._close_point = {}
+        self._linear = None
+
+    def close_point(self, side):
+        """ indexes of closest old samples
+
+        Parameters
+        ----------------
+        side : str
+            'left' or 'right', searchsorted side
+
+        Returns
+        -----------
+        array of indexes in old master channel
+        """
+        try:
+            return self._close_point[side]
+        except KeyError:
+            idx = searchsorted(self.x, self.new_x, side=side)
+            idx -= 1
+            clip(idx, 0, len(self.x) - 1, out=idx)
+            self._close_point[side] = idx
+            return idx
+
+    def linear(self, data):
+        """ linear interpolation of channels, same results as numpy.interp
+
+        Parameters
+        ----------------
+        data : list of arrays
+            channels data having same length as old master
+
+        Returns
+        -----------
+        2D float64 array, one channel per row
+        """
+        x = asarray(self.x, dtype=float64)
+        new_x = asarray(self.new_x, dtype=float64)
+        if len(x) == 0:
+            raise ValueError('array of sample points is empty')
+        if len(x) == 1:
+            return vstack([asarray(y, dtype=float64)[zeros(len(new_x), dtype=int)]
+                           for y in data])
+        if self._linear is None:
+            index = searchsorted(x, new_x, side='right') - 1
+            clip(index, 0, len(x) - 2, out=index)
+            self._linear = (index, new_x - x[index], x[index + 1] - x[index],
+                            new_x == x[index], new_x < x[0], new_x >= x[-1])
+        index, offset, step, exact, below, above = self._linear
+        y0 = vstack([asarray(y)[index] for y in data]).astype(float64, copy=False)
+        y1 = vstack([asarray(y)[index + 1] for y in data]).astype(float64, copy=False)
+        with errstate(divide='ignore', invalid='ignore'):  # like numpy.interp
+            result = (y1 - y0) / step * offset + y0
+            invalid = isnan(result)
+            if invalid.any():  # same correction than numpy.interp for nan slopes
+                rows, cols = invalid.nonzero()
+                a, b = y0[rows, cols], y1[rows, cols]
+                values = (b - a) / step[cols] * (new_x[cols] - x[index[cols] + 1]) + b
+                equal = isnan(values) & (a == b)
+                values[equal] = a[equal]
+                result[rows, cols] = values
+        result[:, exact] = y0[:, exact]
+        if below.any():
+            result[:, below] = array([y[0] for y in data], dtype=float64)[:, None]
+        if above.any():
+            result[:, above] = array([y[-1] for y in data], dtype=float64)[:, None]
+        return result
+
+    def interpolate(self, data, interpolation_kind=None):
+        """ interpolates channels on new master
+
+        Parameters
+        ----------------
+        data : list of arrays
+            channels data having the same dtype and same length as old master
+        interpolation_kind : str, optional
+            interpolation type for floating data from scipy interp1d list (‘linear’, ‘nearest’, ‘zero’,
+             ‘slinear’, ‘quadratic’, ‘cubic’, ‘previous’, ‘next’)
+
+        Returns
+        -----------
+        list or 2D array of interpolated channels, in data order
+        """
+        # select right interpolation method depending of
+        # interpolation kind and data type
+        kind = data[0].dtype.kind
+        if interpolation_kind is None:
+            if kind == 'f':
+                return self.linear(data)
+            else:
+                idx = self.close_point('right')
+        elif interpolation_kind == 'previous':
+            idx = self.close_point('left')
+        elif interpolation_kind == 'next':
+            idx = self.close_point('right')
+        elif kind not in ('U', 'S'):
+            from scipy.interpolate import interp1d
+            f = interp1d(self.x, vstack(data), kind=interpolation_kind,
+                         fill_value="extrapolate")
+            return f(self.new_x)
+        else:
+            idx = self.close_point('right')
+        return [y[idx] for y in data]
+
+
 class MdfInfo(dict):
     __slots__ = ['fileName', 'fid', 'zipfile',
                  'mdfversion', 'filterChannelNames']
@@ -148,7 +322,7 @@ class MdfInfo(dict):
     >>> yop.list_channels(FILENAME) # returns a simple list of channel names
     """
 
-    def __init__(self, file_name=None, filter_channel_names=False, fid=None, minimal=0):
+    def __init__(self, file_name=None, filter_channel_names=False, fid=None, minimal=0, compact=False):
         """ You can give optionally to constructor a file name that will be parsed
 
         Parameters
@@ -158,6 +332,9 @@ class MdfInfo(dict):
         filter_channel_names : bool, optional
             flag to filter long channel names including module names separated by a '.'
         fid : file identifier, optional
+        compact : bool, optional
+            mdf4 only, stores CN, CC and CG blocks in numpy structured arrays
+            to reduce memory footprint of files with many channels
         """
 
         self.fileName = file_name
@@ -166,9 +343,9 @@ class MdfInfo(dict):
         self.fid = fid
         self.zipfile = False
         if file_name is not None:
-            self.read_info(file_name, fid, minimal)
+            self.read_info(file_name, fid, minimal, compact)
 
-    def read_info(self, file_name=None, fid=None, minimal=0):
+    def read_info(self, file_name=None, fid=None, minimal=0, compact=False):
         """ Reads MDF file and extracts its complete structure
 
         Parameters
@@ -180,6 +357,8 @@ class MdfInfo(dict):
             0 will load every metadata
             1 will load DG, CG, CN and CC
             2 will load only DG
+        compact : bool, optional
+            mdf4 only, stores CN, CC and CG blocks in numpy structured arrays
         """
 
         if self.fileName is None or file_name is not None:
@@ -198,7 +377,7 @@ class MdfInfo(dict):
                 Info3(None, self.fid, self.filterChannelNames, minimal))
         else:  # MDF version 4.x
             self.update(
-                Info4(None, self.fid, self.filterChannelNames, minimal))
+                Info4(None, self.fid, self.filterChannelNames, minimal, compact))
             if self.zipfile and fid is None:  # not from mdfreader.read()
                 remove(self.fileName)
 
@@ -283,8 +462,12 @@ class Mdf(Mdf4, Mdf3):
         returns channel unit
     plot( channels )
         Plot channels with Matplotlib
+    read_reduced( channel_list, max_points=1000 )
+        Reads channels overview from mdf4 sample reduction blocks
     resample( sampling_time = 0.1, master_channel=None )
         Resamples all data groups
+    resample_to_file( file_name, sampling, channel_list=None )
+        Resamples data groups chunk by chunk into a new file
     export_to_csv( file_name = None, sampling = 0.1 )
         Exports mdf data into CSV file
     export_to_NetCDF( file_name = None, sampling = None )
@@ -299,6 +482,12 @@ class Mdf(Mdf4, Mdf3):
         Exports mdf data into excel 2007 and 2010 file
     convert_to_pandas( sampling=None )
         converts mdf data structure into pandas dataframe(s)
+    to_arrow( master_channel_name )
+        returns data group as pyarrow table
+    export_to_arrow_ipc( file_name=None ), export_to_feather( file_name=None )
+        Exports mdf data into Arrow IPC or Feather files by record batches
+    export_to_parquet( file_name=None )
+        Exports mdf data into parquet files by row groups
     keep_channels( channel_list )
         keeps only list of channels and removes the other channels
     merge_mdf( mdf_class ):
@@ -344,7 +533,7 @@ class Mdf(Mdf4, Mdf3):
 
     def read(self, file_name=None, multi_processed=False, channel_list=None, convert_after_read=True,
              filter_channel_names=False, no_data_loading=False, compression=False, metadata=2,
-             finalization_writing_to_file=False, force_file_integrity_check=False):
+             finalization_writing_to_file=False, force_file_integrity_check=False, cut=None):
         """ reads mdf file version 3.x and 4.x
 
         Parameters
@@ -394,6 +583,11 @@ class Mdf(Mdf4, Mdf3):
             flags (id_unfin_flags==0). Combined with finalization_writing_to_file is
             very experimental and risky, correction should be tried in memory first.
 
+        cut : tuple (master_channel, begin, end), optional
+            keeps only data between begin and end values of master_channel, see cut().
+            For mdf 4.x sorted data groups, index range is first searched in master
+            channel and only these records are read. Ignored with no_data_loading.
+
         Notes
         --------
         If you keep convertAfterRead to true, you can set attribute mdf.multiProc to activate channel conversion
@@ -431,11 +625,13 @@ class Mdf(Mdf4, Mdf3):
             if not no_data_loading:
                 self.read4(self.fileName, None, multi_processed, channel_list,
                            convert_after_read, filter_channel_names, compression, metadata,
-                           finalization_writing_to_file, force_file_integrity_check)
+                           finalization_writing_to_file, force_file_integrity_check, cut)
             else:  # populate minimum mdf structure
                 self._noDataLoading = True
+                # info kept in memory, compacted together with channels if requested
                 self.info = Info4(None, fid=self.fid,
-                                  filter_channel_names=filter_channel_names, minimal=1)
+                                  filter_channel_names=filter_channel_names, minimal=1,
+                                  compact=self._string_pool is not None)
                 (self.masterChannelList, mdf_dict) = _generate_dummy_mdf4(
                     self.info, channel_list)
                 self.update(mdf_dict)
@@ -443,7 +639,13 @@ class Mdf(Mdf4, Mdf3):
         if not self.fid.closed:  # close file
             self.fid.close()
 
-    def write(self, file_name=None, compression=False, column_oriented=False):
+        if cut is not None:
+            if no_data_loading:
+                warn('cut is ignored with no_data_loading')
+            else:  # groups not cut while reading
+                self.cut(*cut)
+
+    def write(self, file_name=None, compression=False, column_oriented=False, sample_reduction=False):
         """Writes simple mdf file, same format as originally read, default is 4.x
 
         Parameters
@@ -457,6 +659,9 @@ class Mdf(Mdf4, Mdf3):
             If activated, will write in version 4.1 even if original file is in version 3.x
         column_oriented : bool
             Flag to store , column oriented channels
+        sample_reduction : bool
+            Flag to write mean, minimum and maximum pyramid in sample reduction blocks
+            (mdf version 4.x only), see write4
 
         Notes
         --------
@@ -473,7 +678,7 @@ class Mdf(Mdf4, Mdf3):
             self.write3(file_name=file_name)
         else:
             self.write4(file_name=file_name, compression=compression,
-                        column_oriented=column_oriented)
+                        column_oriented=column_oriented, sample_reduction=sample_reduction)
 
     def get_channel_data(self, channel_name, raw_data=False):
         """Return channel numpy array
@@ -512,7 +717,7 @@ class Mdf(Mdf4, Mdf3):
         else:
             return self._convert_all_channel4()
 
-    def plot(self, channel_name_list_of_list):
+    def plot(self, channel_name_list_of_list, decimation='minmax'):
         """Plot channels with Matplotlib
 
         Parameters
@@ -520,6 +725,9 @@ class Mdf(Mdf4, Mdf3):
         channel_name_list_of_list : str or list of str or list of list of str
             channel name or list of channel names or list of list of channel names
             list of list will create multiplots
+        decimation : str or None, optional
+            'minmax' or 'lttb' method reducing channels to about twice figure width
+            in pixels before plotting (see decimate function), None plots all samples
 
         Notes
         ---------
@@ -539,6 +747,10 @@ class Mdf(Mdf4, Mdf3):
         if isinstance(channel_name_list_of_list, str):
             channel_name_list_of_list = [
                 channel_name_list_of_list]  # converts in list
+        n_buckets = 0
+        if decimation is not None:
+            figure = plt.gcf()
+            n_buckets = int(figure.get_figwidth() * figure.dpi)
         for channel_name_list in channel_name_list_of_list:
             fig = plt.subplot(len(channel_name_list_of_list), 1,
                               channel_name_list_of_list.index(channel_name_list) + 1)
@@ -556,26 +768,21 @@ class Mdf(Mdf4, Mdf3):
                             master_name = next(iter(self.masterChannelList))
                             if not master_name:  # resampled channels, only one time channel probably called 'master'
                                 master_name = 'master'
-                            master_data = self.get_channel_data(master_name)
-                            if master_data is None:  # no master channel
-                                master_data = arange(0, len(data), 1)
-                            if master_name in self.masterChannelList:  # time channel properly defined
-                                plt.plot(master_data, data, label=channelName)
-                                plt.xlabel('{0} [{1}]'.format(
-                                    master_name, self.get_channel_unit(master_name)))
-                            else:  # no time channel found
-                                plt.plot(data)
                         else:  # not resampled
                             master_name = self.get_channel_master(channelName)
+                        master_data = None
+                        if master_name in self.masterChannelList:  # master channel is proper channel name
                             master_data = self.get_channel_data(master_name)
-                            if master_data is None:  # no master channel
-                                master_data = arange(0, len(data), 1)
-                            if master_name in self.masterChannelList:  # master channel is proper channel name
-                                plt.plot(master_data, data, label=channelName)
-                                plt.xlabel('{0} [{1}]'.format(
-                                    master_name, self.get_channel_unit(master_name)))
-                            else:
-                                plt.plot(data)
+                        if master_data is None:  # no master channel
+                            master_data = arange(0, len(data), 1)
+                        if n_buckets:
+                            master_data, data = decimate(master_data, data, n_buckets, decimation)
+                        if master_name in self.masterChannelList:
+                            plt.plot(master_data, data, label=channelName)
+                            plt.xlabel('{0} [{1}]'.format(
+                                master_name, self.get_channel_unit(master_name)))
+                        else:  # no time channel found
+                            plt.plot(master_data, data)
 
                         plt.title(self.get_channel_desc(channelName))
                         if self.get_channel_unit(channelName) == {}:
@@ -593,16 +800,72 @@ class Mdf(Mdf4, Mdf3):
         plt.show()
         return fig
 
-    def plot_all(self):
+    def plot_all(self, decimation='minmax'):
         # plot all channels in the object, be careful for test purpose only,
         # can display many many many plots overloading your computer
         for Name in self:
             try:
-                self.plot(Name)
+                self.plot(Name, decimation)
             except Exception:
                 warn(Name)
 
-    def resample(self, sampling=None, channel=None, master_channel=None, interpolation_kind=None):
+    def read_reduced(self, channel_list, max_points=1000):
+        """ reads overview of channels from mdf4 sample reduction blocks, full data is not read
+
+        Parameters
+        ----------------
+        channel_list : str or list of str
+            channel names
+        max_points : int, optional
+            maximum number of reduced samples per channel. The finest sample reduction
+            level not exceeding it is chosen, or the coarsest one if all levels have more samples
+
+        Returns
+        -----------
+        dict channel name: (master_data, mean, minimum, maximum) tuple of numpy arrays,
+        master_data being mean of master channel over each interval, or first record
+        index of each interval if channel group has no master channel
+
+        Notes
+        --------
+        Sample reduction blocks are written by measurement tools or write4(sample_reduction=True).
+        Channels without sample reduction are not returned. Mdf can be created with
+        no_data_loading=True to only read blocks information:
+
+        >>> yop = mdfreader.Mdf('big_file.mf4', no_data_loading=True)
+        >>> time, mean, minimum, maximum = yop.read_reduced(['speed'], 2000)['speed']
+        """
+        if isinstance(channel_list, str):
+            channel_list = [channel_list]
+        if self.MDFVersionNumber < 400:
+            warn('sample reduction blocks only exist in mdf version 4.x')
+            return {}
+        if self._noDataLoading:
+            info = self.info
+        else:
+            info = Info4(self.fileName, minimal=1)
+        groups = OrderedDict()  # channel numbers by (data group, channel group)
+        for channel in channel_list:
+            if channel not in self:
+                warn('Channel {} not existing'.format(channel))
+                continue
+            data_group, channel_group, channel_number = self[channel][idField][0]
+            groups.setdefault((data_group, channel_group), []).append(channel_number)
+        reduced = {}
+        (fid, file_name, zipfile) = _open_mdf(self.fileName)
+        try:
+            for (data_group, channel_group), channel_numbers in groups.items():
+                group = _read_reduced4(fid, info, data_group, channel_group, channel_numbers, max_points)
+                if group is None:
+                    warn('no sample reduction for data group {}'.format(data_group))
+                else:
+                    reduced.update(group)
+        finally:
+            fid.close()
+        return reduced
+
+    def resample(self, sampling=None, channel=None, master_channel=None, interpolation_kind=None,
+                 max_workers=1):
         """ Resamples as much as possible all data groups into one data group having defined
         sampling interval or sharing same defined master channel
 
@@ -620,18 +883,22 @@ class Mdf(Mdf4, Mdf3):
         ** or | and **
         master_channel : str, optional
             master channel name to be used as reference
+        max_workers : int, optional
+            number of threads interpolating data groups and blocks of channels in parallel,
+            number of CPUs if None, 1 (default) to resample serially
 
         Notes
         --------
         1. resampling will be applied only to master channels that have same type as the one
         given by channel or master_channel parameters (applicable only to mdf4)
 
-        2. resampling will convert all your channels so be careful for big files
-        and memory consumption
+        2. raw data is resampled and converted later when conversion and interpolation commute
+        (linear conversion with linear interpolation, any numeric conversion with 'previous', 'next'
+        or 'nearest'), other channels of resampled data groups are converted before resampling
         """
         if self:  # mdf contains data
-            # must make sure all channels are converted
-            self.convert_all_channels()
+            if self._noDataLoading:  # no data loaded, load everything
+                self.convert_all_channels()
 
             if channel is not None and master_channel is None:
                 master_channel_name = self.get_channel_master(channel)
@@ -699,27 +966,28 @@ class Mdf(Mdf4, Mdf3):
                             master_data[0], master_data[-1], sampling)
 
             # Interpolate channels
-            for master in list(self.masterChannelList):
-                if self.get_channel_master_type(master) == master_channel_type:
-                    self.resample_group(sampling, master, new_master_data=master_data,
-                                        interpolation_kind=interpolation_kind)
-                    # remove old master channel
-                    if not master_channel_name == master:
-                        # removing previous master from list
-                        self.masterChannelList[master].remove(master)
-                        for channel in self.masterChannelList[master]:
-                            # assigning new master to resampled channels
-                            self.set_channel_master(
-                                channel, master_channel_name)
-                        # merging channel lists
-                        self.masterChannelList[master_channel_name] += self.masterChannelList[master]
-                        # removing old master
-                        self.masterChannelList.pop(master)
-                        self.pop(master)
+            masters = [master for master in self.masterChannelList
+                       if self.get_channel_master_type(master) == master_channel_type]
+            self._resample_groups(masters, sampling, master_data, interpolation_kind, max_workers)
+            for master in masters:
+                # remove old master channel
+                if not master_channel_name == master:
+                    # removing previous master from list
+                    self.masterChannelList[master].remove(master)
+                    for channel in self.masterChannelList[master]:
+                        # assigning new master to resampled channels
+                        self.set_channel_master(
+                            channel, master_channel_name)
+                    # merging channel lists
+                    self.masterChannelList[master_channel_name] += self.masterChannelList[master]
+                    # removing old master
+                    self.masterChannelList.pop(master)
+                    self.pop(master)
         else:
             warn('no data to be resampled')
 
-    def resample_group(self, sampling, channel, new_master_data=None, interpolation_kind=None):
+    def resample_group(self, sampling, channel, new_master_data=None, interpolation_kind=None,
+                       max_workers=1):
         """ Resamples one channel along with its dataGroup
 
         Parameters
@@ -737,71 +1005,261 @@ class Mdf(Mdf4, Mdf3):
             interpolation type for floating data from scipy interp1d list (‘linear’, ‘nearest’, ‘zero’,
              ‘slinear’, ‘quadratic’, ‘cubic’, ‘previous’, ‘next’)
 
+        max_workers : int, optional
+            number of threads interpolating blocks of channels in parallel,
+            number of CPUs if None, 1 (default) to resample serially
+
         Notes
         --------
-        Resampling will convert all channels so be careful for big files
-        and memory consumption
+        Channels are converted before resampling unless their conversion
+        commutes with interpolation, see _raw_resampling()
         """
-        def interp_close_point(x, new_x, kind):
-            # interpolates with closest point at 'kind' side
-            idx = searchsorted(x, new_x, side=kind)
-            idx -= 1
-            if len(idx) == 0:
-                return idx
-            idx = clip(idx, 0, idx[-1])
-            return idx
+        self._resample_groups([self.get_channel_master(channel)], sampling,
+                              new_master_data, interpolation_kind, max_workers)
 
-        def interpolate(new_x, x, y, interpolation_kind):
-            # select right interpolation method depending of
-            # interpolation kind and data type
-            if interpolation_kind is None:
-                if y.dtype.kind == 'f':
-                    return interp(new_x, x, y)
-                else:
-                    return y[interp_close_point(x, new_x, 'right')]
+    def _resample_groups(self, masters, sampling, new_master_data, interpolation_kind, max_workers=1):
+        """ resamples data groups, blocks of channels being interpolated by a thread pool
+
+        Parameters
+        ----------------
+        masters : list of str
+            master channel names of data groups to be resampled
+        sampling : float
+            resampling interval, used if new_master_data is None
+        new_master_data : array or None
+            master channel data to be applied to all data groups
+        interpolation_kind : str, optional
+            interpolation type, see resample_group()
+        max_workers : int, optional
+            number of threads, number of CPUs if None, 1 (default) to resample
+            one data group after the other
+
+        Notes
+        --------
+        Conversions and channel removals are done serially before interpolation,
+        numpy interpolation of blocks releasing the GIL runs in threads and
+        each data group is updated as soon as all its blocks are interpolated,
+        releasing its original data.
+        """
+        def prepare(master_channel):
+            old_master_data = self.get_channel_data(master_channel)
+            if new_master_data is None:
+                group_master_data = arange(
+                    old_master_data[0], old_master_data[-1], sampling)
             else:
-                if interpolation_kind == 'previous':
-                    return y[interp_close_point(x, new_x, 'left')]
-                elif interpolation_kind == 'next':
-                    return y[interp_close_point(x, new_x, 'right')]
-                elif y.dtype.kind not in ('U', 'S'):
-                    from scipy.interpolate import interp1d
-                    f = interp1d(x, y, kind=interpolation_kind,
-                                 fill_value="extrapolate")
-                    return f(new_x)
-                else:
-                    return y[interp_close_point(x, new_x, 'right')]
-
-        master_channel = self.get_channel_master(channel)
-        old_master_data = self.get_channel_data(master_channel)
-        if new_master_data is None:
-            new_master_data = arange(
-                old_master_data[0], old_master_data[-1], sampling)
-        for Name in self.masterChannelList[master_channel]:
-            # forces list() because masterChannelList is dynamic, channels can be removed
-            if Name == master_channel:  # master channel
-                self.set_channel_data(Name, new_master_data)
+                group_master_data = new_master_data
+            blocks = self._resample_blocks(master_channel, old_master_data, interpolation_kind)
+            return group_master_data, _MasterInterpolator(old_master_data, group_master_data), blocks
+
+        if max_workers == 1:  # one data group at a time
+            for master_channel in masters:
+                group_master_data, interpolator, blocks = prepare(master_channel)
+                resampled, failed = self._interpolate_blocks(blocks, interpolator, interpolation_kind)
+                del blocks
+                self._set_resampled_group(master_channel, interpolator.x, group_master_data,
+                                          interpolation_kind, resampled, failed)
+            return
+        if max_workers is None:
+            max_workers = cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            groups = {}
+            futures = {}
+            for master_channel in masters:
+                group_master_data, interpolator, blocks = prepare(master_channel)
+                if not blocks:  # only master channel to be resampled
+                    self._set_resampled_group(master_channel, interpolator.x, group_master_data,
+                                              interpolation_kind, [], [])
+                    continue
+                groups[master_channel] = [group_master_data, interpolator, len(blocks), [], []]
+                for block in blocks:
+                    futures[pool.submit(self._interpolate_blocks, [block], interpolator,
+                                        interpolation_kind)] = master_channel
+                del blocks
+            for future in as_completed(futures):
+                master_channel = futures.pop(future)
+                group = groups[master_channel]
+                resampled, failed = future.result()
+                group[3].extend(resampled)
+                group[4].extend(failed)
+                group[2] -= 1
+                if not group[2]:  # all blocks of group interpolated, updated and released
+                    group_master_data, interpolator, _, resampled, failed = groups.pop(master_channel)
+                    self._set_resampled_group(master_channel, interpolator.x, group_master_data,
+                                              interpolation_kind, resampled, failed)
+
+    def _set_resampled_group(self, master_channel, old_master_data, new_master_data,
+                             interpolation_kind, resampled, failed):
+        """ updates data group with resampled channels
+
+        Parameters
+        ----------------
+        master_channel : str
+            master channel name of data group
+        old_master_data : array
+            master channel data before resampling
+        new_master_data : array
+            new master channel data
+        interpolation_kind : str, optional
+            interpolation type, see resample_group()
+        resampled : list
+            (channel names, resampled data) as returned by _interpolate_blocks()
+        failed : list
+            names of channels that could not be interpolated
+        """
+        if failed and not all(diff(old_master_data) > 0):
+            warn('{} has non regularly increasing master channel {}.\n'
+                 ' Faulty samples will be dropped in related data group'.
+                 format(', '.join(failed), master_channel))
+            self._clean_uneven_master_data(master_channel)
+            old_master_data = self.get_channel_data(master_channel)
+            blocks = self._resample_blocks(master_channel, old_master_data, interpolation_kind)
+            resampled, failed = self._interpolate_blocks(
+                blocks, _MasterInterpolator(old_master_data, new_master_data), interpolation_kind)
+        if master_channel in self.masterChannelList[master_channel]:
+            self.set_channel_data(master_channel, new_master_data)
+            self.remove_channel_conversion(master_channel)
+        # channels keep their conversion when resampled as raw data
+        for names, data in resampled:
+            for row, name in enumerate(names):
+                self.set_channel_data(name, data[row])
+
+    def _raw_resampling(self, channel_data, conversion, interpolation_kind):
+        """ checks if raw data can be resampled and converted afterwards
+
+        Parameters
+        ----------------
+        channel_data : array
+            channel raw data
+        conversion : dict
+            channel conversion, empty if no conversion
+        interpolation_kind : str or None
+            interpolation type, see resample_group()
+
+        Returns
+        -----------
+        raw : bool
+            True if resampling raw data and converting it gives the same
+            values than resampling converted data
+        linear : bool
+            True if raw data must be linearly interpolated like converted data would be
+        """
+        if not isinstance(channel_data, ndarray):  # compressed data
+            return False, False
+        if not conversion:
+            return True, False
+        if channel_data.dtype.kind not in ('b', 'i', 'u', 'f'):
+            return False, False
+        if self.MDFVersionNumber < 400:
+            if conversion['type'] == 0:
+                offset, gain = conversion['parameters']['P1'], conversion['parameters']['P2']
             else:
-                channel_data = self.get_channel_data(Name)
-                if channel_data.dtype.kind not in ('S', 'U', 'V') and channel_data.ndim == 1:
-                    # if channel not array of string
-                    try:
-                        self.set_channel_data(Name, interpolate(new_master_data, old_master_data,
-                                                                channel_data, interpolation_kind))
-                    except Exception:
-                        if not all(diff(old_master_data) > 0):
-                            warn('{} has non regularly increasing master channel {}.\n'
-                                 ' Faulty samples will be dropped in related data group'.
-                                 format(Name, master_channel))
-                            self._clean_uneven_master_data(master_channel)
-                            self.set_channel_data(Name, interpolate(new_master_data, old_master_data,
-                                                                    channel_data, interpolation_kind))
-                        elif old_master_data is not None and len(old_master_data) != len(channel_data):
-                            warn('{} and master channel {} do not have same length'.
-                                 format(Name, master_channel))
-                    self.remove_channel_conversion(Name)
-                else:  # can not interpolate strings, remove channel containing string
-                    self.remove_channel(Name)
+                offset = gain = None
+            numeric = conversion['type'] in _NUMERIC_CONVERSIONS3
+        else:
+            if conversion['type'] == 0:  # 1:1 conversion
+                return True, False
+            elif conversion['type'] == 1:
+                offset, gain = conversion['parameters']['cc_val'][:2]
+            else:
+                offset = gain = None
+            numeric = conversion['type'] in _NUMERIC_CONVERSIONS4
+        if gain == 1.0 and offset in (0.0, -0.0):  # conversion keeps raw data
+            return True, False
+        if interpolation_kind in ('previous', 'next', 'nearest'):
+            # physical values of interpolated samples
+            return numeric, False
+        if interpolation_kind in (None, 'linear') and gain is not None:
+            # linear conversion of linear interpolation, converted data is float
+            return True, interpolation_kind is None
+        return False, False
+
+    def _resample_blocks(self, master_channel, old_master_data, interpolation_kind=None):
+        """ groups channels of a data group into blocks to be resampled together
+
+        Parameters
+        ----------------
+        master_channel : str
+            master channel name of the data group
+        old_master_data : array
+            master channel data
+        interpolation_kind : str, optional
+            interpolation type, see resample_group()
+
+        Returns
+        -----------
+        list of (channel names, list of channel data, linear) having the same
+        dtype, linear flag forces linear interpolation.
+        Channels containing strings or arrays are removed, channels which
+        conversion does not commute with interpolation are converted.
+        """
+        same_dtype = {}
+        blocks = []
+        for name in list(self.masterChannelList[master_channel]):
+            # list() because masterChannelList is dynamic, channels can be removed
+            if name == master_channel:
+                continue
+            channel_data = self.get_channel_data(name, raw_data=True)
+            raw, linear = self._raw_resampling(channel_data, self.get_channel_conversion(name),
+                                               interpolation_kind)
+            if not raw:
+                channel_data = self.get_channel_data(name)
+                self.set_channel_data(name, channel_data)
+                self.remove_channel_conversion(name)
+            if channel_data.dtype.kind in ('S', 'U', 'V') or channel_data.ndim != 1:
+                # can not interpolate strings, remove channel containing string
+                self.remove_channel(name)
+            elif len(old_master_data) != len(channel_data):
+                warn('{} and master channel {} do not have same length'.
+                     format(name, master_channel))
+            else:
+                key = (channel_data.dtype, linear)
+                block = same_dtype.get(key)
+                if block is None or len(block[0]) >= _RESAMPLE_BLOCK_SIZE:
+                    block = ([], [], linear)
+                    same_dtype[key] = block
+                    blocks.append(block)
+                block[0].append(name)
+                block[1].append(channel_data)
+        return blocks
+
+    @staticmethod
+    def _interpolate_blocks(blocks, interpolator, interpolation_kind):
+        """ interpolates blocks of channels sharing the same master
+
+        Parameters
+        ----------------
+        blocks : list
+            (channel names, list of channel data, linear) as returned by _resample_blocks()
+        interpolator : _MasterInterpolator
+            interpolator from old to new master channel data
+        interpolation_kind : str, optional
+            interpolation type, see resample_group()
+
+        Returns
+        -----------
+        resampled : list
+            (channel names, resampled data in same order)
+        failed : list
+            names of channels that could not be interpolated
+        """
+        resampled = []
+        failed = []
+        for names, data, linear in blocks:
+            try:
+                if linear:
+                    resampled.append((names, interpolator.linear(data)))
+                else:
+                    resampled.append((names, interpolator.interpolate(data, interpolation_kind)))
+            except Exception:
+                if len(data) == 1:
+                    failed.extend(names)
+                else:  # isolates faulty channels
+                    singles = [([name], [channel_data], linear) for name, channel_data in zip(names, data)]
+                    single_resampled, single_failed = Mdf._interpolate_blocks(
+                        singles, interpolator, interpolation_kind)
+                    resampled.extend(single_resampled)
+                    failed.extend(single_failed)
+        return resampled, failed
 
     def _clean_uneven_master_data(self, master_channel_name):
         """ clean data group having non evenly increasing master
@@ -820,6 +1278,331 @@ class Mdf(Mdf4, Mdf3):
             data.mask = mask
             self.set_channel_data(channel, data.compressed())
 
+    def resample_to_file(self, file_name, sampling, channel_list=None, interpolation_kind=None,
+                         file_format='mdf4', chunk_size=None):
+        """ Resamples data groups chunk by chunk and writes them into a new file
+
+        Parameters
+        ----------------
+        file_name : str
+            name of the new file
+        sampling : float
+            resampling interval
+        channel_list : list of str, optional
+            channels to be resampled with their master channel, all channels by default
+        interpolation_kind : str, optional
+            interpolation type for floating data from scipy interp1d list (‘linear’, ‘nearest’, ‘zero’,
+             ‘slinear’, ‘quadratic’, ‘cubic’, ‘previous’, ‘next’)
+        file_format : str, optional
+            'mdf4' (default) or 'hdf5'
+        chunk_size : int, optional
+            maximum number of record bytes read at once, 100MB by default
+
+        Notes
+        --------
+        Meant for files bigger than memory read with no_data_loading=True. Sorted mdf4
+        data groups without variable length or data stream channels are read chunk by chunk,
+        other data groups (mdf3, unsorted, etc.) are read one at a time. Each chunk is
+        resampled and written before reading the next one.
+
+        Each data group is resampled from its first master sample like resample_group()
+        and gives the same result, except interpolation kinds like 'quadratic' or 'cubic'
+        that are computed per chunk. Channels containing strings or arrays are not written.
+        Dependency: h5py for hdf5 file format
+        """
+        if file_format == 'hdf5':
+            try:
+                import h5py
+            except ImportError:
+                warn('h5py not found')
+                return
+        elif file_format != 'mdf4':
+            raise ValueError('unknown file format {}'.format(file_format))
+        if chunk_size is None:
+            chunk_size = chunk_size_reading
+        if channel_list is not None:
+            channel_list = set(channel_list)
+        master_type_dict = {0: 'None', 1: 'Time', 2: 'Angle',
+                            3: 'Distance', 4: 'Index', None: 'None'}
+
+        if file_format == 'mdf4':
+            fid = open(file_name, 'wb')
+            pointer = self._write4_header(fid)
+            dg = None
+        else:
+            f = h5py.File(file_name, 'w')  # create hdf5 file
+            # create group in root associated to file
+            file_group = f.create_group(basename(file_name))
+            file_group.attrs['Time'] = self.fileMetadata['time']
+        for master in self.masterChannelList:
+            if master not in self.masterChannelList[master]:
+                warn('no master channel in data group of {}, not resampled'.format(
+                    ', '.join(self.masterChannelList[master])))
+                continue
+            channels = [master] + [channel for channel in self.masterChannelList[master]
+                                   if channel != master and channel.find('invalid_bytes') == -1 and
+                                   (channel_list is None or channel in channel_list)]
+            if len(channels) == 1 and channel_list is not None and master not in channel_list:
+                continue  # no channel requested in data group
+            conversions, chunks = self._read_group_chunks(channels, chunk_size)
+            chunks = self._resample_chunks(channels, conversions, chunks, sampling, interpolation_kind)
+            first = next(chunks, None)
+            if first is None:  # no data
+                continue
+            names = first[0]
+            chunks = chain([first[1]], (data for _, data in chunks))
+            if file_format == 'mdf4':
+                dg, pointer = self._write4_stream_group(fid, pointer, master, names, chunks)
+            else:
+                grp = file_group.create_group(_convert_to_hdf5_name(master))
+                grp.attrs[masterField] = master
+                grp.attrs[masterTypeField] = master_type_dict[self.get_channel_master_type(master)]
+                datasets = []
+                for name, data in zip(names, first[1]):
+                    dset = grp.create_dataset(_convert_to_hdf5_name(name), shape=(0, ),
+                                              maxshape=(None, ), dtype=data.dtype, chunks=True)
+                    for field, value in ((unitField, self.get_channel_unit(name)),
+                                         (descriptionField, self.get_channel_desc(name))):
+                        if value:
+                            dset.attrs[field] = value
+                    datasets.append(dset)
+                for data in chunks:
+                    for dset, channel_data in zip(datasets, data):
+                        n_records = dset.shape[0]
+                        dset.resize((n_records + len(channel_data), ))
+                        dset[n_records:] = channel_data
+        if file_format == 'mdf4':
+            if dg is not None:
+                fid.seek(dg['block_start'] + 24)
+                fid.write(pack('Q', 0))  # last DG pointer is null
+            fid.close()
+        else:
+            f.close()
+
+    def _read_group_chunks(self, channels, chunk_size):
+        """ reads channels of a data group chunk by chunk
+
+        Parameters
+        ----------------
+        channels : list of str
+            channel names of the same data group
+        chunk_size : int
+            maximum number of record bytes read at once
+
+        Returns
+        -----------
+        conversions : list
+            conversion of each channel, None if channel data is already converted
+        chunks : iterator
+            lists of channel data chunks in channels order
+        """
+        if self._noDataLoading and self.MDFVersionNumber >= 400:
+            data_group, channel_group = self[channels[0]][idField][0][:2]
+            info = self.info
+            if len(info['CG'][data_group]) == 1:  # sorted data group
+                record = Record(data_group, channel_group)
+                record.load_info(info)
+                channel_numbers = [self[channel][idField][0][2] for channel in channels]
+                if not (record.VLSD or record.VLSC or record.DS or record.CANOpen) and \
+                        all([number in record and record[number].channelType not in (3, 6)
+                             for number in channel_numbers]):
+                    names = [record[number].name for number in channel_numbers]
+                    # conversions are not kept without data
+                    conversions = [_channel_conversion4(record[number].conversion(info))
+                                   for number in channel_numbers]
+
+                    def read_chunks():
+                        (fid, file_name, zipfile) = _open_mdf(self.fileName)
+                        buf = Data(fid, info['DG'][data_group]['dg_data'])
+                        try:
+                            for rec in buf.iter_chunks(record, info, set(names), chunk_size):
+                                yield [rec[name] for name in names]
+                        finally:
+                            fid.close()
+                    return conversions, read_chunks()
+        if self._noDataLoading:  # reads whole data group
+            group = Mdf(self.fileName, channel_list=channels)
+            data = [group.get_channel_data(channel) for channel in channels]
+            conversions = [None] * len(channels)
+        elif self.MDFVersionNumber >= 400:  # data in memory, raw if not compressed
+            data = [self.get_channel_data(channel, raw_data=True) for channel in channels]
+            conversions = [self.get_channel_conversion(channel) for channel in channels]
+            for position, channel in enumerate(channels):
+                if not isinstance(data[position], ndarray):
+                    data[position] = self.get_channel_data(channel)
+                    conversions[position] = None
+        else:
+            data = [self.get_channel_data(channel) for channel in channels]
+            conversions = [None] * len(channels)
+        record_length = sum([channel_data.itemsize * (channel_data.size // max(len(channel_data), 1))
+                             for channel_data in data])
+        n_records = max(1, chunk_size // max(record_length, 1))
+        return conversions, ([channel_data[index: index + n_records] for channel_data in data]
+                             for index in range(0, len(data[0]), n_records))
+
+    def _resample_chunks(self, channels, conversions, chunks, sampling, interpolation_kind=None):
+        """ resamples data group read chunk by chunk, see resample_to_file()
+
+        Parameters
+        ----------------
+        channels : list of str
+            channel names, master channel first
+        conversions : list
+            conversion of raw channel data, None if data already converted
+        chunks : iterable
+            lists of channel data chunks in channels order
+        sampling : float
+            resampling interval
+        interpolation_kind : str, optional
+            interpolation type, see resample_group()
+
+        Yields
+        --------
+        (channel names, list of resampled and converted data), master channel first.
+        Channels containing strings or arrays are removed.
+
+        Notes
+        --------
+        Last samples of previous chunk are prepended to each chunk so that new master
+        samples between two chunks are interpolated like when resampling the whole group.
+        """
+        plan = None
+        previous = None
+        start = delta = None
+        index = 0
+        chunks = iter(chunks)
+        chunk = next(chunks, None)
+        while chunk is not None:
+            next_chunk = next(chunks, None)  # to identify last chunk
+            if plan is None:  # (position, raw, linear, conversion) of resampled channels
+                plan = [(0, False, False, conversions[0])]
+                for position in range(1, len(channels)):
+                    raw, linear = self._raw_resampling(chunk[position], conversions[position],
+                                                       interpolation_kind)
+                    channel_data = chunk[position]
+                    if not raw and conversions[position]:
+                        channel_data = self._convert_chunk(channels[position], channel_data,
+                                                           conversions[position])
+                    if channel_data.dtype.kind not in ('S', 'U', 'V', 'O') and channel_data.ndim == 1:
+                        plan.append((position, raw, linear, conversions[position]))
+                names = [channels[position] for position, _, _, _ in plan]
+            data = []
+            for position, raw, _, conversion in plan:
+                channel_data = chunk[position]
+                if not raw and conversion:
+                    channel_data = self._convert_chunk(channels[position], channel_data, conversion)
+                data.append(channel_data)
+            if previous is not None:
+                data = [concatenate((previous_data, channel_data))
+                        for previous_data, channel_data in zip(previous, data)]
+            old_master_data = data[0]
+            if start is None:
+                start = old_master_data[0]
+                delta = (start + sampling) - start  # same samples as arange(start, stop, sampling)
+            stop = max(int(ceil((old_master_data[-1] - start) / sampling)), index)
+            if next_chunk is not None:  # new samples before the last old one
+                while stop > index and start + (stop - 1) * delta >= old_master_data[-1]:
+                    stop -= 1
+                while start + stop * delta < old_master_data[-1]:
+                    stop += 1
+            new_master_data = start + arange(index, stop) * delta
+            interpolator = _MasterInterpolator(old_master_data, new_master_data)
+            same_dtype = {}
+            blocks = []
+            for row in range(1, len(plan)):
+                key = (data[row].dtype, plan[row][2])
+                block = same_dtype.get(key)
+                if block is None or len(block[0]) >= _RESAMPLE_BLOCK_SIZE:
+                    block = ([], [], plan[row][2])
+                    same_dtype[key] = block
+                    blocks.append(block)
+                block[0].append(row)
+                block[1].append(data[row])
+            resampled, failed = self._interpolate_blocks(blocks, interpolator, interpolation_kind)
+            results = [new_master_data] + [None] * (len(plan) - 1)
+            for rows, block_data in resampled:
+                for block_row, row in enumerate(rows):
+                    results[row] = block_data[block_row]
+            for row in failed:
+                warn('{} could not be interpolated, taking next samples'.format(names[row]))
+                results[row] = interpolator.interpolate([data[row]], 'next')[0]
+            for row in range(1, len(plan)):
+                position, raw, _, conversion = plan[row]
+                if raw and conversion:
+                    results[row] = self._convert_chunk(names[row], results[row], conversion)
+            yield names, results
+            previous = [channel_data[-_RESAMPLE_OVERLAP:].copy() for channel_data in data]
+            index = stop
+            chunk = next_chunk
+
+    def _convert_chunk(self, channel_name, data, conversion):
+        """ converts raw data of a channel
+
+        Parameters
+        ----------------
+        channel_name : str
+            channel name
+        data : array
+            raw data
+        conversion : dict
+            channel conversion
+
+        Returns
+        -----------
+        converted data
+        """
+        return self._convert_channel_data4({dataField: data, conversionField: conversion},
+                                           channel_name, self.convertTables)[channel_name]
+
+    def _export_groups(self, channel_list=None, chunk_size=None, raw=False):
+        """ iterates master channel groups read chunk by chunk for streaming exports
+
+        Parameters
+        ----------------
+        channel_list : list of str, optional
+            channels to be exported with their master channel, all channels by default
+        chunk_size : int, optional
+            maximum number of record bytes read at once, 100MB by default
+        raw : bool, optional
+            keeps raw data of channels having numeric conversion (mdf4 only)
+
+        Yields
+        --------
+        (master, channels, conversions, chunks) with master channel first in channels if
+        existing, conversions of raw channels (None if data is converted) and chunks an
+        iterator of lists of channel data in channels order
+
+        Notes
+        --------
+        With no_data_loading=True, sorted mdf4 data groups are read chunk by chunk
+        from file, other data groups one at a time.
+        """
+        if chunk_size is None:
+            chunk_size = chunk_size_reading
+        if channel_list is not None:
+            channel_list = set(channel_list)
+        for master, group in self.masterChannelList.items():
+            channels = [channel for channel in group
+                        if channel != master and channel.find('invalid_bytes') == -1 and
+                        (channel_list is None or channel in channel_list)]
+            if not channels and channel_list is not None and master not in channel_list:
+                continue  # no channel requested in data group
+            if master in group:
+                channels.insert(0, master)
+            if not channels:
+                continue
+            conversions, chunks = self._read_group_chunks(channels, chunk_size)
+            keep = [bool(raw and conversion and conversion.get('type') in _NUMERIC_CONVERSIONS4)
+                    for conversion in conversions]
+
+            def convert(chunks=chunks, channels=channels, conversions=conversions, keep=keep):
+                for chunk in chunks:
+                    yield [channel_data if keep[position] or not conversions[position]
+                           else self._convert_chunk(channels[position], channel_data, conversions[position])
+                           for position, channel_data in enumerate(chunk)]
+            yield master, channels, [conversion if kept else None
+                                     for conversion, kept in zip(conversions, keep)], convert()
+
     def cut(self, master_channel, begin=None, end=None):
         """ Cut data
 
@@ -837,6 +1620,9 @@ class Mdf(Mdf4, Mdf3):
         Notes
         ------
         Only the data groups with same master type as master_channel will be cut (only for mdf4)
+        Channel data are replaced by views of raw data, conversions are kept and
+        compressed data are only cut at decompression.
+        To read only part of a file, use read(..., cut=(master_channel, begin, end))
 
         """
         if begin is None and end is None:
@@ -865,11 +1651,15 @@ class Mdf(Mdf4, Mdf3):
                         self.set_channel_data(channel, array([]))
                 else:
                     for channel in self.masterChannelList[master]:
-                        data = self.get_channel_data(channel)
-                        self.set_channel_data(
-                            channel, data[start_index: end_index])
+                        data = self._get_channel_field(channel, field=dataField)
+                        if isinstance(data, CompressedData):
+                            data = data.cut(start_index, end_index)
+                        else:
+                            data = self.get_channel_data(channel, raw_data=True)[start_index: end_index]
+                        self.set_channel_data(channel, data)
 
-    def export_to_csv(self, file_name=None, sampling=None):
+    def export_to_csv(self, file_name=None, sampling=None, resample=True, float_format=None,
+                      chunk_size=100000, max_workers=1):
         """ Exports mdf data into CSV file
 
         Parameters
@@ -880,18 +1670,33 @@ class Mdf(Mdf4, Mdf3):
         sampling : float, optional
             sampling interval. None by default
 
+        resample : bool, optional
+            resamples all data groups into one before export, True by default.
+            If False, each master channel group is written in its own file named
+            file_name with appended group index, or file_name if only one group
+
+        float_format : str, optional
+            printf style format of floating point values, '%.6g' for instance.
+            Shortest representation recovering the value by default
+
+        chunk_size : int, optional
+            number of rows formatted at once
+
+        max_workers : int, optional
+            number of threads formatting blocks of rows, written in order
+
         Notes
         --------
-        Data saved in CSV file be automatically resampled as it is difficult to save in this format
-        data not sharing same master channel -> not applicable for mdf4 in case there are master channels
-         with various types
+        Only 1D numeric channels are exported, masked values are left empty.
+        Blocks of rows are formatted column by column with numpy string functions,
+        each column being converted only once, rows are then joined in linear time.
         Warning: this can be slow for big data, CSV is text format after all
 
         """
 
         if self:  # data in mdf
-            import csv
-            self.resample(sampling)
+            if resample:
+                self.resample(sampling)
             if file_name is None:
                 file_name = splitext(self.fileName)[0]
                 file_name = file_name + '.csv'
@@ -899,38 +1704,66 @@ class Mdf(Mdf4, Mdf3):
                 encoding = 'utf8'  # mdf4 encoding is unicode
             else:
                 encoding = 'latin-1'  # mdf3 encoding is latin-1
-            # writes header
-            f = open(file_name, "wt", encoding=encoding)
-            writer = csv.writer(f, dialect=csv.excel)
-            writer.writerow([name for name in self
-                             if self.get_channel_data(name).dtype.kind not in ('S', 'U', 'V')
-                             and self.get_channel_data(name).ndim <= 1])  # writes channel names
-            # writes units
-            writer.writerow([self.get_channel_unit(name)
-                             for name in self
-                             if self.get_channel_data(name).dtype.kind not in ('S', 'U', 'V')
-                             and self.get_channel_data(name).ndim <= 1])  # writes units
-            # concatenate all channels (1D numeric only, same length)
-            temp = []
-            ref_len = None
-            for name in self:
-                data = self.get_channel_data(name)
-                if data.dtype.kind not in ('S', 'U', 'V') and data.ndim == 1:
-                    if ref_len is None:
-                        ref_len = len(data)
-                    if len(data) == ref_len:
-                        temp.append(data.transpose())
-            if temp:
-                buf = vstack(temp)
-                buf = buf.transpose()
-                # Write all rows
-                r, c = buf.shape
-                writer.writerows([list(buf[i, :]) for i in range(r)])
-            f.close()
+            if resample:
+                groups = [list(self)]
+            else:
+                groups = [channels for channels in self.masterChannelList.values() if channels]
+            for index, group in enumerate(groups):
+                if len(groups) > 1:
+                    group_file_name = '{0}_{1}{2}'.format(splitext(file_name)[0], index, splitext(file_name)[1])
+                else:
+                    group_file_name = file_name
+                self._export_group_to_csv(group_file_name, group, encoding, float_format,
+                                          chunk_size, max_workers)
         else:
             warn('no data to be exported')
 
-    def export_to_NetCDF(self, file_name=None, sampling=None):
+    def _export_group_to_csv(self, file_name, channels, encoding, float_format, chunk_size, max_workers):
+        """ writes channels of same length in CSV file, block of rows by block of rows
+
+        Parameters
+        ----------------
+        file_name : str
+            file name
+        channels : list of str
+            channel names
+        encoding : str
+            file encoding
+        float_format : str or None
+            printf style format of floating point values
+        chunk_size : int
+            number of rows formatted at once
+        max_workers : int
+            number of threads formatting blocks of rows
+        """
+        import csv
+        names = []
+        columns = []
+        for name in channels:
+            data = self.get_channel_data(name)
+            if data is not None and data.dtype.kind not in ('S', 'U', 'V') and data.ndim == 1:
+                if columns and len(data) != len(columns[0]):
+                    continue  # all channels of same length
+                names.append(name)
+                columns.append(data)
+        with open(file_name, 'wt', encoding=encoding, newline='') as f:
+            writer = csv.writer(f, dialect=csv.excel)
+            writer.writerow(names)  # writes channel names
+            writer.writerow([self.get_channel_unit(name) for name in names])  # writes units
+            if not columns:
+                return
+            n_rows = len(columns[0])
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                blocks = deque()
+                for start in chain(range(0, n_rows, chunk_size), [None]):
+                    if start is not None:
+                        blocks.append(executor.submit(_csv_rows, columns, start,
+                                                      min(start + chunk_size, n_rows), float_format))
+                    while blocks and (start is None or len(blocks) > max_workers):
+                        f.write(blocks.popleft().result())
+
+    def export_to_NetCDF(self, file_name=None, sampling=None, zlib=False, complevel=4, chunks=None,
+                         chunk_size=None):
         """Exports mdf data into netcdf file
 
         Parameters
@@ -941,15 +1774,39 @@ class Mdf(Mdf4, Mdf3):
         sampling : float, optional
             sampling interval
 
+        zlib : bool, optional
+            deflate compression of variables (netCDF4 only)
+
+        complevel : int, optional
+            deflate compression level, 1-9, 4 by default (netCDF4 only)
+
+        chunks : int, optional
+            number of samples per variable chunk, automatic by default (netCDF4 only)
+
+        chunk_size : int, optional
+            maximum number of record bytes read at once from file, 100MB by default (netCDF4 only)
+
         Notes
         --------
-        Dependency: scipy
+        With netCDF4 or h5netcdf installed, a netCDF4 file is written having one unlimited
+        dimension per master channel group. Data groups are appended chunk by chunk,
+        read from file if mdf was read with no_data_loading=True, so no resampling is needed.
+        Otherwise, netCDF3 file is written with scipy.
+        Dependency: netCDF4, h5netcdf or scipy
         """
         try:
-            from scipy.io import netcdf
+            from netCDF4 import Dataset
         except ImportError:
-            warn('scipy.io module not found')
-            return
+            try:
+                from h5netcdf.legacyapi import Dataset
+            except ImportError:
+                Dataset = None
+        if Dataset is None:
+            try:
+                from scipy.io import netcdf
+            except ImportError:
+                warn('netCDF4, h5netcdf or scipy.io module not found')
+                return
 
         def clean_name(name):
             allowed_str = ' ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-+_.@'
@@ -970,11 +1827,26 @@ class Mdf(Mdf4, Mdf3):
                 setattr(f, name, value)
             else:
                 pass
-        if sampling is not None:
+        if sampling is not None and self._noDataLoading:
+            warn('sampling ignored with no_data_loading, see resample_to_file()')
+        elif sampling is not None:
             self.resample(sampling)
         if file_name is None:
             file_name = splitext(self.fileName)[0]
             file_name = file_name + '.nc'
+        if Dataset is not None:  # netCDF4 streaming
+            f = Dataset(file_name, 'w')
+            try:
+                setattr(f, 'Time', self.fileMetadata['time'])
+                set_attribute(f, 'Author', self.fileMetadata['author'])
+                set_attribute(f, 'Organization', self.fileMetadata['organisation'])
+                set_attribute(f, 'ProjectName', self.fileMetadata['project'])
+                set_attribute(f, 'Subject', self.fileMetadata['subject'])
+                set_attribute(f, 'Comment', self.fileMetadata['comment'])
+                self._write_netcdf4_groups(f, clean_name, set_attribute, zlib, complevel, chunks, chunk_size)
+            finally:
+                f.close()
+            return
         f = netcdf.netcdf_file(file_name, 'w')
         setattr(f, 'Time', self.fileMetadata['time'])
         set_attribute(f, 'Author', self.fileMetadata['author'])
@@ -1029,7 +1901,90 @@ class Mdf(Mdf4, Mdf3):
             var[name] = self.get_channel_data(name)
         f.close()
 
-    def export_to_hdf5(self, file_name=None, sampling=None, compression=None, compression_opts=None):
+    def _write_netcdf4_groups(self, f, clean_name, set_attribute, zlib, complevel, chunks, chunk_size):
+        """ appends master channel groups chunk by chunk into netCDF4 dataset
+
+        Parameters
+        ----------------
+        f : netCDF4.Dataset or h5netcdf.legacyapi.Dataset
+            opened dataset
+        clean_name : function
+            returns name with netcdf allowed characters
+        set_attribute : function
+            sets non empty attribute
+        zlib : bool
+            deflate compression
+        complevel : int
+            deflate compression level
+        chunks : int or None
+            number of samples per variable chunk
+        chunk_size : int or None
+            maximum number of record bytes read at once
+        """
+        if self.MDFVersionNumber >= 400:
+            encoding = 'utf-8'  # mdf4 encoding is unicode
+        else:
+            encoding = 'latin-1'  # mdf3 encoding is latin-1
+        n_groups = 0
+        for master, channels, conversions, group_chunks in self._export_groups(chunk_size=chunk_size):
+            n_groups += 1
+            dimension = clean_name(master) if master else ''
+            if not dimension or dimension in f.dimensions:
+                dimension = masterField + str(n_groups)
+            f.createDimension(dimension, None)  # unlimited
+            variables = None
+            n_records = 0
+            for chunk in group_chunks:
+                if variables is None:  # creates variables from first chunk
+                    variables = []
+                    for channel, channel_data in zip(channels, chunk):
+                        name = dimension if channel == master else clean_name(channel)
+                        if channel_data.dtype.kind == 'V' or not name or name in f.variables:
+                            warn('Can not export channel {} of type {}'.format(channel, channel_data.dtype))
+                            variables.append(None)
+                            continue
+                        dimensions = (dimension, )
+                        for axis, length in enumerate(channel_data.shape[1:]):
+                            dimensions += ('{}_dim{}'.format(name, axis), )
+                            f.createDimension(dimensions[-1], length)
+                        options = {}
+                        if channel_data.dtype.kind in ('S', 'U', 'O'):
+                            data_type = str  # variable length strings, not compressed
+                        else:
+                            data_type = 'u1' if channel_data.dtype.kind == 'b' else channel_data.dtype.str[1:]
+                            options['zlib'] = zlib
+                            options['complevel'] = complevel
+                            if chunks is not None:
+                                options['chunksizes'] = (chunks, ) + channel_data.shape[1:]
+                        variable = f.createVariable(name, data_type, dimensions, **options)
+                        set_attribute(variable, 'title', clean_name(channel))
+                        set_attribute(variable, 'units', self.get_channel_unit(channel))
+                        set_attribute(variable, 'Description', self.get_channel_desc(channel))
+                        if channel == master:
+                            set_attribute(variable, 'Type', 'Master Channel')
+                            set_attribute(variable, 'datatype', 'master')
+                        else:
+                            set_attribute(variable, 'Type', 'Data Channel')
+                        variables.append(variable)
+                for variable, channel_data in zip(variables, chunk):
+                    if variable is not None:
+                        channel_data = getdata(channel_data)
+                        if channel_data.dtype.kind == 'S':
+                            channel_data = char.decode(channel_data, encoding, 'replace').astype(object)
+                        elif channel_data.dtype.kind == 'U':
+                            channel_data = channel_data.astype(object)
+                        elif channel_data.dtype.kind == 'O':
+                            channel_data = array([value.decode(encoding, 'replace') if isinstance(value, bytes)
+                                                  else str(value) for value in channel_data], dtype=object)
+                        elif channel_data.dtype.kind == 'b':
+                            channel_data = channel_data.view('u1')
+                        elif channel_data.dtype.byteorder not in ('=', '|'):
+                            channel_data = channel_data.astype(channel_data.dtype.newbyteorder('='))
+                        variable[n_records: n_records + len(channel_data)] = channel_data
+                n_records += len(chunk[0])
+
+    def export_to_hdf5(self, file_name=None, sampling=None, compression=None, compression_opts=None,
+                       chunks=True, raw=False, chunk_size=None):
         """Exports mdf class data structure into hdf5 file
 
         Parameters
@@ -1049,10 +2004,24 @@ class Mdf(Mdf4, Mdf3):
             HDF5 gzip compression level, 0-9. Only valid if gzip compression is used.
             Level 4 (default) recommended for best balance between compression and time.
 
+        chunks : bool or int or tuple, optional
+            HDF5 datasets chunk shape, automatic by default. An int is the number of
+            samples per chunk.
+
+        raw : bool, optional
+            writes raw data of channels with numeric conversion, conversion type and
+            parameters being stored as dataset attributes (mdf4 only)
+
+        chunk_size : int, optional
+            maximum number of record bytes read at once from file, 100MB by default
+
         Notes
         --------
         The maximum attributes will be stored.
         Data structure will be similar has it is in masterChannelList attribute.
+        If mdf was read with no_data_loading=True or raw is requested, data groups are
+        read chunk by chunk from file, converted and appended to resizable datasets,
+        so memory needed is bounded by chunk_size. With sampling, see resample_to_file().
         Dependency: h5py
         """
         #
@@ -1073,11 +2042,25 @@ class Mdf(Mdf4, Mdf3):
                     pass
             else:
                 pass
-        if sampling is not None:
-            self.resample(sampling)
+
+        def dataset_chunks(shape, resizable=False):
+            # int chunks is number of samples, bounded by length of not resizable datasets
+            if not isinstance(chunks, int) or isinstance(chunks, bool):
+                return chunks
+            if resizable:
+                return (chunks, ) + tuple(shape[1:])
+            if not shape[0]:
+                return True
+            return (min(chunks, shape[0]), ) + tuple(shape[1:])
+
         if file_name is None:
             file_name = splitext(self.fileName)[0]
             file_name = file_name + '.hdf'
+        if sampling is not None and self._noDataLoading:
+            self.resample_to_file(file_name, sampling, file_format='hdf5', chunk_size=chunk_size)
+            return
+        if sampling is not None:
+            self.resample(sampling)
         if compression is not None:
             compression = compression.lower()
             if compression not in {'gzip', 'lzf'}:
@@ -1102,6 +2085,47 @@ class Mdf(Mdf4, Mdf3):
         set_attribute(file_group, 'Comment', self.fileMetadata['comment'])
         master_type_dict = {0: 'None', 1: 'Time', 2: 'Angle',
                             3: 'Distance', 4: 'Index', None: 'None'}
+        if self._noDataLoading or raw:  # streaming from file
+            n_groups = 0
+            for master, channels, conversions, group_chunks in self._export_groups(chunk_size=chunk_size, raw=raw):
+                if len(self.masterChannelList) > 1:
+                    n_groups += 1
+                    if master != '' and master is not None:
+                        grp = file_group.create_group(_convert_to_hdf5_name(master))
+                    else:
+                        grp = file_group.create_group(masterField + str(n_groups))
+                else:
+                    grp = file_group
+                set_attribute(grp, masterField, master)
+                set_attribute(grp, masterTypeField, master_type_dict[self.get_channel_master_type(master)])
+                datasets = None
+                for chunk in group_chunks:
+                    if datasets is None:  # creates datasets from first chunk
+                        datasets = []
+                        for channel, conversion, channel_data in zip(channels, conversions, chunk):
+                            if channel_data.dtype.kind in ('U', 'O') or channel_data.dtype.itemsize == 0:
+                                datasets.append(None)  # not supported type
+                                continue
+                            shape = channel_data.shape[1:]
+                            dset = grp.create_dataset(_convert_to_hdf5_name(channel), shape=(0, ) + shape,
+                                                      maxshape=(None, ) + shape, dtype=channel_data.dtype,
+                                                      chunks=dataset_chunks(channel_data.shape, True),
+                                                      compression=compression,
+                                                      compression_opts=compression_opts)
+                            set_attribute(dset, unitField, self.get_channel_unit(channel))
+                            set_attribute(dset, descriptionField, self.get_channel_desc(channel))
+                            if conversion is not None:  # raw data
+                                dset.attrs['conversion_type'] = conversion['type']
+                                for key, value in conversion['parameters'].items():
+                                    set_attribute(dset, key, value)
+                            datasets.append(dset)
+                    for dset, channel_data in zip(datasets, chunk):
+                        if dset is not None:
+                            n_records = dset.shape[0]
+                            dset.resize(n_records + len(channel_data), axis=0)
+                            dset[n_records:] = getdata(channel_data)
+            f.close()
+            return
         if len(self.masterChannelList) > 1:
             # if several time groups of channels, not resampled
             groups = {}
@@ -1132,7 +2156,7 @@ class Mdf(Mdf4, Mdf3):
                                                                   data=channel_data,
                                                                   compression=compression,
                                                                   compression_opts=compression_opts,
-                                                                  chunks=True)
+                                                                  chunks=dataset_chunks(channel_data.shape))
                     set_attribute(dset, unitField,
                                   self.get_channel_unit(channel))
                     if descriptionField in self[channel]:
@@ -1151,7 +2175,7 @@ class Mdf(Mdf4, Mdf3):
                     dset = file_group.create_dataset(channel_name, data=channel_data,
                                                      compression=compression,
                                                      compression_opts=compression_opts,
-                                                     chunks=True)
+                                                     chunks=dataset_chunks(channel_data.shape))
                     set_attribute(dset, unitField,
                                   self.get_channel_unit(channel))
                     if descriptionField in self[channel]:
@@ -1159,7 +2183,7 @@ class Mdf(Mdf4, Mdf3):
                                       self.get_channel_desc(channel))
         f.close()
 
-    def export_to_matlab(self, file_name=None):
+    def export_to_matlab(self, file_name=None, chunk_size=None, chunks=65536, compression=None):
         """Export mdf data into Matlab file preferrably in format 7.3
 
         Parameters
@@ -1167,14 +2191,38 @@ class Mdf(Mdf4, Mdf3):
         file_name : str, optional
             file name. If no name defined, it will use original mdf name and path
 
+        chunk_size : int, optional
+            maximum number of record bytes read at once from file, 100MB by default (h5py only)
+
+        chunks : int, optional
+            number of samples per HDF5 chunk of variables, 65536 by default (h5py only)
+
+        compression : str, optional
+            HDF5 compression, 'gzip' is readable by Matlab (h5py only)
+
         Notes
         --------
         This method will dump all data into Matlab file but you will loose below information:
         - unit and descriptions of channel
         - data structure, what is corresponding master channel to a channel.
         Channels might have then different lengths.
-        Dependency: hdf5storage, scipy
+        Units, descriptions and master types are kept in masterChannelList struct.
+        Masked samples are written as NaN for float channels, as the maximum of
+        their type for integer channels and as 255 for boolean channels.
+        With h5py, Matlab 7.3 file is written directly, channels being appended chunk by chunk
+        into chunked variables, read from file if mdf was read with no_data_loading=True.
+        Dependency: h5py, hdf5storage or scipy
         """
+        try:
+            import h5py
+        except ImportError:
+            h5py = None
+        if file_name is None:
+            file_name = splitext(self.fileName)[0]
+            file_name = file_name + '.mat'
+        if h5py is not None:
+            self._export_to_matlab73(h5py, file_name, chunk_size, chunks, compression)
+            return
         # export class data structure into .mat file
         try:
             from hdf5storage import savemat
@@ -1185,9 +2233,6 @@ class Mdf(Mdf4, Mdf3):
             except ImportError:
                 warn('scipy also module not found')
                 return
-        if file_name is None:
-            file_name = splitext(self.fileName)[0]
-            file_name = file_name + '.mat'
         # convert self into simple dict without and metadata
         temp = {'masterChannelList': {}}
         for master in self.masterChannelList:
@@ -1203,7 +2248,7 @@ class Mdf(Mdf4, Mdf3):
                     if data.dtype.base.name == 'float16':
                         temp[channel_name] = data.astype(float32)
                     if isinstance(data, MaskedArray):
-                        temp[channel_name] = data.filled()
+                        temp[channel_name] = _matlab_filled(data)
                     unit = self.get_channel_unit(channel)
                     desc = self.get_channel_desc(channel)
                     master = self.get_channel_master(channel)
@@ -1225,6 +2270,123 @@ class Mdf(Mdf4, Mdf3):
         except Exception:
             savemat(file_name, temp, long_field_names=True, format='5')
 
+    def _export_to_matlab73(self, h5py, file_name, chunk_size, chunks, compression):
+        """ writes Matlab 7.3 file with h5py, channel groups being appended chunk by chunk
+
+        Parameters
+        ----------------
+        h5py : module
+            h5py
+        file_name : str
+            file name
+        chunk_size : int or None
+            maximum number of record bytes read at once
+        chunks : int
+            number of samples per HDF5 chunk
+        compression : str or None
+            HDF5 compression
+        """
+        def set_class(obj, matlab_class):
+            obj.attrs['MATLAB_class'] = bytes_(matlab_class)
+            if matlab_class == 'logical':
+                obj.attrs['MATLAB_int_decode'] = int32(1)
+
+        def create_struct(parent, name, fields):
+            # fields is dict of field name: str, int or dict (struct)
+            struct = parent.create_group(name)
+            set_class(struct, 'struct')
+            field_names = empty(len(fields), dtype=object)
+            for position, (field, value) in enumerate(fields.items()):
+                field_names[position] = array(list(field), dtype='S1')
+                if isinstance(value, dict):
+                    create_struct(struct, field, value)
+                elif isinstance(value, str):  # char row vector
+                    dset = struct.create_dataset(field, data=frombuffer(value.encode('utf-16-le'),
+                                                                        dtype='<u2').reshape(-1, 1))
+                    set_class(dset, 'char')
+                    dset.attrs['MATLAB_int_decode'] = int32(2)
+                else:
+                    set_class(struct.create_dataset(field, data=array([[value]], dtype='i8')), 'int64')
+            struct.attrs.create('MATLAB_fields', field_names, dtype=h5py.vlen_dtype(numpy_dtype('S1')))
+
+        def matlab_data(data):
+            if isinstance(data, MaskedArray):
+                data = _matlab_filled(data)
+            if data.dtype.kind == 'b':
+                data = data.view('u1')
+            elif data.dtype.base.name == 'float16':
+                data = data.astype(float32)
+            elif data.dtype.byteorder not in ('=', '|'):
+                data = data.astype(data.dtype.newbyteorder('='))
+            return data.T  # Matlab is column major
+
+        f = h5py.File(file_name, 'w', userblock_size=512)
+        try:
+            master_channel_list = OrderedDict()
+            datasets = []
+            for master, channels, conversions, group_chunks in self._export_groups(chunk_size=chunk_size):
+                names = [_convert_to_matlab_name(channel) for channel in channels]  # cached
+                group_datasets = None
+                for chunk in group_chunks:
+                    if group_datasets is None:  # creates variables from first chunk
+                        group_datasets = []
+                        for channel, name, channel_data in zip(channels, names, chunk):
+                            matlab_class = _MATLAB_CLASSES.get(channel_data.dtype.str[1:])
+                            if channel_data.dtype.base.name == 'float16':
+                                matlab_class = 'single'
+                            if matlab_class is None or channel_data.dtype.kind in ('S', 'U', 'V'):
+                                group_datasets.append(None)  # does not like special characters chains, skip
+                                continue
+                            if not name or name in f:
+                                warn(u'Could not export {}, name is not compatible with Matlab'.format(channel))
+                                group_datasets.append(None)
+                                continue
+                            shape = channel_data.shape[:0:-1] or (1, )  # n x 1 column vector
+                            dset = f.create_dataset(name, shape=shape + (0, ), maxshape=shape + (None, ),
+                                                    dtype=matlab_data(channel_data[:1]).dtype,
+                                                    chunks=shape + (chunks, ), compression=compression)
+                            set_class(dset, matlab_class)
+                            group_datasets.append(dset)
+                            datasets.append((dset, matlab_class))
+                    for dset, channel_data in zip(group_datasets, chunk):
+                        if dset is not None:
+                            n_records = dset.shape[-1]
+                            dset.resize(n_records + len(channel_data), axis=dset.ndim - 1)
+                            dset[..., n_records:] = matlab_data(channel_data).reshape(dset.shape[:-1] + (-1, ))
+                # adds description and unit if existing
+                fields = OrderedDict()
+                for channel, name, dset in zip(channels, names, group_datasets or []):
+                    if dset is None:
+                        continue
+                    unit = self.get_channel_unit(channel)
+                    desc = self.get_channel_desc(channel)
+                    field = OrderedDict()
+                    if desc:
+                        field['description'] = desc
+                    if unit:
+                        field['unit'] = unit
+                    if master == channel:
+                        field['masterType'] = self.get_channel_master_type(channel) or 0
+                    if field:
+                        fields[name] = field
+                master_name = _convert_to_matlab_name(master) if master else ''
+                master_channel_list[master_name or masterField + str(len(master_channel_list))] = fields
+            for dset, matlab_class in datasets:  # Matlab empty arrays are described by their shape
+                if dset.shape[-1] == 0:
+                    name = dset.name
+                    shape = array(dset.shape, dtype='u8')
+                    del f[name]
+                    dset = f.create_dataset(name, data=shape)
+                    set_class(dset, matlab_class)
+                    dset.attrs['MATLAB_empty'] = uint8(1)
+            create_struct(f, 'masterChannelList', master_channel_list)
+        finally:
+            f.close()
+        header = 'MATLAB 7.3 MAT-file, Platform: {}, Created on: {} HDF5 schema 1.00 .'.format(
+            platform, strftime('%a %b %d %H:%M:%S %Y'))
+        with open(file_name, 'r+b') as fid:
+            fid.write(header.encode('ascii').ljust(116) + bytes(8) + pack('<H', 0x0200) + b'IM')
+
     def export_to_excel(self, file_name=None):
         """Exports mdf data into excel 95 to 2003 file
 
@@ -1297,7 +2459,7 @@ class Mdf(Mdf4, Mdf3):
             warn('Following channels were too long to be processed completely,'
                  ' maybe you should resample : {}'.format(too_long_channels))
 
-    def export_to_xlsx(self, file_name=None):
+    def export_to_xlsx(self, file_name=None, chunk_size=None, max_rows=_XLSX_MAX_ROWS):
         """Exports mdf data into excel 2007 and 2010 file
 
         Parameters
@@ -1305,49 +2467,76 @@ class Mdf(Mdf4, Mdf3):
         file_name : str, optional
             file name. If no name defined, it will use original mdf name and path
 
+        chunk_size : int, optional
+            maximum number of record bytes read at once from file, 100MB by default
+
+        max_rows : int, optional
+            maximum number of rows per sheet, including channel names and units rows
+
         Notes
         --------
-        It is recommended to export resampled data for performances
+        One sheet is written per master channel group, continued in next sheets beyond
+        max_rows. Sheets are streamed (write only workbook) and rows are appended from
+        chunks of columns, read from file if mdf was read with no_data_loading=True.
         Dependency: openpyxl
         """
         try:
             import openpyxl
-            from openpyxl.utils.exceptions import IllegalCharacterError
+            from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
         except ImportError:
             warn('Module openpyxl missing')
             return
         if file_name is None:
             file_name = splitext(self.fileName)[0]
             file_name = file_name + '.xlsx'
-
-        warn('Creating Excel sheet')
-        wb = openpyxl.workbook.Workbook()
-        ws = wb.active  # get_active_sheet()
-
-        n_col = 1
-        for master in self.masterChannelList:
-            channels = self.masterChannelList[master]
-            for channel in channels:
-                data = self.get_channel_data(channel)
-                if data.ndim <= 1:  # not an array channel
-                    ws.cell(row=1, column=n_col).value = channel
-                    ws.cell(row=2, column=n_col).value = self.get_channel_unit(
-                        channel)
-                    try:
-                        if data.ndim <= 1:  # not an array channel
-                            if data.dtype.kind in ('i', 'u') or 'f4' in data.dtype.str:
-                                for r, cell_data in enumerate(data):
-                                    ws.cell(
-                                        row=r + 3, column=n_col).value = float64(cell_data)
-                            elif not data.dtype.kind == 'V':
-                                for r, cell_data in enumerate(data):
-                                    ws.cell(
-                                        row=r + 3, column=n_col).value = cell_data
-                    except IllegalCharacterError:
-                        warn(u'could not export {}'.format(channel))
-                    n_col += 1
-
-        warn('Writing file, please wait')
+        if self.MDFVersionNumber >= 400:
+            encoding = 'utf-8'  # mdf4 encoding is unicode
+        else:
+            encoding = 'latin-1'  # mdf3 encoding is latin-1
+
+        def column_values(data):
+            # python values of a column chunk, converted by numpy in bulk
+            if data.dtype.kind == 'S':
+                data = char.decode(data, encoding, 'replace')
+            elif data.dtype.kind == 'b':
+                data = data.astype('u1')
+            values = data.tolist()  # masked values become None
+            if data.dtype.kind in ('U', 'O'):
+                values = [ILLEGAL_CHARACTERS_RE.sub('', value) if isinstance(value, str) else value
+                          for value in values]
+            return values
+
+        wb = openpyxl.Workbook(write_only=True)
+        sheet_names = set()
+        for master, channels, conversions, group_chunks in self._export_groups(chunk_size=chunk_size):
+            name = ''.join([c for c in str(master or masterField) if c not in '[]:*?/\\'])[:28] or masterField
+            columns = None
+            n_rows = max_rows
+            for chunk in group_chunks:
+                if columns is None:  # not array channels
+                    columns = [position for position, data in enumerate(chunk)
+                               if data.ndim <= 1 and data.dtype.kind != 'V']
+                values = [column_values(chunk[position]) for position in columns]
+                start = 0
+                while start < len(chunk[0]):
+                    if n_rows >= max_rows:  # new sheet with channel names and units
+                        sheet_name = name
+                        n_sheets = 1
+                        while sheet_name in sheet_names:
+                            n_sheets += 1
+                            sheet_name = '{} {}'.format(name, n_sheets)
+                        sheet_names.add(sheet_name)
+                        ws = wb.create_sheet(sheet_name)
+                        ws.append([channels[position] for position in columns])
+                        ws.append([self.get_channel_unit(channels[position]) for position in columns])
+                        n_rows = 2
+                    stop = min(len(chunk[0]), start + max_rows - n_rows)
+                    for row in zip(*[column[start:stop] for column in values]):
+                        ws.append(row)
+                    n_rows += stop - start
+                    start = stop
+        if not sheet_names:
+            wb.create_sheet()
         wb.save(file_name)
 
     def keep_channels(self, channel_set):
@@ -1368,8 +2557,11 @@ class Mdf(Mdf4, Mdf3):
                 # avoid to remove master channels otherwise problems with resample
                 remove_channels.append(channel)
         if not len(remove_channels) == 0:
-            [self.masterChannelList[self.get_channel_master(channel)].remove(
-                channel) for channel in remove_channels]
+            # rebuilds masters lists once instead of list.remove() per channel
+            remove_set = set(remove_channels)
+            for master in self.masterChannelList:
+                self.masterChannelList[master] = [channel for channel in self.masterChannelList[master]
+                                                  if channel not in remove_set]
             [self.pop(channel) for channel in remove_channels]
 
     def concat_mdf(self, mdf_class):
@@ -1612,7 +2804,11 @@ class Mdf(Mdf4, Mdf3):
 
         Notes
         --------
-        One pandas dataframe is converted per data group (one master per data group)
+        One pandas dataframe is converted per data group (one master per data group).
+        Dataframes are built at first access of self[master_channel_name + '_group'],
+        also through get() or in, channels data being released at this moment.
+        Until then, keys() and iteration do not list not yet built dataframes,
+        their names are in masterGroups.
         """
         # convert data structure into pandas module
         try:
@@ -1622,19 +2818,52 @@ class Mdf(Mdf4, Mdf3):
             return
         if sampling is not None:
             self.resample(sampling)
-        for group in self.masterChannelList:
-            self[group + '_group'] = self.return_pandas_dataframe(group)
-            # clean rest of self from data and time channel information
-            [self[channel].pop(dataField)
-             for channel in self.masterChannelList[group]]
-            [self[channel].pop(
-                masterField) for channel in self.masterChannelList[group] if masterField in self[channel]]
-        self.masterGroups = []  # save time groups name in list
-        [self.masterGroups.append(group + '_group')
-         for group in self.masterChannelList]
+        self._pandasGroups = {group + '_group': (group, self.masterChannelList[group])
+                              for group in self.masterChannelList}
+        self.masterGroups = list(self._pandasGroups)  # save time groups name in list
         self.masterChannelList = {}
         self._pandasframe = True
 
+    def __missing__(self, key):
+        """builds pandas dataframe of a data group at first access after convert_to_pandas()
+
+        Parameters
+        ----------------
+        key : str
+            master channel name + '_group'
+
+        Return
+        ---------
+        pandas dataframe of data group
+        """
+        try:
+            master_channel_name, channels = self.__dict__.get('_pandasGroups', {}).pop(key)
+        except KeyError:
+            raise KeyError(key)
+        self[key] = self._pandas_dataframe(master_channel_name, channels)
+        # clean rest of self from data and time channel information
+        for channel in channels:
+            self[channel].pop(dataField, None)
+            self[channel].pop(masterField, None)
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self.__dict__.get('_pandasGroups', ())
+
+    def get(self, key, default=None):
+        """returns channel dict or dataframe of data group after convert_to_pandas(), default if missing
+
+        Parameters
+        ----------------
+        key : str
+            channel name or master channel name + '_group'
+        default : optional
+            returned value if key is missing
+        """
+        if key in self.__dict__.get('_pandasGroups', ()):
+            return self[key]
+        return dict.get(self, key, default)
+
     def return_pandas_dataframe(self, master_channel_name):
         """returns a dataframe of a raster described by its master channel name
 
@@ -1646,6 +2875,12 @@ class Mdf(Mdf4, Mdf3):
         Return
         ---------
         pandas dataframe of raster or data group
+
+        Notes
+        --------
+        Channels of same data type are gathered in 2D blocks wrapped without copy by pandas,
+        columns keeping channels order (no copy from pandas 1.5). Channels with non native
+        byte order and owning their data are byteswapped in place. Text channels are categorical.
         """
         try:
             import pandas as pd
@@ -1653,56 +2888,759 @@ class Mdf(Mdf4, Mdf3):
             warn('Module pandas missing')
             return
         if master_channel_name in self:
-            if master_channel_name not in self.masterChannelList[master_channel_name]:
-                warn('no master channel in group {}'.format(master_channel_name))
-            if master_channel_name in self.masterChannelList[master_channel_name]:
-                if self.get_channel_master_type(master_channel_name) == 1:
-                    # master channel exists and is time type
-                    # convert time channel into timedelta
-                    datetime_info = datetime64(
-                        int(self.fileMetadata['time'] * 1E9), 'ns')
-                    time = datetime_info + array(self.get_channel_data(master_channel_name) * 1E9,
-                                                 dtype='timedelta64[ns]')
-                    temporary_dataframe = pd.DataFrame(index=time)
-                else:  # not time master channel
-                    temporary_dataframe = pd.DataFrame(
-                        index=self.get_channel_data(master_channel_name))
-            else:  # no master channel
-                temporary_dataframe = pd.DataFrame()
-            channel_dict = {key: None for key in self.masterChannelList[master_channel_name]}
-            for key in channel_dict.keys():
-                data = self.get_channel_data(key)
-                if data.dtype.byteorder not in ['=', '|']:
-                    data = data.byteswap().view(data.dtype.newbyteorder())
-                if data.ndim == 1 and data.shape[0] == temporary_dataframe.shape[0] \
-                        and not data.dtype.char == 'V':
-                    channel_dict[key] = data
-            temporary_dataframe = pd.DataFrame(data=channel_dict, index=temporary_dataframe.index)
-            return temporary_dataframe
+            return self._pandas_dataframe(master_channel_name, self.masterChannelList[master_channel_name])
         else:
             warn('Master channel name not in mdf')
             return
 
-    def export_to_parquet(self, file_name=None):
-        """Exports mdf data into parquet file
+    def _pandas_dataframe(self, master_channel_name, channels):
+        """builds a dataframe of channels from a data group
+
+        Parameters
+        ----------------
+        master_channel_name : str
+            master channel name
+        channels : list of str
+            channels of data group
+
+        Return
+        ---------
+        pandas dataframe of data group
+        """
+        import pandas as pd
+        if master_channel_name not in channels:
+            warn('no master channel in group {}'.format(master_channel_name))
+            index = None
+        elif self.get_channel_master_type(master_channel_name) == 1:
+            # master channel exists and is time type
+            # convert time channel into timedelta
+            datetime_info = datetime64(
+                int(self.fileMetadata['time'] * 1E9), 'ns')
+            index = pd.Index(datetime_info + array(self.get_channel_data(master_channel_name) * 1E9,
+                                                   dtype='timedelta64[ns]'))
+        else:  # not time master channel
+            index = pd.Index(self._native_channel_data(master_channel_name))
+        if self.MDFVersionNumber >= 400:
+            encoding = 'utf-8'  # mdf4 encoding is unicode
+        else:
+            encoding = 'latin-1'  # mdf3 encoding is latin-1
+        blocks = OrderedDict()  # dtype: list of (channel, data)
+        others = []  # categorical or masked channels, one column each
+        order = []  # columns in channels order
+        for channel in channels:
+            data = self._native_channel_data(channel)
+            if data is None or data.ndim != 1 or data.dtype.char == 'V' or \
+                    (index is not None and data.shape[0] != len(index)):
+                continue
+            if index is None:
+                index = pd.RangeIndex(data.shape[0])
+            order.append(channel)
+            if data.dtype.kind in ('S', 'U'):
+                uniques, codes = unique(data, return_inverse=True)
+                if data.dtype.kind == 'S':
+                    uniques = [value.decode(encoding, 'replace') for value in uniques.tolist()]
+                others.append((channel, pd.Categorical.from_codes(codes.ravel(), uniques)))
+            elif isinstance(data, MaskedArray):
+                others.append((channel, data))
+            else:
+                blocks.setdefault(data.dtype, []).append((channel, data))
+        if index is None:
+            index = pd.RangeIndex(0)
+        frames = []
+        for dtype, columns in blocks.items():
+            block = empty((len(columns), len(index)), dtype=dtype)
+            for position, (channel, data) in enumerate(columns):
+                block[position] = data
+            # transposed C array is wrapped as pandas block without copy
+            frames.append(pd.DataFrame(block.T, index=index, columns=[channel for channel, data in columns],
+                                       copy=False))
+        if others:
+            frames.append(pd.DataFrame(OrderedDict(others), index=index))
+        if not frames:
+            return pd.DataFrame(index=index)
+        if len(frames) == 1:
+            return frames[0]
+        if (1, 5) <= tuple(int(number) for number in pd.__version__.split('.')[:2]) < (3, 0):
+            # copy on write, default from pandas 3, avoids copying blocks to concatenate and reorder
+            with pd.option_context('mode.copy_on_write', True):
+                return pd.concat(frames, axis=1)[order]
+        return pd.concat(frames, axis=1)[order]
+
+    def _native_channel_data(self, channel):
+        """returns channel data in native byte order
+
+        Parameters
+        ----------------
+        channel : str
+            channel name
+
+        Return
+        ---------
+        numpy array
+
+        Notes
+        --------
+        Data owning its buffer is byteswapped in place and stored back, views of other buffers
+        (records) are copied
+        """
+        data = self.get_channel_data(channel)
+        if data is None or data.dtype.byteorder in ('=', '|'):
+            return data
+        stored = self[channel].get(dataField)
+        if isinstance(stored, ndarray) and (data is stored or data.base is stored) and \
+                stored.dtype == data.dtype and stored.flags.owndata and stored.flags.writeable:
+            stored.byteswap(inplace=True)
+            self.set_channel_data(channel, stored.view(stored.dtype.newbyteorder()))
+            return self.get_channel_data(channel)
+        if data.flags.owndata and data.flags.writeable:  # temporary array
+            data.byteswap(inplace=True)
+            return data.view(data.dtype.newbyteorder())
+        return data.byteswap().view(data.dtype.newbyteorder())
+
+    def to_arrow(self, master_channel_name):
+        """returns a pyarrow table of a raster described by its master channel name
+
+        Parameters
+        ----------------
+        master_channel_name : str
+            master channel name, key to a raster to be returned as pyarrow table
+
+        Return
+        ---------
+        pyarrow Table of data group, with unit and description in fields metadata
+        and master channel name and type in schema metadata
+
+        Notes
+        --------
+        Contiguous numeric channels in native byte order are wrapped without copy,
+        masks become validity bitmaps and channels containing text (text conversions)
+        become dictionary arrays. Other channels are copied once.
+        Dependency: pyarrow
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            warn('pyarrow not installed')
+            return
+        if master_channel_name not in self.masterChannelList:
+            warn('Master channel name not in mdf')
+            return
+        channels = self.masterChannelList[master_channel_name]
+        return self._arrow_batch(pa, master_channel_name, channels,
+                                 [self.get_channel_data(channel) for channel in channels],
+                                 dictionary=True, table=True)
+
+    def _arrow_batch(self, pa, master_channel_name, channels, data, dictionary=True, table=False):
+        """ builds pyarrow record batch or table from channels data
+
+        Parameters
+        ----------------
+        pa : module
+            pyarrow
+        master_channel_name : str
+            master channel name
+        channels : list of str
+            channel names
+        data : list of numpy arrays
+            channels data, 1D channels of same length as first one are kept
+        dictionary : bool
+            text channels as dictionary arrays
+        table : bool
+            returns Table instead of RecordBatch
+
+        Return
+        ---------
+        pyarrow RecordBatch or Table
+        """
+        if self.MDFVersionNumber >= 400:
+            encoding = 'utf-8'  # mdf4 encoding is unicode
+        else:
+            encoding = 'latin-1'  # mdf3 encoding is latin-1
+        fields = []
+        arrays = []
+        length = None
+        for channel, channel_data in zip(channels, data):
+            if channel_data is None or channel_data.ndim != 1 or channel_data.dtype.char == 'V' or \
+                    channel.find('invalid_bytes') != -1 or (length is not None and len(channel_data) != length):
+                continue
+            length = len(channel_data)
+            array = _arrow_array(pa, channel_data, encoding, dictionary)
+            metadata = {}
+            for field, value in ((unitField, self.get_channel_unit(channel)),
+                                 (descriptionField, self.get_channel_desc(channel))):
+                if value:
+                    metadata[field] = value
+            fields.append(pa.field(channel, array.type, metadata=metadata))
+            arrays.append(array)
+        master_type = self.get_channel_master_type(master_channel_name) if master_channel_name in self else None
+        schema = pa.schema(fields, metadata={masterField: master_channel_name or '',
+                                             masterTypeField: str(master_type)})
+        if table:
+            return pa.Table.from_arrays(arrays, schema=schema)
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def export_to_arrow_ipc(self, file_name=None, chunk_size=None, compression=None):
+        """Exports mdf data into Arrow IPC files (Feather version 2), record batch by record batch
+
+        Parameters
+        ----------------
+        file_name : str, optional
+            file name. If no name defined, it will use original mdf name and path with .arrow extension.
+            With several master channel groups, one file per group is written with appended group index
+        chunk_size : int, optional
+            maximum number of record bytes read at once, one record batch per chunk, 100MB by default
+        compression : str, optional
+            'lz4' or 'zstd' buffers compression
+
+        Notes
+        --------
+        With no_data_loading=True, data groups are read chunk by chunk from file.
+        Text channels are written as strings.
+        Dependency: pyarrow
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            warn('pyarrow not installed')
+            return
+        if file_name is None:
+            file_name = splitext(self.fileName)[0]
+            file_name = file_name + '.arrow'
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        groups = self._export_groups(chunk_size=chunk_size)  # groups read lazily, one after the other
+        for index, (master, channels, conversions, chunks) in enumerate(groups):
+            if len(self.masterChannelList) > 1:
+                group_file_name = '{0}_{1}{2}'.format(splitext(file_name)[0], index, splitext(file_name)[1])
+            else:
+                group_file_name = file_name
+            writer = None
+            try:
+                for chunk in chunks:
+                    batch = self._arrow_batch(pa, master, channels, chunk, dictionary=False)
+                    if writer is None:
+                        writer = pa.ipc.new_file(group_file_name, batch.schema, options=options)
+                    writer.write_batch(batch)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+    def export_to_feather(self, file_name=None, chunk_size=None, compression='lz4'):
+        """Exports mdf data into Feather files, record batch by record batch
+
+        Parameters
+        ----------------
+        file_name : str, optional
+            file name. If no name defined, it will use original mdf name and path with .feather extension
+        chunk_size : int, optional
+            maximum number of record bytes read at once, 100MB by default
+        compression : str, optional
+            'lz4' (default), 'zstd' or None
+
+        Notes
+        --------
+        Feather version 2 is Arrow IPC file format, see export_to_arrow_ipc()
+        """
+        if file_name is None:
+            file_name = splitext(self.fileName)[0]
+            file_name = file_name + '.feather'
+        self.export_to_arrow_ipc(file_name, chunk_size, compression)
+
+    def export_to_parquet(self, file_name=None, chunk_size=None, compression='snappy', max_workers=None):
+        """Exports mdf data into parquet files, one row group per read chunk
 
         Parameters
         ----------------
         file_name : str, optional
-            file name. If no name defined, it will use original mdf name and path with .parquet extension
+            file name. If no name defined, it will use original mdf name and path with .parquet extension.
+            With several master channel groups, one file per group is written with appended group index
+        chunk_size : int, optional
+            maximum number of record bytes read at once, one row group per chunk, 100MB by default
+        compression : str, optional
+            'snappy' (default), 'gzip', 'brotli', 'lz4', 'zstd' or None
+        max_workers : int, optional
+            number of master channel groups encoded in parallel threads, one per CPU by default
+
+        Notes
+        --------
+        With no_data_loading=True, data groups are read chunk by chunk from file
+        and at most max_workers master channel groups are written at once, so
+        only max_workers chunks are in memory. Column statistics are written
+        for each row group, text channels are dictionary encoded.
+        Dependency: pyarrow
         """
         try:
-            from fastparquet import write as write_parquet
+            import pyarrow as pa
+            import pyarrow.parquet as pq
         except ImportError:
-            warn('fastparquet not installed')
+            warn('pyarrow not installed')
             return
         if file_name is None:
             file_name = splitext(self.fileName)[0]
             file_name = file_name + '.parquet'
-        for master_channel_name in self.masterChannelList:
-            frame = self.return_pandas_dataframe(master_channel_name)
-            if frame is not None:
-                write_parquet(file_name, frame, compression='GZIP')
+
+        def write_group(index, group):
+            master, channels, conversions, chunks = group
+            if len(self.masterChannelList) > 1:
+                group_file_name = '{0}_{1}{2}'.format(splitext(file_name)[0], index, splitext(file_name)[1])
+            else:
+                group_file_name = file_name
+            writer = None
+            try:
+                for chunk in chunks:
+                    table = self._arrow_batch(pa, master, channels, chunk, dictionary=True, table=True)
+                    if writer is None:
+                        writer = pq.ParquetWriter(group_file_name, table.schema, compression=compression,
+                                                  write_statistics=True)
+                    writer.write_table(table, row_group_size=table.num_rows)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+        if max_workers is None:
+            max_workers = cpu_count() or 1
+        groups = enumerate(self._export_groups(chunk_size=chunk_size))  # groups read lazily
+        if max_workers == 1 or len(self.masterChannelList) < 2:
+            for index, group in groups:
+                write_group(index, group)
+        else:  # pyarrow releases GIL while encoding and compressing
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = set()
+                for index, group in groups:
+                    futures.add(pool.submit(write_group, index, group))
+                    if len(futures) >= max_workers:  # next group read once a group is written
+                        done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                for future in futures:
+                    future.result()
+
+
+def concat_files(file_names, channel_list=None, max_workers=1, **kwargs):
+    """ concatenates data of several mdf files, one after the other
+
+    Parameters
+    ----------------
+    file_names : list of str
+        mdf file names, in concatenation order
+
+    channel_list : list of str, optional
+        list of channel names to be read in each file
+
+    max_workers : int, optional
+        number of files read in parallel threads, 1 by default.
+        Up to max_workers files are kept in memory besides concatenated data.
+
+    **kwargs :
+        other arguments given to Mdf() to read each file (no_data_loading excepted)
+
+    Returns
+    -----------
+    Mdf class instance with concatenated data
+
+    Notes
+    --------
+    Same concatenation as chaining Mdf.concat_mdf() but the number of records of
+    each file is first read from its information blocks and each channel is
+    allocated only once. Time masters are shifted after previous file end plus
+    mean sampling. Channels missing in a file are filled with NaN if float,
+    masked otherwise. Data groups missing in a file having a master of same type
+    get one masked sample which master value is previous end plus file duration.
+    Data are converted, conversions are not kept.
+    """
+    file_names = list(file_names)
+    layout = _concat_layout(file_names, channel_list)
+    out = Mdf()
+    channels = OrderedDict()  # channel name: [master, data, mask, filled]
+    maxima = []  # for each file, master type: last master value
+
+    def read(file_name):
+        yop = Mdf(file_name, channel_list=channel_list, **kwargs)
+        if yop.MDFVersionNumber >= 400:
+            yop.apply_all_invalid_bit()
+        return yop
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = deque()
+        index = 0
+        for file_name in file_names + [None]:
+            if file_name is not None:
+                futures.append(executor.submit(read, file_name))
+            while futures and (file_name is None or len(futures) > max_workers):
+                yop = futures.popleft().result()
+                if index == 0:
+                    out.MDFVersionNumber = yop.MDFVersionNumber
+                    out.fileMetadata = yop.fileMetadata
+                maxima.append(_concat_fill(out, yop, index, layout, channels))
+                index += 1
+                del yop
+
+    # masters values, shifted for time, and masked samples of missing data groups
+    gaps = {}
+    for master, (master_type, length, segments) in layout.items():
+        if master not in channels:
+            continue
+        state = channels[master]
+        data = state[1]
+        gaps[master] = zeros(length, dtype=bool)
+        end = None
+        leading = 0  # duration of files before first data of group
+        for index, segment in enumerate(segments):
+            if segment is None:
+                continue
+            start, n_records, present = segment
+            if present:
+                n_records = int(state[3][start:start + n_records].sum())
+                if not n_records:
+                    continue
+                values = data[start:start + n_records]
+                if end is None:
+                    values[:] = values + leading
+                elif master_type == 1:
+                    sampling = mean(diff(values)) if n_records > 1 else 0
+                    values[:] = values + (end + sampling)
+                end = values[-1]
+            else:
+                gaps[master][start] = True
+                state[3][start] = True
+                if end is None:
+                    data[start] = 0
+                    leading += maxima[index].get(master_type, 0)
+                else:
+                    data[start] = end + maxima[index].get(master_type, 0)
+                    end = data[start]
+
+    for channel, (master, data, mask, filled) in channels.items():
+        if not filled.all():
+            missing = ~filled & ~gaps[master]  # channel missing in file
+            if mask is None and data.dtype.kind in 'fc':
+                data[missing] = nan
+                missing = ~filled & gaps[master]  # sample of missing data group
+            else:
+                missing = ~filled
+            if missing.any():
+                if mask is None:
+                    mask = zeros(data.shape, dtype=bool)
+                mask[missing] = True
+        if mask is not None:
+            data = MaskedArray(data, mask=mask)
+        out.set_channel_data(channel, data)
+    return out
+
+
+def _concat_layout(file_names, channel_list):
+    """ positions of each file records in concatenated data groups
+
+    Parameters
+    ----------------
+    file_names : list of str
+        mdf file names
+    channel_list : list of str
+        list of channel names to be read
+
+    Returns
+    -----------
+    dict, master channel name: (master type, total number of samples, segments)
+    segments being for each file None or (start, number of records, flag if
+    data group present in file or masked sample)
+    """
+    counts = []
+    for file_name in file_names:  # only information blocks are read
+        yop = Mdf(file_name, channel_list=channel_list, no_data_loading=True)
+        file_counts = OrderedDict()
+        for master, group in yop.masterChannelList.items():
+            if master in yop and group:
+                n_records = _channel_group_records(yop, group[0])[2]
+                file_counts[master] = (yop._get_channel_field(group[0], masterTypeField), n_records)
+        counts.append(file_counts)
+    masters = OrderedDict()
+    for file_counts in counts:
+        for master, (master_type, n_records) in file_counts.items():
+            masters.setdefault(master, master_type)
+    layout = OrderedDict()
+    for master, master_type in masters.items():
+        position = 0
+        segments = []
+        for file_counts in counts:
+            if master in file_counts:
+                n_records = file_counts[master][1]
+                segments.append((position, n_records, True))
+                position += n_records
+            elif any(master_type == other_type for other_type, n_records in file_counts.values()):
+                segments.append((position, 1, False))
+                position += 1
+            else:
+                segments.append(None)
+        layout[master] = (master_type, position, segments)
+    return layout
+
+
+def _channel_group_records(yop, channel):
+    """ channel group and number of records of channel from information blocks
+
+    Parameters
+    ----------------
+    yop : Mdf
+        mdf class read with no_data_loading
+    channel : str
+        channel name
+
+    Returns
+    -----------
+    (data_group, channel_group, number_of_records) tuple of int
+    """
+    if yop.MDFVersionNumber >= 400:
+        data_group, channel_group = yop[channel][idField][0][:2]
+        return data_group, channel_group, yop.info['CG'][data_group][channel_group]['cg_cycle_count']
+    data_group, channel_group = yop[channel][idField][:2]
+    return data_group, channel_group, yop.info['CGBlock'][data_group][channel_group]['numberOfRecords']
+
+
+def _concat_fill(out, yop, index, layout, channels):
+    """ copies data of a file in concatenated channels
+
+    Parameters
+    ----------------
+    out : Mdf
+        concatenated mdf class, channels are added when first met
+    yop : Mdf
+        mdf class of file
+    index : int
+        file index
+    layout : dict
+        positions of files in data groups, from _concat_layout()
+    channels : dict
+        channel name: [master, data, mask, filled], filled flagging copied samples
+
+    Returns
+    -----------
+    dict, master type: maximum of last master values in file
+    """
+    maxima = {}
+    for master in yop.masterChannelList:
+        data = yop.get_channel_data(master)
+        if data is not None and len(data) > 0:
+            master_type = yop.get_channel_master_type(master)
+            maxima[master_type] = max(maxima.get(master_type, data[-1]), data[-1])
+    for master, group in yop.masterChannelList.items():
+        if master not in layout or layout[master][2][index] is None:
+            continue
+        start, n_records, present = layout[master][2][index]
+        length = layout[master][1]
+        if master not in out.masterChannelList:
+            out.masterChannelList[master] = []
+        for channel in group:
+            data = yop.get_channel_data(channel)
+            if data is None or (channel in channels and channels[channel][0] != master):
+                continue
+            if channel not in channels:
+                # metadata copied without data and conversion, file data can be released once copied
+                out[channel] = {key: value for key, value in yop[channel].items()
+                                if key not in (dataField, conversionField)}
+                out.masterChannelList[master].append(channel)
+                channels[channel] = [master, empty((length,) + data.shape[1:], dtype=data.dtype),
+                                     None, zeros(length, dtype=bool)]
+            state = channels[channel]
+            if state[1].dtype != result_type(state[1].dtype, data.dtype):
+                state[1] = state[1].astype(result_type(state[1].dtype, data.dtype))
+            n_copied = min(n_records, len(data))
+            state[1][start:start + n_copied] = getdata(data)[:n_copied]
+            if isinstance(data, MaskedArray) and data.mask is not nomask:
+                if state[2] is None:
+                    state[2] = zeros(state[1].shape, dtype=bool)
+                state[2][start:start + n_copied] = getmaskarray(data)[:n_copied]
+            state[3][start:start + n_copied] = True
+    return maxima
+
+
+
+def _arrow_array(pa, data, encoding, dictionary=True):
+    """ converts numpy array into pyarrow array, without copy when possible
+
+    Parameters
+    ----------------
+    pa : module
+        pyarrow
+    data : numpy array
+        1D channel data
+    encoding : str
+        encoding of bytes strings
+    dictionary : bool
+        text as dictionary array, plain strings otherwise
+
+    Returns
+    -----------
+    pyarrow Array
+    """
+    mask = None
+    if isinstance(data, MaskedArray):
+        mask = getmaskarray(data)
+        data = getdata(data)
+        if not mask.any():
+            mask = None
+    if data.dtype.kind == 'O':  # python objects, None being null
+        values = pa.array([value.decode(encoding, 'replace') if isinstance(value, bytes) else value
+                           for value in data.tolist()], mask=mask)
+        if dictionary:
+            return values.dictionary_encode()
+        return values
+    if data.dtype.kind in ('S', 'U'):
+        # text built once per distinct value
+        uniques, indices = unique(data, return_inverse=True)
+        values = pa.array([value.decode(encoding, 'replace') if isinstance(value, bytes) else value
+                           for value in uniques.tolist()])
+        indices = pa.array(indices.astype('int32'), mask=mask)
+        if dictionary:
+            return pa.DictionaryArray.from_arrays(indices, values)
+        return values.take(indices)
+    if data.dtype.byteorder not in ('=', '|'):
+        data = data.byteswap().view(data.dtype.newbyteorder())
+    if not data.flags['C_CONTIGUOUS']:  # record field views
+        data = data.copy()
+    return pa.array(data, mask=mask)
+
+
+def _csv_rows(columns, start, stop, float_format=None):
+    """ formats rows of numeric columns as CSV text
+
+    Parameters
+    ----------------
+    columns : list of numpy arrays
+        1D channels data of same length
+    start : int
+        first row
+    stop : int
+        row after last row
+    float_format : str, optional
+        printf style format of floating point values
+
+    Returns
+    -----------
+    str of rows separated by line feed carriage return, as csv.excel dialect
+    """
+    texts = []
+    for column in columns:  # each column converted once into list of str
+        block = column[start:stop]
+        mask = getmaskarray(block) if isinstance(block, MaskedArray) else None
+        block = getdata(block)
+        if block.dtype.kind == 'b':
+            block = block.view('u1')
+        if float_format is not None and block.dtype.kind == 'f':
+            text = char.mod(float_format, block)
+        else:
+            text = block.astype(str)
+        if mask is not None and mask.any():
+            text[mask] = ''
+        texts.append(text.tolist())
+    return '\r\n'.join(map(','.join, zip(*texts))) + '\r\n'
+
+
+def decimate(master_data, data, n_buckets, method='minmax'):
+    """ reduces channel to about 2 * n_buckets samples for display, keeping peaks
+
+    Parameters
+    ----------------
+    master_data : numpy array or None
+        increasing master channel data, sample indexes if None
+    data : numpy array
+        channel data, same length as master_data
+    n_buckets : int
+        number of buckets, typically plot width in pixels
+    method : str, optional
+        'minmax' keeps minimum and maximum samples of each bucket of same master
+        width, 'lttb' keeps 2 * n_buckets samples with Largest Triangle Three Buckets
+
+    Returns
+    -----------
+    (master_data, data) tuple of numpy arrays, unchanged if channel already short enough
+
+    Notes
+    --------
+    Masked samples are dropped. minmax is vectorized over whole channel: buckets are
+    found with one searchsorted on master channel and extrema with ufuncs reduceat,
+    so envelope of the channel is preserved whatever its length.
+    """
+    if master_data is None:
+        master_data = arange(len(data))
+    if n_buckets < 1 or len(data) <= 2 * n_buckets or data.dtype.kind not in 'biuf':
+        return master_data, data
+    if isinstance(data, MaskedArray):
+        valid = ~getmaskarray(data)
+        master_data = master_data[valid]
+        data = getdata(data)[valid]
+        if len(data) <= 2 * n_buckets:
+            return master_data, data
+    if method == 'lttb':
+        indexes = _lttb_indexes(master_data, data, 2 * n_buckets)
+    elif method == 'minmax':
+        indexes = _min_max_indexes(master_data, data, n_buckets)
+    else:
+        raise ValueError('unknown decimation method {}'.format(method))
+    return master_data[indexes], data[indexes]
+
+
+def _min_max_indexes(master_data, data, n_buckets):
+    """ indexes of first minimum and maximum of each bucket of same master width
+
+    Parameters
+    ----------------
+    master_data : numpy array
+        increasing master channel data
+    data : numpy array
+        channel data
+    n_buckets : int
+        number of buckets
+
+    Returns
+    -----------
+    sorted numpy array of indexes
+    """
+    edges = linspace(master_data[0], master_data[-1], n_buckets + 1)
+    starts = unique(searchsorted(master_data, edges[:-1], side='left'))  # non empty buckets
+    counts = diff(append(starts, len(data)))
+    bucket = repeat(arange(len(starts)), counts)
+    indexes = []
+    for reduce_function in (fmin, fmax):  # fmin and fmax ignore nan
+        extrema = reduce_function.reduceat(data, starts)
+        position = flatnonzero(data == extrema[bucket])
+        # first extremum of each bucket, all nan buckets have none
+        indexes.append(position[unique(bucket[position], return_index=True)[1]])
+    return unique(concatenate(indexes + [[0, len(data) - 1]]).astype(int))
+
+
+def _lttb_indexes(master_data, data, n_out):
+    """ indexes of samples selected by Largest Triangle Three Buckets
+
+    Parameters
+    ----------------
+    master_data : numpy array
+        increasing master channel data
+    data : numpy array
+        channel data
+    n_out : int
+        number of samples to keep, first and last included
+
+    Returns
+    -----------
+    numpy array of indexes
+    """
+    x = master_data.astype(float64)
+    y = data.astype(float64)
+    edges = linspace(1, len(y) - 1, n_out - 1).astype(int)  # n_out - 2 buckets
+    indexes = empty(n_out, dtype=int)
+    indexes[0] = previous = 0
+    indexes[-1] = len(y) - 1
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):  # average of next bucket
+            next_x = x[stop:edges[bucket + 2]].mean()
+            next_y = y[stop:edges[bucket + 2]].mean()
+        else:  # last sample
+            next_x, next_y = x[-1], y[-1]
+        area = absolute((x[previous] - next_x) * (y[start:stop] - y[previous]) -
+                        (x[previous] - x[start:stop]) * (next_y - y[previous]))
+        previous = start + nanargmax(area) if not isnan(area).all() else start
+        indexes[bucket + 1] = previous
+    return indexes
 
 
 if __name__ == "__main__":
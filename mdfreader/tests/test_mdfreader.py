@@ -240,6 +240,48 @@ def test_read(mdf_file):
         mdfreader.Mdf(str(mdf_file), channel_list=all_channels[:2])
 
 
+# ---------------------------------------------------------------------------
+# test_channel_descriptor
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("mdf_file", ALL_MDF4_FILES, ids=lambda p: p.name)
+def test_channel_descriptor(mdf_file):
+    from mdfreader.mdfinfo4 import Info4
+    from mdfreader.mdf4reader import Record
+    info = Info4(str(mdf_file), minimal=1)
+    for dg in info['CG']:
+        for cg in info['CG'][dg]:
+            record = Record(dg, cg)
+            record.load_info(info)
+            for chan in record.values():
+                if chan.type == 4:
+                    continue  # invalid bytes channel
+                assert chan.signalDataType == chan.signal_data_type(info)
+                assert chan.bitCount == chan.bit_count(info)
+                assert chan.bitOffset == chan.bit_offset(info)
+                assert chan.channelType == chan.channel_type(info)
+                assert chan.syncType == chan.channel_sync_type(info)
+                assert chan.posByteBeg == chan.pos_byte_beg(info)
+
+
+# ---------------------------------------------------------------------------
+# test_compact_info
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("mdf_file", ALL_MDF4_FILES, ids=lambda p: p.name)
+def test_compact_info(mdf_file):
+    from mdfreader.mdfinfo4 import Info4
+    info = Info4(str(mdf_file), minimal=1)
+    compact = Info4(str(mdf_file), minimal=1, compact=True)
+    for block in ('CN', 'CC'):
+        for dg in info[block]:
+            for cg in info[block][dg]:
+                assert list(compact[block][dg][cg]) == list(info[block][dg][cg])
+                for cn in info[block][dg][cg]:
+                    assert dict(compact[block][dg][cg][cn]) == dict(info[block][dg][cg][cn])
+    for dg in info['CG']:
+        for cg in info['CG'][dg]:
+            assert dict(compact['CG'][dg][cg]) == dict(info['CG'][dg][cg])
+
+
 # ---------------------------------------------------------------------------
 # test_write
 # ---------------------------------------------------------------------------
@@ -306,6 +348,334 @@ def test_resample(mdf_file):
         yop2.resample(master_channel=masters[0])
 
 
+def test_resample_group_matches_interp():
+    from mdfreader.mdfreader import _MasterInterpolator
+    x = np.array([0., 1., 1., 2.5, 4., 7.])
+    new_x = np.array([-1., 0., 0.5, 1., 2., 4., 6.9, 7., 8.])
+    channels = [np.array([1., 2., 3., np.inf, 5., 6.]),
+                np.array([0., np.nan, 2., 3., 3., 1.]),
+                np.arange(6, dtype=np.float32)]
+    result = _MasterInterpolator(x, new_x).interpolate(channels)
+    for row, y in zip(result, channels):
+        np.testing.assert_array_equal(row, np.interp(new_x, x, y))
+
+
+def test_resample_threads():
+    def build():
+        yop = mdfreader.Mdf()
+        for group in range(4):
+            master = f"t{group}"
+            t = np.linspace(0, 10, 1000 + group)
+            yop.add_channel(master, t, master, master_type=1)
+            for i in range(5):
+                yop.add_channel(f"c{group}_{i}", np.sin(t * i), master, master_type=1)
+        return yop
+    serial, threaded = build(), build()
+    serial.resample(0.05, max_workers=1)
+    threaded.resample(0.05, max_workers=4)
+    assert serial.masterChannelList == threaded.masterChannelList
+    for channel in serial:
+        np.testing.assert_array_equal(serial.get_channel_data(channel),
+                                      threaded.get_channel_data(channel))
+
+
+@pytest.mark.parametrize("interpolation_kind", [None, "previous", "next"])
+def test_resample_to_file(tmp_path, interpolation_kind):
+    yop = mdfreader.Mdf()
+    t = np.cumsum(np.random.default_rng(0).uniform(0.5, 1.5, 2000))
+    yop.add_channel("t", t, "t", master_type=1)
+    yop.add_channel("sine", np.sin(t), "t", master_type=1)
+    yop.add_channel("count", np.arange(2000, dtype=np.int32), "t", master_type=1)
+    source = tmp_path / "source.mf4"
+    yop.write4(str(source))
+    out = tmp_path / "resampled.mf4"
+    # a few records per chunk to check chunk boundaries
+    mdfreader.Mdf(str(source), no_data_loading=True).resample_to_file(
+        str(out), 0.7, interpolation_kind=interpolation_kind, chunk_size=100)
+    expected = mdfreader.Mdf(str(source))
+    expected.resample_group(0.7, "t", interpolation_kind=interpolation_kind)
+    resampled = mdfreader.Mdf(str(out))
+    for channel in ("t", "sine", "count"):
+        np.testing.assert_array_equal(resampled.get_channel_data(channel),
+                                      expected.get_channel_data(channel))
+
+
+def test_resample_to_file_big_endian(tmp_path):
+    yop = mdfreader.Mdf()
+    t = np.arange(100, dtype=">f8")
+    yop.add_channel("t", t, "t", master_type=1)
+    yop.add_channel("count", np.arange(100, dtype=">i2"), "t", master_type=1)
+    out = tmp_path / "resampled.mf4"
+    yop.resample_to_file(str(out), 2.5)
+    resampled = mdfreader.Mdf(str(out))
+    yop.resample_group(2.5, "t")
+    for channel in ("t", "count"):
+        np.testing.assert_array_equal(resampled.get_channel_data(channel), yop.get_channel_data(channel))
+    assert resampled.get_channel_data("count")[1] == 2
+
+
+@pytest.mark.parametrize("begin, end", [(100.0, 500.0), (None, 10.0), (1500.0, None), (5000.0, None)])
+def test_read_cut(tmp_path, begin, end):
+    yop = mdfreader.Mdf()
+    t = np.arange(1000, dtype=np.float64) * 1.5
+    yop.add_channel("t", t, "t", master_type=1)
+    yop.add_channel("count", np.arange(1000, dtype=np.int32), "t", master_type=1)
+    source = tmp_path / "source.mf4"
+    yop.write4(str(source))
+    expected = mdfreader.Mdf(str(source))
+    expected.cut("t", begin, end)
+    cut = mdfreader.Mdf(str(source), cut=("t", begin, end))
+    for channel in ("t", "count"):
+        np.testing.assert_array_equal(cut.get_channel_data(channel),
+                                      expected.get_channel_data(channel))
+    assert len(cut.get_channel_data("t")) == \
+        np.count_nonzero((t >= (begin or 0)) & (t <= (end if end is not None else t[-1])))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_concat_files(tmp_path, max_workers):
+    files = []
+    for index, channels in enumerate((("x", "y"), ("x",), ("x", "y", "n"))):
+        yop = mdfreader.Mdf()
+        t = np.arange(100, dtype=np.float64) * 0.1
+        yop.add_channel("t", t, "t", master_type=1)
+        yop.add_channel("x", np.sin(t) + index, "t", master_type=1)
+        if "y" in channels:
+            yop.add_channel("y", np.cos(t), "t", master_type=1)
+        if "n" in channels:
+            yop.add_channel("n", np.arange(100, dtype=np.int32), "t", master_type=1)
+        files.append(str(tmp_path / "part{}.mf4".format(index)))
+        yop.write4(files[-1])
+    concatenated = mdfreader.concat_files(files, max_workers=max_workers)
+    expected = mdfreader.Mdf(files[0])
+    expected.concat_mdf(mdfreader.Mdf(files[1]))
+    expected.concat_mdf(mdfreader.Mdf(files[2], channel_list=["x", "y"]))
+    for channel in ("t", "x", "y"):
+        np.testing.assert_array_equal(concatenated.get_channel_data(channel),
+                                      expected.get_channel_data(channel))
+    assert np.isnan(concatenated.get_channel_data("y")[100:200]).all()
+    n = concatenated.get_channel_data("n")  # integers are masked
+    assert len(n) == 300
+    assert np.ma.getmaskarray(n)[:200].all()
+    np.testing.assert_array_equal(n[200:], np.arange(100))
+
+
+def test_concat_fill_releases_file_data(tmp_path):
+    import weakref
+    from mdfreader.mdfreader import _concat_fill, _concat_layout
+    yop = mdfreader.Mdf()
+    t = np.arange(100, dtype=np.float64) * 0.1
+    yop.add_channel("t", t, "t", master_type=1)
+    yop.add_channel("x", np.sin(t), "t", master_type=1)
+    file_name = str(tmp_path / "part.mf4")
+    yop.write4(file_name)
+    yop = mdfreader.Mdf(file_name)
+    x = yop["x"]
+    data = weakref.ref(x["data"])
+    out = mdfreader.Mdf()
+    _concat_fill(out, yop, 0, _concat_layout([file_name], None), {})
+    assert "data" in x and out["x"] is not x and "data" not in out["x"]
+    del yop, x
+    gc.collect()
+    assert data() is None
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+def test_decimate(method):
+    from mdfreader.mdfreader import decimate
+    t = np.arange(100000, dtype=np.float64) * 0.001
+    y = np.sin(t)
+    y[54321] = 10.0  # peak to keep
+    y[12345] = -10.0
+    x_decimated, y_decimated = decimate(t, y, 500, method)
+    assert len(y_decimated) <= 1002
+    assert y_decimated.max() == 10.0 and y_decimated.min() == -10.0
+    assert x_decimated[0] == t[0] and x_decimated[-1] == t[-1]
+    assert np.all(np.diff(x_decimated) > 0)
+    np.testing.assert_array_equal(y_decimated, np.interp(x_decimated, t, y))
+    short = np.arange(10)
+    assert decimate(None, short, 500, method)[1] is short
+
+
+@pytest.mark.parametrize("compression", [False, True])
+def test_write4_sample_reduction(tmp_path, compression):
+    from mdfreader.mdfinfo4 import Info4
+    yop = mdfreader.Mdf()
+    t = np.arange(1000, dtype=np.float64) * 0.01
+    yop.add_channel("t", t, "t", master_type=1)
+    yop.add_channel("x", np.sin(t), "t", master_type=1)
+    yop.add_channel("u", np.arange(20, dtype=np.float64), "u", master_type=1)  # too short
+    file_name = str(tmp_path / "reduced.mf4")
+    yop.write4(file_name, compression=compression, sample_reduction=True)
+    written = mdfreader.Mdf(file_name)
+    np.testing.assert_array_equal(written.get_channel_data("x"), np.sin(t))
+    np.testing.assert_array_equal(written.get_channel_data("u"), np.arange(20))
+    info = Info4(file_name)
+    with open(file_name, "rb") as fid:
+        chains = [Info4.read_sr_block(fid, cg["cg_sr_first"])
+                  for dg in info["CG"].values() for cg in dg.values()]
+        assert chains[1] is None
+        levels = chains[0]
+        assert [(sr["sr_interval"], sr["sr_cycle_count"]) for sr in levels.values()] == \
+            [(64.0, 16), (128.0, 8), (256.0, 4), (512.0, 2), (1024.0, 1)]
+        fid.seek(levels[1]["sr_data"])
+        assert fid.read(4) == b"##RD"
+        fid.seek(levels[1]["sr_data"] + 24)
+        reduced = np.frombuffer(fid.read(3 * 16 * 8), dtype=[("t", "<f8"), ("x", "<f8")]).reshape(8, 3)
+    x = np.sin(t[:128])
+    np.testing.assert_allclose(reduced["x"][0], [x.mean(), x.min(), x.max()])
+    assert reduced["t"][-1, 2] == t[-1]
+
+
+@pytest.mark.parametrize("no_data_loading", [False, True])
+def test_read_reduced(tmp_path, no_data_loading):
+    yop = mdfreader.Mdf()
+    t = np.arange(10000, dtype=np.float64) * 0.01
+    yop.add_channel("t", t, "t", master_type=1)
+    yop.add_channel("x", np.sin(t), "t", master_type=1)
+    yop.add_channel("n", np.arange(10000, dtype=np.int32), "t", master_type=1)
+    a = np.arange(20000, dtype=np.int16).reshape(10000, 2)
+    yop.add_channel("a", a, "t", master_type=1)
+    file_name = str(tmp_path / "reduced.mf4")
+    yop.write4(file_name, sample_reduction=True)
+    reduced = mdfreader.Mdf(file_name, no_data_loading=no_data_loading).read_reduced(["x", "n", "a"], 100)
+    master, mean, minimum, maximum = reduced["x"]
+    assert len(master) == 79  # 128 records per interval
+    x = np.sin(t[128:256])
+    np.testing.assert_allclose([master[1], mean[1], minimum[1], maximum[1]],
+                               [t[128:256].mean(), x.mean(), x.min(), x.max()])
+    np.testing.assert_array_equal(reduced["n"][2][:3], [0, 128, 256])
+    np.testing.assert_array_equal(reduced["n"][3][-1], 9999)
+    mean, minimum, maximum = reduced["a"][1:]  # array channel, one column per element
+    assert mean.shape == (79, 2)
+    np.testing.assert_array_equal(mean[1], a[128:256].mean(axis=0))
+    np.testing.assert_array_equal(minimum[1], a[128])
+    np.testing.assert_array_equal(maximum[-1], a[-1])
+
+
+@pytest.mark.parametrize("compression", [False, True])
+def test_mdf4_writer(tmp_path, compression):
+    import shutil
+    dtype = np.dtype([("t", "<f8"), ("speed", "<f4"), ("n", ">i2"), ("a", "<u2", (3,))])
+    file_name = str(tmp_path / "log.mf4")
+    writer = mdfreader.Mdf4Writer(file_name, compression=compression, list_length=2)
+    group = writer.add_group(dtype, master="t", units={"t": "s", "speed": "km/h"})
+    index = writer.add_group(np.dtype([("i", "<u4"), ("y", "<f8")]), master="i", master_type=4)
+    t = np.arange(5000, dtype=np.float64) * 0.01
+    for chunk in range(5):  # 5 data blocks referenced by 3 chained DL blocks
+        part = slice(chunk * 1000, (chunk + 1) * 1000)
+        writer.append(group, {"t": t[part], "speed": np.sin(t[part]).astype("f4"),
+                              "n": np.arange(1000, dtype=">i2"), "a": np.ones((1000, 3), dtype="u2")})
+    writer.append(index, np.rec.fromarrays([np.arange(10.) + 0.5, np.arange(10, dtype="u4")],
+                                           names=["y", "i"]))  # fields mapped by name
+    interrupted = str(tmp_path / "interrupted.mf4")
+    shutil.copy(file_name, interrupted)  # as left by a crash before close()
+    writer.close()
+    with pytest.warns(UserWarning, match="Checking cycle counters"):
+        crashed = mdfreader.Mdf(interrupted)
+    for yop in (mdfreader.Mdf(file_name), crashed):
+        np.testing.assert_array_equal(yop.get_channel_data("t"), t)
+        np.testing.assert_array_equal(yop.get_channel_data("speed"), np.sin(t).astype("f4"))
+        assert yop.get_channel_data("a").shape == (5000, 3)
+        np.testing.assert_array_equal(yop.get_channel_data("y"), np.arange(10.) + 0.5)
+        np.testing.assert_array_equal(yop.get_channel_data("i"), np.arange(10))
+        assert yop.get_channel_unit("speed") == "km/h"
+        assert yop.get_channel_master_type("i") == 4
+    catalog = mdfreader.MdfCatalog(":memory:")
+    catalog.build(file_name, max_workers=1)
+    assert catalog.find("n")[0][6:] == (0.0, 999.0)  # value range written at close
+
+
+def test_unfinalised_file_channel_names(tmp_path):
+    import struct
+    file_name = str(tmp_path / "unfinalised.mf4")
+    yop = mdfreader.Mdf()
+    t = np.arange(100, dtype=np.float64)
+    yop.add_channel("t", t, "t", master_type=1)
+    yop.add_channel("speed", t * 2, "t", master_type=1)
+    yop.write4(file_name)  # version 4.11
+    with open(file_name, "r+b") as fid:
+        fid.seek(60)  # id_unfi_flags, cycle counters not updated
+        fid.write(struct.pack("<H", 1))
+    with pytest.warns(UserWarning, match="Checking cycle counters"):
+        unfinalised = mdfreader.Mdf(file_name)
+    # channel blocks read by file_finalization are not read again and renamed as duplicates
+    assert sorted(unfinalised) == ["speed", "t"]
+    np.testing.assert_array_equal(unfinalised.get_channel_data("speed"), t * 2)
+
+
+def test_unfinalised_file_chained_data_lists(tmp_path):
+    import shutil
+    file_name = str(tmp_path / "log.mf4")
+    writer = mdfreader.Mdf4Writer(file_name, compression=True, list_length=2)
+    group = writer.add_group(np.dtype([("t", "<f8"), ("x", "<i4")]), master="t")
+    for chunk in range(5):  # HL block referencing 3 chained DL blocks
+        writer.append(group, {"t": np.arange(chunk * 100, (chunk + 1) * 100, dtype=np.float64),
+                              "x": np.arange(100, dtype=np.int32)})
+    unfinalised = str(tmp_path / "unfinalised.mf4")
+    shutil.copy(file_name, unfinalised)
+    writer.close()
+    with pytest.warns(UserWarning, match="Checking cycle counters"):
+        yop = mdfreader.Mdf(unfinalised)
+    # data blocks of all DL blocks are counted, not only of the last one
+    np.testing.assert_array_equal(yop.get_channel_data("t"), np.arange(500, dtype=np.float64))
+    np.testing.assert_array_equal(yop.get_channel_data("x"), np.tile(np.arange(100, dtype=np.int32), 5))
+
+
+def test_mdf_dataset(tmp_path):
+    for index in range(3):
+        yop = mdfreader.Mdf()
+        t = np.arange(1000, dtype=np.float64) * 0.01
+        yop.add_channel("t", t, "t", master_type=1)
+        yop.add_channel("speed", t + 100 * index, "t", master_type=1)
+        yop.add_metadata(time=1000.0 + 10 * index)  # files start every 10 s
+        yop.write4(str(tmp_path / "part{}.mf4".format(index)))
+    dataset = mdfreader.MdfDataset(str(tmp_path))
+    assert (tmp_path / ".mdfdataset.json").exists()
+    assert [file_name for file_name, master, offset in dataset.files("speed", 1015, 1025)] == \
+        [str(tmp_path / "part1.mf4"), str(tmp_path / "part2.mf4")]
+    time, speed = dataset.get("speed", 1015, 1025)
+    assert time[0] == 1015 and time[-1] == 1025
+    np.testing.assert_allclose(speed, np.where(time < 1020, time - 1010 + 100, time - 1020 + 200))
+    # index reloaded from json file
+    assert mdfreader.MdfDataset(str(tmp_path)).index == dataset.index
+
+
+def test_mdf_catalog(tmp_path):
+    for index, sampling in enumerate((0.01, 0.1)):
+        yop = mdfreader.Mdf()
+        t = np.arange(1000, dtype=np.float64) * sampling
+        yop.add_channel("t", t, "t", master_type=1)
+        yop.add_channel("speed", t * 2, "t", master_type=1, unit="km/h")
+        yop.write4(str(tmp_path / "part{}.mf4".format(index)))
+    catalog = mdfreader.MdfCatalog(str(tmp_path / "catalog.sqlite"))
+    assert catalog.build(str(tmp_path), max_workers=1) == 2
+    assert catalog.build(str(tmp_path), max_workers=1) == 0  # unchanged files
+    fast = catalog.find("sp*", min_rate=50)
+    assert [(Path(row[0]).name, row[2], row[3]) for row in fast] == [("part0.mf4", "speed", "km/h")]
+    assert fast[0][5] == 1000
+    assert fast[0][6:] == (0.0, 19.98)
+    assert len(catalog.find("speed")) == 2
+    catalog.close()
+
+
+@pytest.mark.parametrize("fast_reader", [True, False])
+def test_mdf_catalog_texts(tmp_path, monkeypatch, fast_reader):
+    from mdfreader import mdfinfo4
+    if not fast_reader:  # pure python reader, without dataRead extension
+        monkeypatch.setattr(mdfinfo4, "_CN_CHAIN_FAST", False)
+    yop = mdfreader.Mdf()
+    t = np.arange(100, dtype=np.float64) * 0.1
+    yop.add_channel("t", t, "t", master_type=1, unit="s")
+    yop.add_channel("speed", t * 2, "t", master_type=1, unit="km/h", description="vehicle speed")
+    yop.write4(str(tmp_path / "part.mf4"))
+    catalog = mdfreader.MdfCatalog(":memory:")
+    catalog.build(str(tmp_path), max_workers=1)
+    rows = catalog.connection.execute("SELECT name, unit, description FROM channels ORDER BY name").fetchall()
+    assert rows == [("speed", "km/h", "vehicle speed"), ("t", "s", "")]
+    catalog.close()
+
+
 # ---------------------------------------------------------------------------
 # test_export_netcdf / hdf5 / matlab
 # ---------------------------------------------------------------------------
@@ -327,6 +697,131 @@ def test_export_hdf5(tmp_path, mdf_file):
     assert out.stat().st_size > 0
 
 
+@pytest.fixture
+def two_group_source(tmp_path):
+    """Return a function writing source.mf4 with master groups "t" (t, x and
+    extra channels given as name: data) and "u", returning its path."""
+    def write(**channels):
+        yop = mdfreader.Mdf()
+        yop.add_channel("t", np.arange(5000, dtype=np.float64) * 0.01, "t", master_type=1, unit="s")
+        yop.add_channel("x", np.arange(5000, dtype=np.int16), "t", master_type=1, unit="V")
+        for name, data in channels.items():
+            yop.add_channel(name, data, "t", master_type=1)
+        yop.add_channel("u", np.arange(10, dtype=np.float64), "u", master_type=1)
+        source = tmp_path / "source.mf4"
+        yop.write4(str(source))
+        return str(source)
+    return write
+
+
+def test_export_hdf5_stream(tmp_path, two_group_source):
+    h5py = pytest.importorskip("h5py")
+    source = two_group_source()
+    for raw in (False, True):
+        out = tmp_path / "out{}.hdf".format(raw)
+        mdfreader.Mdf(source, no_data_loading=True).export_to_hdf5(
+            str(out), chunk_size=1000, chunks=512, compression="gzip", raw=raw)
+        with h5py.File(str(out), "r") as f:
+            group = f["out{}.hdf".format(raw)]
+            np.testing.assert_array_equal(group["t/t"][()], np.arange(5000) * 0.01)
+            assert group["t/x"].chunks == (512, )
+            assert group["t/x"].attrs["unit"] == "V"
+            np.testing.assert_array_equal(group["t/x"][()], np.arange(5000))
+            np.testing.assert_array_equal(group["u/u"][()], np.arange(10))
+    out = tmp_path / "memory.hdf"
+    mdfreader.Mdf(source).export_to_hdf5(str(out), chunks=512)  # in memory data
+    with h5py.File(str(out), "r") as f:
+        group = f["memory.hdf"]
+        assert group["t/x"].chunks == (512, )
+        assert group["u/u"].chunks == (10, )  # bounded by dataset length
+
+
+def _spy_group_reads(monkeypatch, pattern):
+    """Record output files existing at each data group read of streaming exports."""
+    read_group_chunks = mdfreader.Mdf._read_group_chunks
+    written = []
+
+    def spy(self, channels, chunk_size):
+        written.append(sorted(path.name for path in pattern.parent.glob(pattern.name)))
+        return read_group_chunks(self, channels, chunk_size)
+    monkeypatch.setattr(mdfreader.Mdf, "_read_group_chunks", spy)
+    return written
+
+
+def test_arrow(tmp_path, monkeypatch, two_group_source):
+    pa = pytest.importorskip("pyarrow")
+    source = two_group_source(s=np.array([b"a", b"b"] * 2500))
+    table = mdfreader.Mdf(source).to_arrow("t")
+    assert table.num_rows == 5000
+    assert table.schema.field("x").metadata[b"unit"] == b"V"
+    assert pa.types.is_dictionary(table.schema.field("s").type)
+    assert table.column("s").to_pylist()[:3] == ["a", "b", "a"]
+    out = tmp_path / "out.arrow"
+    written = _spy_group_reads(monkeypatch, tmp_path / "out_*.arrow")
+    mdfreader.Mdf(source, no_data_loading=True).export_to_arrow_ipc(str(out), chunk_size=1000)
+    assert written == [[], ["out_0.arrow"]]  # next group read once previous one is written
+    tables = {}
+    for index in range(2):
+        with pa.memory_map(str(tmp_path / "out_{}.arrow".format(index))) as arrow_file:
+            reader = pa.ipc.open_file(arrow_file)
+            tables[reader.schema.metadata[b"master"]] = (reader.num_record_batches, reader.read_all())
+    assert tables[b"t"][0] > 1
+    np.testing.assert_array_equal(tables[b"t"][1].column("x").to_numpy(), np.arange(5000))
+    np.testing.assert_array_equal(tables[b"u"][1].column("u").to_numpy(), np.arange(10))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_export_parquet(tmp_path, monkeypatch, two_group_source, max_workers):
+    pq = pytest.importorskip("pyarrow.parquet")
+    source = two_group_source()
+    written = _spy_group_reads(monkeypatch, tmp_path / "out_*.parquet")
+    mdfreader.Mdf(source, no_data_loading=True).export_to_parquet(
+        str(tmp_path / "out.parquet"), chunk_size=1000, max_workers=max_workers)
+    if max_workers == 1:
+        assert written == [[], ["out_0.parquet"]]  # next group read once previous one is written
+    files = {}
+    for index in range(2):
+        parquet_file = pq.ParquetFile(str(tmp_path / "out_{}.parquet".format(index)))
+        files[parquet_file.schema_arrow.metadata[b"master"]] = parquet_file
+    assert files[b"t"].metadata.num_row_groups > 1
+    statistics = files[b"t"].metadata.row_group(0).column(1).statistics
+    assert statistics.has_min_max and statistics.min == 0
+    np.testing.assert_array_equal(files[b"t"].read().column("x").to_numpy(), np.arange(5000))
+    np.testing.assert_array_equal(files[b"u"].read().column("u").to_numpy(), np.arange(10))
+
+
+def test_export_netcdf4_stream(tmp_path, two_group_source):
+    h5py = pytest.importorskip("h5py")
+    try:
+        import netCDF4  # noqa: F401
+    except ImportError:
+        pytest.importorskip("h5netcdf")
+    source = two_group_source(s=np.array([b"ab", b"b"] * 2500))
+    out = tmp_path / "out.nc"
+    mdfreader.Mdf(source, no_data_loading=True).export_to_NetCDF(
+        str(out), zlib=True, chunks=512, chunk_size=1000)
+    with h5py.File(str(out), "r") as f:
+        np.testing.assert_array_equal(f["t"][()], np.arange(5000) * 0.01)
+        np.testing.assert_array_equal(f["x"][()], np.arange(5000))
+        assert f["x"].chunks == (512, ) and f["x"].compression == "gzip"
+        assert f["x"].maxshape == (None, )
+        assert [value.decode() for value in f["s"][:3]] == ["ab", "b", "ab"]
+        np.testing.assert_array_equal(f["u"][()], np.arange(10))
+
+
+def test_export_xlsx_sheets(tmp_path, two_group_source):
+    openpyxl = pytest.importorskip("openpyxl")
+    source = two_group_source(s=np.array([b"ab", b"b"] * 2500))
+    out = tmp_path / "out.xlsx"
+    mdfreader.Mdf(source, no_data_loading=True).export_to_xlsx(str(out), chunk_size=1000, max_rows=2002)
+    wb = openpyxl.load_workbook(str(out), read_only=True)
+    assert wb.sheetnames == ["t", "t 2", "t 3", "u"]
+    rows = list(wb["t 2"].iter_rows(values_only=True))
+    assert rows[0] == ("t", "x", "s") and rows[1][1] == "V"
+    assert len(rows) == 2002 and rows[2][1:] == (2000, "ab")
+    assert list(wb["u"].iter_rows(values_only=True))[-1] == (9, )
+
+
 @pytest.mark.parametrize("mdf_file", NETCDF_FILES, ids=lambda p: p.name)
 def test_export_matlab(tmp_path, mdf_file):
     yop = mdfreader.Mdf(str(mdf_file))
@@ -336,6 +831,35 @@ def test_export_matlab(tmp_path, mdf_file):
     assert out.stat().st_size > 0
 
 
+def test_export_matlab73_stream(tmp_path, two_group_source):
+    h5py = pytest.importorskip("h5py")
+    source = two_group_source(**{"x.y": np.arange(5000, dtype=np.int16)})
+    out = tmp_path / "out.mat"
+    mdfreader.Mdf(source, no_data_loading=True).export_to_matlab(str(out), chunk_size=1000, chunks=512)
+    assert out.read_bytes()[:19] == b"MATLAB 7.3 MAT-file"
+    with h5py.File(str(out), "r") as f:
+        assert f["xpy"].shape == (1, 5000) and f["xpy"].chunks == (1, 512)
+        assert f["xpy"].attrs["MATLAB_class"] == b"int16"
+        np.testing.assert_array_equal(f["xpy"][0], np.arange(5000))
+        np.testing.assert_array_equal(f["u"][0], np.arange(10))
+        unit = f["masterChannelList/t/x/unit"][()].ravel()
+        assert unit.tobytes().decode("utf-16-le") == "V"
+
+
+def test_export_matlab73_masked(tmp_path):
+    h5py = pytest.importorskip("h5py")
+    yop = mdfreader.Mdf()
+    mask = [False, True, False, True]
+    yop.add_channel("t", np.arange(4, dtype=np.float64), "t", master_type=1)
+    yop.add_channel("x", np.ma.masked_array(np.arange(4, dtype=np.float64), mask=mask), "t", master_type=1)
+    yop.add_channel("n", np.ma.masked_array(np.arange(4, dtype=np.int16), mask=mask), "t", master_type=1)
+    out = tmp_path / "out.mat"
+    yop.export_to_matlab(str(out))
+    with h5py.File(str(out), "r") as f:
+        np.testing.assert_array_equal(f["x"][0], [0, np.nan, 2, np.nan])
+        np.testing.assert_array_equal(f["n"][0], [0, 32767, 2, 32767])  # no missing value for integers
+
+
 @pytest.mark.parametrize("mdf_file", CSV_FILES, ids=lambda p: p.name)
 def test_export_csv(tmp_path, mdf_file):
     yop = mdfreader.Mdf(str(mdf_file))
@@ -345,6 +869,26 @@ def test_export_csv(tmp_path, mdf_file):
     assert out.stat().st_size > 0
 
 
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_export_csv_chunks(tmp_path, max_workers):
+    yop = mdfreader.Mdf()
+    t = np.arange(1000, dtype=np.float64) * 0.1
+    yop.add_channel("t", t, "t", master_type=1, unit="s")
+    yop.add_channel("x", np.sin(t), "t", master_type=1)
+    yop.add_channel("n", np.ma.masked_array(np.arange(1000), mask=np.arange(1000) % 2 == 0), "t", master_type=1)
+    yop.add_channel("u", np.arange(10, dtype=np.float64), "u", master_type=1)
+    out = tmp_path / "out.csv"
+    yop.export_to_csv(str(out), resample=False, chunk_size=128, max_workers=max_workers)
+    lines = (tmp_path / "out_0.csv").read_text().splitlines()
+    assert lines[:2] == ["t,x,n", "s,,"]
+    assert lines[2:4] == ["0.0,0.0,", "0.1,{!r},1".format(float(np.sin(0.1)))]
+    table = np.genfromtxt(str(tmp_path / "out_0.csv"), delimiter=",", skip_header=2)
+    np.testing.assert_array_equal(table[:, 1], np.sin(t))
+    assert np.isnan(table[::2, 2]).all()
+    yop.export_to_csv(str(out), resample=False, float_format="%.2f")
+    assert (tmp_path / "out_1.csv").read_text().splitlines()[3] == "1.00"
+
+
 @pytest.mark.parametrize("mdf_file", EXCEL_FILES, ids=lambda p: p.name)
 def test_export_excel(tmp_path, mdf_file):
     yop = mdfreader.Mdf(str(mdf_file))
@@ -370,6 +914,32 @@ def test_pandas_dataframe(mdf_file):
         assert df.shape[1] > 0, f"{mdf_file.name}: pandas DataFrame has no columns"
 
 
+def test_pandas_dataframe_blocks():
+    pd = pytest.importorskip("pandas")
+    yop = mdfreader.Mdf()
+    yop.add_channel("t", np.arange(5, dtype=np.float64), "t", master_type=1, unit="s")
+    yop.add_channel("x", np.arange(5, dtype=">i4"), "t", master_type=1)
+    yop.add_channel("y", np.arange(5, dtype=np.float64) * 2, "t", master_type=1)
+    yop.add_channel("s", np.array([b"a", b"b", b"a", b"c", b"a"]), "t", master_type=1)
+    yop.add_channel("n", np.arange(3, dtype=np.float64), "n", master_type=1)
+    df = yop.return_pandas_dataframe("t")
+    assert list(df.columns) == ["t", "x", "y", "s"]  # channels order
+    assert df["x"].dtype == np.int32
+    np.testing.assert_array_equal(df["x"].to_numpy(), np.arange(5))
+    assert yop.get_channel_data("x").dtype.isnative  # byteswapped in place
+    assert isinstance(df["s"].dtype, pd.CategoricalDtype)
+    assert list(df["s"]) == ["a", "b", "a", "c", "a"]
+    yop.convert_to_pandas()
+    assert yop.masterGroups == ["t_group", "n_group"]
+    assert "n_group" in yop and "data" in yop["n"]  # built at first access
+    np.testing.assert_array_equal(yop["n_group"]["n"].to_numpy(), np.arange(3))
+    assert "n_group" in yop and "data" not in yop["n"]
+    assert "t_group" in yop  # not built by membership test
+    assert isinstance(yop.get("t_group"), pd.DataFrame)
+    assert "data" not in yop["x"]
+    assert yop.get("missing_group") is None
+
+
 # ---------------------------------------------------------------------------
 # test_merge / test_copy
 # ---------------------------------------------------------------------------
@@ -397,6 +967,25 @@ def test_copy(mdf_file):
     assert set(yop_copy.keys()) == set(yop.keys())
 
 
+# ---------------------------------------------------------------------------
+# test_compact_metadata
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("mdf_file", ALL_FILES, ids=lambda p: p.name)
+def test_compact_metadata(mdf_file):
+    if mdf_file.name in _CUSTOM_COMPRESSION_SKIP:
+        pytest.skip("proprietary custom compression (dz_zip_type=254)")
+    yop = mdfreader.Mdf(str(mdf_file))
+    compact = mdfreader.Mdf(str(mdf_file), compact_metadata=True)
+    assert set(compact.keys()) == set(yop.keys())
+    assert compact.masterChannelList == yop.masterChannelList
+    for channel in yop:
+        assert compact.get_channel_unit(channel) == yop.get_channel_unit(channel)
+        assert compact.get_channel_desc(channel) == yop.get_channel_desc(channel)
+        assert compact.get_channel_master(channel) == yop.get_channel_master(channel)
+        np.testing.assert_array_equal(compact.get_channel_data(channel),
+                                      yop.get_channel_data(channel))
+
+
 # ---------------------------------------------------------------------------
 # test_integrity_check
 # ---------------------------------------------------------------------------